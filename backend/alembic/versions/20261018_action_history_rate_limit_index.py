@@ -0,0 +1,31 @@
+"""add composite rate-limit index to action_history
+
+Revision ID: 20261018_action_history_rate_limit_index
+Revises: bb84bcfc709a
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_action_history_rate_limit_index'
+down_revision: Union[str, None] = 'bb84bcfc709a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index (target_resource, action_template, executed_at) for rate-limit counts."""
+    op.create_index(
+        'ix_action_history_target_action_time',
+        'action_history',
+        ['target_resource', 'action_template', 'executed_at'],
+    )
+
+
+def downgrade() -> None:
+    """Drop the rate-limit index."""
+    op.drop_index('ix_action_history_target_action_time', table_name='action_history')
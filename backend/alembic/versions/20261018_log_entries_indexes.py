@@ -0,0 +1,64 @@
+"""index log_entries retention and drop the redundant resource_ref index
+
+Revision ID: 20261018_log_entries_indexes
+Revises: 20261018_action_history_rate_limit_index
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_log_entries_indexes'
+down_revision: Union[str, None] = '20261018_action_history_rate_limit_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index retention_date; leave resource_ref lookups to (resource_ref, timestamp).
+
+    log_entries is large and written continuously, so indexes are built and
+    dropped CONCURRENTLY, outside the migration transaction.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_log_entries_resource_time',
+            'log_entries',
+            ['resource_ref', 'timestamp'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_log_entries_retention_date',
+            'log_entries',
+            ['retention_date'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_log_entries_resource_ref',
+            table_name='log_entries',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the single-column resource_ref index and drop the retention index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_log_entries_resource_ref',
+            'log_entries',
+            ['resource_ref'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_log_entries_retention_date',
+            table_name='log_entries',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -30,7 +30,7 @@ async def health_check(db: AsyncSession = Depends(get_db)):
     qdrant_ok = False
     qdrant_info = {}
     try:
-        qdrant_info = rag_indexer.get_collection_info()
+        qdrant_info = await rag_indexer.get_collection_info()
         if qdrant_info.get("error"):
             qdrant_status = f"error: {qdrant_info['error']}"
         else:
@@ -77,7 +77,7 @@ async def readiness_check(db: AsyncSession = Depends(get_db)):
         db_status = f"error: {str(e)}"
     qdrant_status = "unknown"
     try:
-        qdrant_info = rag_indexer.get_collection_info()
+        qdrant_info = await rag_indexer.get_collection_info()
         qdrant_status = "connected" if not qdrant_info.get("error") else f"error: {qdrant_info['error']}"
     except Exception as e:
         qdrant_status = f"error: {str(e)}"
@@ -28,8 +28,7 @@ class SummarizeRequest(BaseModel):
 async def search_rag(request: SearchRequest):
     """Search vector store for similar content."""
     try:
-        narratives = await rag_indexer.search_narratives(request.query, limit=request.limit)
-        summaries = await rag_indexer.search_summaries(request.query, limit=request.limit)
+        narratives, summaries = await rag_indexer.search_both(request.query, limit=request.limit)
         return {
             "query": request.query,
             "results": {
@@ -102,13 +101,17 @@ async def check_health():
 @router.get("/collections")
 async def get_collection_info():
     """Get information about Qdrant collections including vector sizes."""
-    info = rag_indexer.get_collection_info()
+    info = await rag_indexer.get_collection_info()
     settings = llm_manager.get_settings()
     return {
         **info,
         "target_dimension": llm_manager.get_embedding_dimension(),
         "dimension_locked": settings["embedding_locked"],
         "embedding_blocked": settings.get("embedding_blocked", False),
+        "embedding_cache": {
+            **rag_indexer.embedding_cache.stats(),
+            "near_duplicate": rag_indexer.near_duplicates.stats(),
+        },
     }
 
 
@@ -128,11 +131,11 @@ async def recreate_collections(request: RecreateCollectionsRequest):
         return {
             "success": False,
             "error": "Must set confirm=true to proceed. This will DELETE all indexed data.",
-            "current_info": rag_indexer.get_collection_info(),
+            "current_info": await rag_indexer.get_collection_info(),
         }
 
     # Audit log: capture state before destruction
-    old_info = rag_indexer.get_collection_info()
+    old_info = await rag_indexer.get_collection_info()
     old_dim = llm_manager.get_embedding_dimension()
 
     # Use current LLM embedding dimension if not specified
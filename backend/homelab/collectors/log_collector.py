@@ -1,6 +1,8 @@
 """LogEntry Collector - ingests logs with retention metadata."""
 
+import re
 from datetime import datetime, timedelta
+from itertools import chain
 from pathlib import Path
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete
@@ -12,6 +14,31 @@ from homelab.adapters import docker_adapter
 # LogEntry retention: 90 days
 LOG_RETENTION_DAYS = 90
 
+# Error keywords in reporting priority: a line mentioning several counts
+# toward the first one listed
+ERROR_KEYWORDS = ("error", "exception", "failed", "fatal", "panic", "crash")
+# ASCII-only case folding: plain IGNORECASE also matches letters such as
+# 'ſ', 'ı' or 'İ' against ASCII ones, which lower() does not map back
+_KEYWORD_RE = re.compile("|".join(ERROR_KEYWORDS), re.IGNORECASE | re.ASCII)
+_KEYWORD_PRIORITY = {keyword: i for i, keyword in enumerate(ERROR_KEYWORDS)}.__getitem__
+
+
+def match_error_keyword(content: str) -> str | None:
+    """Return the highest-priority error keyword in content, if any.
+
+    Case-insensitive regex scan, so the line is never lowered (copied). Lines
+    with no keyword, or whose first one is the top-priority keyword, need a
+    single search; only the rest scan the remainder for other keywords.
+    """
+    match = _KEYWORD_RE.search(content)
+    if match is None:
+        return None
+    first = match.group().lower()
+    if first == ERROR_KEYWORDS[0]:
+        return first
+    rest = (m.lower() for m in _KEYWORD_RE.findall(content, match.end()))
+    return min(chain((first,), rest), key=_KEYWORD_PRIORITY)
+
 
 class LogEntryCollector:
     """Collects and stores container logs with retention tracking."""
@@ -162,7 +189,6 @@ class LogEntryCollector:
         logs = await self.get_logs(db, resource_ref, limit=500, since_hours=hours)
         
         error_patterns = []
-        error_keywords = ["error", "exception", "failed", "fatal", "panic", "crash"]
 
         since = datetime.utcnow() - timedelta(hours=hours)
         existing_facts = await db.execute(
@@ -178,32 +204,31 @@ class LogEntryCollector:
         }
         
         for log in logs:
-            content_lower = log.content.lower()
-            for keyword in error_keywords:
-                if keyword in content_lower:
-                    error_patterns.append({
-                        "log_id": log.id,
-                        "timestamp": log.timestamp.isoformat(),
-                        "content": log.content[:200],  # Truncate for safety
-                        "keyword": keyword,
-                        "source": log.log_source,
-                    })
-                    if log.id not in known_log_ids:
-                        db.add(
-                            Fact(
-                                resource_ref=resource_ref,
-                                fact_type="log_error_signature",
-                                value={
-                                    "log_id": log.id,
-                                    "keyword": keyword,
-                                    "source": log.log_source,
-                                    "content": log.content[:200],
-                                },
-                                source="logs",
-                                timestamp=log.timestamp,
-                            )
-                        )
-                    break  # Only match first keyword per log
+            keyword = match_error_keyword(log.content)
+            if keyword is None:
+                continue
+            error_patterns.append({
+                "log_id": log.id,
+                "timestamp": log.timestamp.isoformat(),
+                "content": log.content[:200],  # Truncate for safety
+                "keyword": keyword,
+                "source": log.log_source,
+            })
+            if log.id not in known_log_ids:
+                db.add(
+                    Fact(
+                        resource_ref=resource_ref,
+                        fact_type="log_error_signature",
+                        value={
+                            "log_id": log.id,
+                            "keyword": keyword,
+                            "source": log.log_source,
+                            "content": log.content[:200],
+                        },
+                        source="logs",
+                        timestamp=log.timestamp,
+                    )
+                )
         
         return error_patterns
 
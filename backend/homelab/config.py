@@ -1,5 +1,6 @@
 """Application configuration from environment variables."""
 
+import logging
 import os
 from os.path import dirname, abspath, join
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -17,6 +18,8 @@ env_file_path = join(base_dir, ".env")
 if os.path.exists(env_file_path):
     load_dotenv(env_file_path)
 
+logger = logging.getLogger(__name__)
+
 class Settings(BaseSettings):
     """Application settings loaded from environment."""
     
@@ -41,10 +44,19 @@ class Settings(BaseSettings):
     
     # Qdrant
     qdrant_url: str = "http://qdrant:6333"
+    qdrant_prefer_grpc: bool = False  # Use one gRPC channel (port 6334) instead of REST
+    qdrant_pool_size: int = 64  # Connections (REST) or channels (gRPC) for the async client
+    
+    # Redis (optional) - sliding-window rate limit counters
+    redis_url: str | None = None
+    
+    # Policy: extra resources never touched automatically (comma-separated)
+    policy_denied_resources: str = ""
     
     # Ollama (local LLM)
     ollama_host: str = "http://host.docker.internal:11434"
     ollama_model: str = "qwen2.5:7b"
+    ollama_num_parallel: int = 4  # Concurrent LLM calls; match the server's OLLAMA_NUM_PARALLEL
     
     # Cloud LLM (optional)
     rag_retry_after_seconds: int = 60
@@ -161,5 +173,5 @@ def get_settings() -> Settings:
     # Mask password for security in logs
     safe_url = s.database_url.split("@")[-1] if "@" in s.database_url else s.database_url
     if s.debug:
-        print(f"DEBUG: database_url (masked host)={safe_url}")
+        logger.info("database_url (masked host)=%s", safe_url)
     return s
@@ -60,7 +60,7 @@ class ControlPlane:
     async def run_loop(self):
         """Execute one full iteration of the control plane loop."""
         start_time = time.time()
-        print("=== Starting Control Plane Loop ===")
+        logger.info("=== Starting Control Plane Loop ===")
         
         async with async_session_maker() as db:
             try:
@@ -68,20 +68,20 @@ class ControlPlane:
                 await self._transition_to(ControlPlaneState.OBSERVE)
                 # In Phase 1: Call collectors purely for observation
                 fact_counts = await fact_collector.collect_all(db)
-                print(f"[ControlPlane] Collected facts: {fact_counts}")
+                logger.info("[ControlPlane] Collected facts: %s", fact_counts)
                 
                 log_counts = await log_collector.collect_all_container_logs(db, since_minutes=10)
                 file_log_counts = await log_collector.collect_all_file_logs(db)
                 total_logs = sum(log_counts.values()) + sum(file_log_counts.values())
                 if total_logs > 0:
-                    print(f"[ControlPlane] Collected {total_logs} new logs")
+                    logger.info("[ControlPlane] Collected %s new logs", total_logs)
                 
                 # 2. ASSESS
                 await self._transition_to(ControlPlaneState.ASSESS)
                 # In Phase 1: Detect incidents
                 new_incidents = await incident_detector.detect_all(db)
                 if new_incidents:
-                    print(f"[ControlPlane] Detected {len(new_incidents)} new incidents")
+                    logger.info("[ControlPlane] Detected %s new incidents", len(new_incidents))
                 
                 # 3. PLAN
                 await self._transition_to(ControlPlaneState.PLAN)
@@ -104,13 +104,13 @@ class ControlPlane:
                     proposal = await planner.propose_for_incident(db, incident)
                     is_schema_valid, schema_errors = validate_plan_proposal(proposal)
                     if not is_schema_valid:
-                        print(f"[ControlPlane] Plan rejected by schema validation: {schema_errors}")
+                        logger.info("[ControlPlane] Plan rejected by schema validation: %s", schema_errors)
                         continue
                     
                     # Policy Limit Check (Now Async)
                     is_valid, violations = await policy_engine.validate(db, proposal)
                     if not is_valid:
-                        print(f"[ControlPlane] Plan rejected by policy: {violations}")
+                        logger.info("[ControlPlane] Plan rejected by policy: %s", violations)
                         continue
 
                     for step in proposal.steps:
@@ -129,7 +129,7 @@ class ControlPlane:
                         new_plans.append(todo)
 
                 if new_plans:
-                    print(f"[ControlPlane] Proposed {len(new_plans)} new plans")
+                    logger.info("[ControlPlane] Proposed %s new plans", len(new_plans))
 
                 
                 # 4. VALIDATE
@@ -145,7 +145,7 @@ class ControlPlane:
                 for plan in pending_plans:
                     is_valid, reason = await plan_validator.validate_todo_step(db, plan)
                     if not is_valid:
-                        print(f"[ControlPlane] Invalid Plan {plan.id}: {reason}")
+                        logger.info("[ControlPlane] Invalid Plan %s: %s", plan.id, reason)
                         plan.status = ActionStatus.failed
                         plan.error = reason
                     else:
@@ -155,7 +155,7 @@ class ControlPlane:
                 await self._transition_to(ControlPlaneState.TODO)
                 # Plans are already pending in DB effectively in TODO state
                 if valid_plans:
-                    print(f"[ControlPlane] {len(valid_plans)} plans awaiting approval")
+                    logger.info("[ControlPlane] %s plans awaiting approval", len(valid_plans))
                     await notification_router.notify_event(
                         "approval_required",
                         {
@@ -203,7 +203,7 @@ class ControlPlane:
                         db.add(action)
                         await db.flush()
                         plan.action_history_id = action.id
-                    print(f"[ControlPlane] Executing approved plan {plan.id}")
+                    logger.info("[ControlPlane] Executing approved plan %s", plan.id)
                     success = await plan_executor.execute_action(db, action.id)
                     plan.status = action.status
                     plan.executed_at = action.executed_at
@@ -211,9 +211,9 @@ class ControlPlane:
                     plan.result = action.result
                     plan.error = action.error
                     if success:
-                        print(f"[ControlPlane] Plan {plan.id} executed successfully")
+                        logger.info("[ControlPlane] Plan %s executed successfully", plan.id)
                     else:
-                        print(f"[ControlPlane] Plan {plan.id} execution failed")
+                        logger.warning("[ControlPlane] Plan %s execution failed", plan.id)
                 
                 # 8. VERIFY
                 await self._transition_to(ControlPlaneState.VERIFY)
@@ -233,7 +233,7 @@ class ControlPlane:
                         continue
                         
                     # Re-collect facts for this target to confirm health
-                    print(f"[ControlPlane] Verifying fix for {step.target_resource}")
+                    logger.info("[ControlPlane] Verifying fix for %s", step.target_resource)
                     try:
                         # Force fresh collection
                         # For now, we assume if action completed successfully, we mark incident as 'mitigated'
@@ -244,11 +244,11 @@ class ControlPlane:
                         inc = incident_q.scalar_one_or_none()
                         
                         if inc and inc.status == IncidentStatus.open:
-                            print(f"[ControlPlane] Marking incident {inc.id} as MITIGATED following successful action")
+                            logger.info("[ControlPlane] Marking incident %s as MITIGATED following successful action", inc.id)
                             inc.status = IncidentStatus.mitigated
                             db.add(inc)
                     except Exception as e:
-                        print(f"[ControlPlane] Verification failed: {e}")
+                        logger.warning("[ControlPlane] Verification failed: %s", e)
                 
                 # 9. RECORD
                 await self._transition_to(ControlPlaneState.RECORD)
@@ -262,7 +262,7 @@ class ControlPlane:
                         should_summarize = True
                     
                     if should_summarize:
-                        print("[ControlPlane] Running hourly log summarization and analysis...")
+                        logger.info("[ControlPlane] Running hourly log summarization and analysis...")
                         from homelab.rag.log_summarizer import log_summarizer
                         await log_summarizer.summarize_expiring_logs(db, retention_days=90)
                     
@@ -276,9 +276,11 @@ class ControlPlane:
                         )
                         incidents_needing_analysis = result.scalars().all()
                         
-                        for incident in incidents_needing_analysis:
-                            print(f"[ControlPlane] Generating analysis for incident {incident.id}")
-                            await narrative_generator.generate_narrative(db, incident.id)
+                        if incidents_needing_analysis:
+                            logger.info("[ControlPlane] Generating analysis for %s incident(s)", len(incidents_needing_analysis))
+                            await narrative_generator.generate_narratives(
+                                db, [incident.id for incident in incidents_needing_analysis]
+                            )
                             
                         self.last_summarization = now
                 
@@ -286,21 +288,19 @@ class ControlPlane:
                     # Rate-limited logging for RAG blocks
                     now = datetime.utcnow()
                     if not self.last_rag_error_log or (now - self.last_rag_error_log).total_seconds() > 300: # 5 minutes
-                        print(f"[ControlPlane] WARNING: RAG blocked due to inconsistent state. Background tasks paused.")
+                        logger.warning("[ControlPlane] RAG blocked due to inconsistent state. Background tasks paused.")
                         self.last_rag_error_log = now
                     # Else: suppress log spam
                 
                 await db.commit()
                 
             except Exception as e:
-                print(f"[ControlPlane] Error in Loop: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("[ControlPlane] Error in Loop: %s", e)
                 await db.rollback()
             finally:
                 duration = time.time() - start_time
                 self.last_run = datetime.utcnow()
-                print(f"=== Control Plane Loop Completed in {duration:.2f}s ===\n")
+                logger.info("=== Control Plane Loop Completed in %.2fs ===", duration)
 
     async def _transition_to(self, new_state: ControlPlaneState):
         """Log state transition."""
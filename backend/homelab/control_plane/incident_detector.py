@@ -1,5 +1,6 @@
 """Incident Detector - detects issues from facts and logs."""
 
+import logging
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -16,6 +17,7 @@ from homelab.storage.models import (
 from homelab.collectors import log_collector
 from homelab.notifications.router import notification_router
 
+logger = logging.getLogger(__name__)
 
 # Detection thresholds
 RESTART_LOOP_THRESHOLD = 3  # Restarts to trigger incident
@@ -294,7 +296,7 @@ class IncidentDetector:
         )
         db.add(narrative)
         
-        print(f"[IncidentDetector] Created incident {incident.id}: {summary}")
+        logger.info("[IncidentDetector] Created incident %s: %s", incident.id, summary)
         
         # Trigger notification
         import asyncio
@@ -13,6 +13,7 @@ from homelab.config import get_settings
 from homelab.storage.models import ActionHistory, ActionTemplate, ActionStatus
 from homelab.adapters.proxmox_adapter import proxmox_adapter
 from homelab.execution_plugins import PluginAction, execution_registry
+from homelab.policy.rate_limiter import action_rate_limiter
 from homelab.workers.service import enqueue_worker_task
 
 logger = logging.getLogger(__name__)
@@ -47,6 +48,7 @@ class PlanExecutor:
         action.status = ActionStatus.executing
         action.executed_at = datetime.now(timezone.utc)
         await db.commit()
+        await action_rate_limiter.record(action.target_resource, action.action_template)
 
         success = False
         error = None
@@ -99,6 +101,7 @@ class PlanExecutor:
         )
         action.result = {"queued_task_id": task.id, "delegated": True}
         await db.commit()
+        await action_rate_limiter.record(action.target_resource, action.action_template)
         return True
 
     async def _dispatch_action(self, action: ActionHistory) -> tuple[bool, dict | None, str | None]:
@@ -1,5 +1,7 @@
 """Plan Generator - Proposes actions based on incidents."""
 
+import logging
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -11,6 +13,8 @@ from homelab.storage.models import (
     ActionStatus,
 )
 
+logger = logging.getLogger(__name__)
+
 class PlanGenerator:
     """Generates remediation plans using heuristics (MVP) or LLM (Future)."""
     
@@ -72,7 +76,7 @@ class PlanGenerator:
         # 4. Save Proposals
         for action in proposed_actions:
             db.add(action)
-            print(f"[PlanGenerator] Proposed action {action.action_template} for {action.target_resource}")
+            logger.info("[PlanGenerator] Proposed action %s for %s", action.action_template, action.target_resource)
             
         return proposed_actions
 
@@ -8,6 +8,11 @@ from sqlalchemy import select
 from homelab.storage.models import Fact, LogEntry
 from homelab.storage.models import Incident
 
+# Line formats for the situation report; %-formatting with a precision cap
+# truncates the log content without building a sliced copy first
+_FACT_LINE = "- [%s] %s: %s\n"
+_LOG_LINE = "- [%s] %s: %.200s\n"
+
 class Situation:
     """A collection of relevant facts and logs for analysis."""
     def __init__(self, resource_ref: str, facts: list[Fact], logs: list[LogEntry]):
@@ -18,18 +23,21 @@ class Situation:
 
     def to_summary(self) -> str:
         """Format the situation for LLM consumption."""
-        summary = f"Situation Report for {self.resource_ref}\n"
-        summary += "=" * 40 + "\n"
+        parts = [f"Situation Report for {self.resource_ref}\n", "=" * 40 + "\n"]
         
-        summary += "\nRecent Facts:\n"
-        for fact in self.facts:
-            summary += f"- [{fact.timestamp.isoformat()}] {fact.fact_type}: {fact.value}\n"
+        parts.append("\nRecent Facts:\n")
+        parts.extend(
+            _FACT_LINE % (fact.timestamp.isoformat(), fact.fact_type, fact.value)
+            for fact in self.facts
+        )
             
-        summary += "\nRecent LogEntrys:\n"
-        for log in self.logs:
-            summary += f"- [{log.timestamp.isoformat()}] {log.log_source}: {log.content[:200]}\n"
+        parts.append("\nRecent LogEntrys:\n")
+        parts.extend(
+            _LOG_LINE % (log.timestamp.isoformat(), log.log_source, log.content)
+            for log in self.logs
+        )
             
-        return summary
+        return "".join(parts)
 
 class SituationBuilder:
     """Builds situations from the storage layer."""
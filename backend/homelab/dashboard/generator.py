@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import re
+from functools import lru_cache
 from typing import Any
 
 import yaml
@@ -66,8 +67,12 @@ Respond with ONLY the YAML, no explanation.
 '''
 
 
+@lru_cache(maxsize=1)
 def build_system_prompt() -> str:
-    """Build system prompt with current query list."""
+    """Build system prompt with the query list.
+    
+    NAMED_QUERIES is fixed at import, so the prompt is rendered once.
+    """
     query_descriptions = get_query_descriptions()
     
     query_list = "\n".join([
@@ -115,23 +120,23 @@ async def generate_dashboard(
     # If no client provided, try to use Ollama
     if llm_client is None:
         from homelab.config import get_settings
-        import httpx
+        from homelab.llm.providers import get_http_client
         
         settings = get_settings()
         
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                f"{settings.ollama_host}/api/generate",
-                json={
-                    "model": settings.ollama_model,
-                    "prompt": prompt,
-                    "system": system_prompt,
-                    "stream": False,
-                },
-            )
-            response.raise_for_status()
-            result = response.json()
-            llm_response = result.get("response", "")
+        response = await get_http_client().post(
+            f"{settings.ollama_host}/api/generate",
+            json={
+                "model": settings.ollama_model,
+                "prompt": prompt,
+                "system": system_prompt,
+                "stream": False,
+            },
+            timeout=120.0,
+        )
+        response.raise_for_status()
+        result = response.json()
+        llm_response = result.get("response", "")
     else:
         # Use provided client
         llm_response = await llm_client.generate(
@@ -5,10 +5,13 @@ Supports multiple LLM backends:
 - OpenRouter (cloud)
 """
 
+import asyncio
 import httpx
 import logging
+import orjson
 import os
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from typing import Any
 from enum import Enum
 
@@ -34,6 +37,41 @@ EMBEDDING_DIMENSIONS = {
 }
 
 
+# generate_many() runs prompts in waves by length, in bins of this many
+# characters, shortest first
+LLM_LENGTH_BIN_CHARS = 2000
+
+
+# Shared HTTP client: keeps provider connections alive across requests.
+# Per-request timeouts are passed on each call. Idle connections are kept
+# for five minutes so they survive between control plane loops. HTTP/2 is
+# negotiated on TLS endpoints (OpenRouter), multiplexing concurrent calls
+# over one connection; plain-http Ollama stays on HTTP/1.1.
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=300.0,
+)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared provider HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(http2=True, timeout=HTTP_TIMEOUT, limits=HTTP_POOL_LIMITS)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared provider HTTP client (called on shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 class LLMProvider(str, Enum):
     """Available LLM providers."""
     OLLAMA = "ollama"
@@ -59,6 +97,20 @@ class BaseLLMProvider(ABC):
         """Generate embedding vector."""
         pass
 
+    async def embed_batch(self, texts: list[str], model: str) -> list[list[float]] | None:
+        """Generate embedding vectors for several texts, in input order.
+
+        Providers with a batch endpoint override this; the default embeds
+        one text at a time.
+        """
+        embeddings = []
+        for text in texts:
+            embedding = await self.embed(text, model)
+            if embedding is None:
+                return None
+            embeddings.append(embedding)
+        return embeddings
+
     @abstractmethod
     async def list_models(self, function: LLMFunction | None = None) -> list[dict]:
         """List available models."""
@@ -77,23 +129,26 @@ class OllamaProvider(BaseLLMProvider):
         self.base_url = settings.ollama_host
         self.default_chat_model = settings.ollama_model
         self.default_embedding_model = "nomic-embed-text"
+        # Cleared when the server predates /api/embed (Ollama < 0.3.4)
+        self._batch_embed_supported = True
 
     async def generate(self, prompt: str, model: str | None = None, **kwargs) -> str:
         """Generate text using Ollama."""
         model = model or self.default_chat_model
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/generate",
-                    json={
-                        "model": model,
-                        "prompt": prompt,
-                        "stream": False,
-                        **kwargs,
-                    },
-                )
-                response.raise_for_status()
-                return response.json().get("response", "")
+            client = get_http_client()
+            response = await client.post(
+                f"{self.base_url}/api/generate",
+                timeout=120.0,
+                json={
+                    "model": model,
+                    "prompt": prompt,
+                    "stream": False,
+                    **kwargs,
+                },
+            )
+            response.raise_for_status()
+            return response.json().get("response", "")
         except Exception as e:
             logger.error(f"[Ollama] Generate error: {e}")
             raise
@@ -102,51 +157,87 @@ class OllamaProvider(BaseLLMProvider):
         """Generate embedding using Ollama."""
         model = model or self.default_embedding_model
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/embeddings",
-                    json={
-                        "model": model,
-                        "prompt": text[:4000],
-                    },
-                )
-                response.raise_for_status()
-                return response.json().get("embedding")
+            client = get_http_client()
+            response = await client.post(
+                f"{self.base_url}/api/embeddings",
+                timeout=30.0,
+                json={
+                    "model": model,
+                    "prompt": text[:4000],
+                },
+            )
+            response.raise_for_status()
+            # Embedding bodies are mostly floats; orjson parses them several
+            # times faster than response.json()
+            return orjson.loads(response.content).get("embedding")
         except Exception as e:
             logger.error(f"[Ollama] Embedding error: {e}")
             return None
 
+    async def embed_batch(self, texts: list[str], model: str | None = None) -> list[list[float]] | None:
+        """Generate embeddings for all texts in one call to Ollama's /api/embed.
+        
+        Servers without /api/embed fall back to one /api/embeddings call
+        per text.
+        """
+        model = model or self.default_embedding_model
+        if not self._batch_embed_supported:
+            return await super().embed_batch(texts, model)
+        try:
+            client = get_http_client()
+            response = await client.post(
+                f"{self.base_url}/api/embed",
+                timeout=30.0,
+                json={
+                    "model": model,
+                    "input": [text[:4000] for text in texts],
+                },
+            )
+            # A missing route is a bare 404; a missing model is a 404 naming the model
+            if response.status_code == 404 and "model" not in response.text:
+                logger.warning("[Ollama] /api/embed not available, embedding one text at a time")
+                self._batch_embed_supported = False
+                return await super().embed_batch(texts, model)
+            response.raise_for_status()
+            embeddings = orjson.loads(response.content).get("embeddings")
+            if not embeddings or len(embeddings) != len(texts):
+                return None
+            return embeddings
+        except Exception as e:
+            logger.error(f"[Ollama] Batch embedding error: {e}")
+            return None
+
     async def list_models(self, function: LLMFunction | None = None) -> list[dict]:
         """List pulled Ollama models."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.base_url}/api/tags")
-                response.raise_for_status()
-                data = response.json()
-                models = []
-                for m in data.get("models", []):
-                    name = m.get("name", "")
-                    # Determine capabilities based on model name
-                    is_embedding = "embed" in name.lower() or "nomic" in name.lower()
-                    is_chat = not is_embedding
-
-                    if function == LLMFunction.EMBEDDING and not is_embedding:
-                        continue
-                    if function == LLMFunction.CHAT and not is_chat:
-                        continue
-
-                    models.append({
-                        "id": name,
-                        "name": name,
-                        "provider": "ollama",
-                        "capabilities": {
-                            "chat": is_chat,
-                            "embedding": is_embedding,
-                        },
-                        "size": m.get("size"),
-                        "modified_at": m.get("modified_at"),
-                    })
-                return models
+            client = get_http_client()
+            response = await client.get(f"{self.base_url}/api/tags", timeout=10.0)
+            response.raise_for_status()
+            data = response.json()
+            models = []
+            for m in data.get("models", []):
+                name = m.get("name", "")
+                # Determine capabilities based on model name
+                is_embedding = "embed" in name.lower() or "nomic" in name.lower()
+                is_chat = not is_embedding
+
+                if function == LLMFunction.EMBEDDING and not is_embedding:
+                    continue
+                if function == LLMFunction.CHAT and not is_chat:
+                    continue
+
+                models.append({
+                    "id": name,
+                    "name": name,
+                    "provider": "ollama",
+                    "capabilities": {
+                        "chat": is_chat,
+                        "embedding": is_embedding,
+                    },
+                    "size": m.get("size"),
+                    "modified_at": m.get("modified_at"),
+                })
+            return models
         except Exception as e:
             logger.error(f"[Ollama] List models error: {e}")
             return []
@@ -182,19 +273,20 @@ class OpenRouterProvider(BaseLLMProvider):
 
         model = model or self.default_chat_model
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(
-                    f"{self.BASE_URL}/chat/completions",
-                    headers=self._get_headers(),
-                    json={
-                        "model": model,
-                        "messages": [{"role": "user", "content": prompt}],
-                        **kwargs,
-                    },
-                )
-                response.raise_for_status()
-                data = response.json()
-                return data.get("choices", [{}])[0].get("message", {}).get("content", "")
+            client = get_http_client()
+            response = await client.post(
+                f"{self.BASE_URL}/chat/completions",
+                timeout=120.0,
+                headers=self._get_headers(),
+                json={
+                    "model": model,
+                    "messages": [{"role": "user", "content": prompt}],
+                    **kwargs,
+                },
+            )
+            response.raise_for_status()
+            data = response.json()
+            return data.get("choices", [{}])[0].get("message", {}).get("content", "")
         except Exception as e:
             logger.error(f"[OpenRouter] Generate error: {e}")
             raise
@@ -207,62 +299,91 @@ class OpenRouterProvider(BaseLLMProvider):
 
         model = model or self.default_embedding_model
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.BASE_URL}/embeddings",
-                    headers=self._get_headers(),
-                    json={
-                        "model": model,
-                        "input": text[:8000],
-                    },
-                )
-                response.raise_for_status()
-                data = response.json()
-                return data.get("data", [{}])[0].get("embedding")
+            client = get_http_client()
+            response = await client.post(
+                f"{self.BASE_URL}/embeddings",
+                timeout=30.0,
+                headers=self._get_headers(),
+                json={
+                    "model": model,
+                    "input": text[:8000],
+                },
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            return data.get("data", [{}])[0].get("embedding")
         except Exception as e:
             logger.error(f"[OpenRouter] Embedding error: {e}")
             return None
 
+    async def embed_batch(self, texts: list[str], model: str | None = None) -> list[list[float]] | None:
+        """Generate embeddings for all texts in one OpenAI-compatible request."""
+        if not self.api_key:
+            logger.warning("[OpenRouter] API key not configured for embeddings")
+            return None
+
+        model = model or self.default_embedding_model
+        try:
+            client = get_http_client()
+            response = await client.post(
+                f"{self.BASE_URL}/embeddings",
+                timeout=30.0,
+                headers=self._get_headers(),
+                json={
+                    "model": model,
+                    "input": [text[:8000] for text in texts],
+                },
+            )
+            response.raise_for_status()
+            data = sorted(orjson.loads(response.content).get("data", []), key=lambda d: d.get("index", 0))
+            if len(data) != len(texts):
+                return None
+            return [d.get("embedding") for d in data]
+        except Exception as e:
+            logger.error(f"[OpenRouter] Batch embedding error: {e}")
+            return None
+
     async def list_models(self, function: LLMFunction | None = None) -> list[dict]:
         """List available OpenRouter models."""
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/models",
-                    headers=self._get_headers() if self.api_key else {},
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                models = []
-                for m in data.get("data", []):
-                    model_id = m.get("id", "")
-                    context_length = m.get("context_length", 0)
-
-                    # Determine capabilities
-                    is_embedding = "embed" in model_id.lower()
-                    is_chat = not is_embedding
-
-                    if function == LLMFunction.EMBEDDING and not is_embedding:
-                        continue
-                    if function == LLMFunction.CHAT and not is_chat:
-                        continue
-
-                    models.append({
-                        "id": model_id,
-                        "name": m.get("name", model_id),
-                        "provider": "openrouter",
-                        "capabilities": {
-                            "chat": is_chat,
-                            "embedding": is_embedding,
-                        },
-                        "context_length": context_length,
-                        "pricing": m.get("pricing", {}),
-                    })
-
-                # Sort by name for easier browsing
-                models.sort(key=lambda x: x["name"].lower())
-                return models
+            client = get_http_client()
+            response = await client.get(
+                f"{self.BASE_URL}/models",
+                timeout=15.0,
+                headers=self._get_headers() if self.api_key else {},
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            models = []
+            for m in data.get("data", []):
+                model_id = m.get("id", "")
+                context_length = m.get("context_length", 0)
+
+                # Determine capabilities
+                is_embedding = "embed" in model_id.lower()
+                is_chat = not is_embedding
+
+                if function == LLMFunction.EMBEDDING and not is_embedding:
+                    continue
+                if function == LLMFunction.CHAT and not is_chat:
+                    continue
+
+                models.append({
+                    "id": model_id,
+                    "name": m.get("name", model_id),
+                    "provider": "openrouter",
+                    "capabilities": {
+                        "chat": is_chat,
+                        "embedding": is_embedding,
+                    },
+                    "context_length": context_length,
+                    "pricing": m.get("pricing", {}),
+                })
+
+            # Sort by name for easier browsing
+            models.sort(key=lambda x: x["name"].lower())
+            return models
 
         except Exception as e:
             logger.error(f"[OpenRouter] List models error: {e}")
@@ -296,7 +417,6 @@ class LLMManager:
     DEFAULT_EMBEDDING_DIM = 768
 
     def __init__(self):
-        import asyncio
         self._providers: dict[LLMProvider, BaseLLMProvider] = {}
         self._current_settings: dict[LLMFunction, dict] = {
             LLMFunction.CHAT: {
@@ -342,6 +462,13 @@ class LLMManager:
                 raise ValueError(f"Unknown provider: {provider}")
         return self._providers[provider]
 
+    def get_embedding_model(self) -> str:
+        """Get the configured embedding model as "provider/model"."""
+        config = self._current_settings[LLMFunction.EMBEDDING]
+        provider = self._get_provider(config["provider"])
+        model = config["model"] or provider.get_default_model(LLMFunction.EMBEDDING)
+        return f"{config['provider'].value}/{model}"
+
     def is_cloud_allowed(self) -> bool:
         """Check if cloud LLM providers are allowed."""
         return ALLOW_CLOUD_LLM
@@ -472,13 +599,84 @@ class LLMManager:
                 logger.info("[LLMManager] Sanitized prompt for cloud provider to remove raw logs.")
         return await provider.generate(prompt_to_send, model)
 
+    async def generate_many(
+        self,
+        prompts: list[str],
+        function: LLMFunction = LLMFunction.CHAT,
+    ) -> list[str | BaseException]:
+        """Generate text for several prompts concurrently, shortest first.
+
+        Prompts are binned by length (LLM_LENGTH_BIN_CHARS) and each bin runs
+        as its own wave of at most `ollama_num_parallel` calls, so short
+        prompts don't wait in a server slot behind long ones.
+
+        Returns:
+            One result per prompt in input order: the text, or the exception
+            its call raised.
+        """
+        bins: defaultdict[int, list[int]] = defaultdict(list)
+        for i, prompt in enumerate(prompts):
+            bins[len(prompt) // LLM_LENGTH_BIN_CHARS].append(i)
+
+        semaphore = asyncio.Semaphore(max(1, settings.ollama_num_parallel))
+
+        async def generate_one(i: int) -> str:
+            async with semaphore:
+                return await self.generate(prompts[i], function)
+
+        results: list[str | BaseException] = [""] * len(prompts)
+        for _, indices in sorted(bins.items()):
+            outputs = await asyncio.gather(
+                *(generate_one(i) for i in indices),
+                return_exceptions=True,
+            )
+            for i, output in zip(indices, outputs):
+                results[i] = output
+        return results
+
     async def embed(self, text: str) -> list[float] | None:
         """Generate embedding using configured provider.
 
         Raises:
             EmbeddingBlockedError: If collections are in inconsistent state.
         """
-        # Block if collections are in inconsistent state - fail loud, not silent
+        self._check_embedding_blocked()
+
+        config = self._current_settings[LLMFunction.EMBEDDING]
+        provider = self._get_provider(config["provider"])
+        model = config["model"] or provider.get_default_model(LLMFunction.EMBEDDING)
+        result = await provider.embed(text, model)
+
+        if result:
+            await self._lock_embedding_dimension(len(result))
+
+        return result
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]] | None:
+        """Generate embeddings for several texts in one provider round-trip.
+
+        Returns one vector per text, in input order, or None on failure.
+
+        Raises:
+            EmbeddingBlockedError: If collections are in inconsistent state.
+        """
+        self._check_embedding_blocked()
+        if not texts:
+            return []
+
+        config = self._current_settings[LLMFunction.EMBEDDING]
+        provider = self._get_provider(config["provider"])
+        model = config["model"] or provider.get_default_model(LLMFunction.EMBEDDING)
+        result = await provider.embed_batch(texts, model)
+
+        if result:
+            await self._lock_embedding_dimension(len(result[0]))
+
+        return result
+
+    def _check_embedding_blocked(self) -> None:
+        """Raise EmbeddingBlockedError if collections are in inconsistent state."""
+        # Fail loud, not silent
         if self._embedding_inconsistent:
             logger.error(
                 "[LLMManager] Embedding request BLOCKED: Qdrant collections have inconsistent dimensions. "
@@ -489,24 +687,18 @@ class LLMManager:
                 "Use POST /api/rag/collections/recreate to resolve."
             )
 
-        config = self._current_settings[LLMFunction.EMBEDDING]
-        provider = self._get_provider(config["provider"])
-        model = config["model"] or provider.get_default_model(LLMFunction.EMBEDDING)
-        result = await provider.embed(text, model)
-
-        # Lock dimension after first successful embedding (thread-safe)
-        if result and not self._embedding_dimension_locked:
-            async with self._embed_lock:
-                # Double-check after acquiring lock
-                if not self._embedding_dimension_locked:
-                    actual_dim = len(result)
-                    if actual_dim != self._embedding_dimension:
-                        logger.info(f"[LLMManager] Detected embedding dimension: {actual_dim}")
-                        self._embedding_dimension = actual_dim
-                    self._embedding_dimension_locked = True
-                    logger.info(f"[LLMManager] Embedding dimension locked at {self._embedding_dimension}")
-
-        return result
+    async def _lock_embedding_dimension(self, actual_dim: int) -> None:
+        """Lock dimension after first successful embedding (thread-safe)."""
+        if self._embedding_dimension_locked:
+            return
+        async with self._embed_lock:
+            # Double-check after acquiring lock
+            if not self._embedding_dimension_locked:
+                if actual_dim != self._embedding_dimension:
+                    logger.info(f"[LLMManager] Detected embedding dimension: {actual_dim}")
+                    self._embedding_dimension = actual_dim
+                self._embedding_dimension_locked = True
+                logger.info(f"[LLMManager] Embedding dimension locked at {self._embedding_dimension}")
 
     async def list_models(self, provider: LLMProvider, function: LLMFunction | None = None) -> list[dict]:
         """List available models for a provider."""
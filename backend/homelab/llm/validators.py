@@ -1,6 +1,11 @@
 """Schema validators for LLM outputs."""
 
-from pydantic import BaseModel, ConfigDict, Field
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter
+
+# Constraint shared by the output models' text field and the fast-path adapter
+OutputText = Annotated[str, StringConstraints(min_length=1)]
 
 
 class NarrativeOutput(BaseModel):
@@ -8,7 +13,11 @@ class NarrativeOutput(BaseModel):
 
     model_config = ConfigDict(extra="forbid")
 
-    text: str = Field(..., min_length=1)
+    text: OutputText = Field(...)
+
+
+# Same constraints as NarrativeOutput.text (strict), without the model wrapper
+narrative_text_adapter = TypeAdapter(OutputText, config=ConfigDict(strict=True))
 
 
 class SummaryOutput(BaseModel):
@@ -16,5 +25,4 @@ class SummaryOutput(BaseModel):
 
     model_config = ConfigDict(extra="forbid")
 
-    text: str = Field(..., min_length=1)
-
+    text: OutputText = Field(...)
@@ -1,10 +1,11 @@
+import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from homelab.config import get_settings
 from homelab.storage.database import init_db, engine
-from homelab.observability.logging import configure_logging
+from homelab.observability.logging import configure_logging, stop_logging
 from homelab.observability.middleware import RequestContextMiddleware
 from homelab.observability.otel import configure_otel
 from homelab.api.health import router as health_router
@@ -23,43 +24,53 @@ from homelab.api.safety import router as safety_router
 from homelab.api.workers import router as workers_router
 from homelab.scheduler import start_scheduler, stop_scheduler
 from homelab.rag.rag_indexer import rag_indexer
-from homelab.llm.providers import llm_manager
+from homelab.llm.providers import llm_manager, close_http_client
+from homelab.plugins import start_sandbox_pool, stop_sandbox_pool
 
 
 configure_logging()
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     # Startup
-    print("[Copilot] Starting Homelab Copilot backend...")
+    configure_logging()  # no-op unless a previous shutdown stopped it
+    logger.info("[Copilot] Starting Homelab Copilot backend...")
     await init_db()
-    print("[Copilot] Database initialized")
+    logger.info("[Copilot] Database initialized")
 
     # Pre-lock embedding dimension from existing Qdrant collections
-    existing_dim, is_consistent = rag_indexer.get_existing_dimension()
+    existing_dim, is_consistent = await rag_indexer.get_existing_dimension()
     if existing_dim:
         if is_consistent:
             llm_manager.prelock_from_qdrant(existing_dim)
+            # Run the collection check now rather than on the first request
+            await rag_indexer.ensure_collections()
         else:
-            print(
-                f"[Copilot] WARNING: Qdrant collections have INCONSISTENT dimensions! "
-                f"Embedding/indexing will be blocked until resolved. "
-                f"Use POST /api/rag/collections/recreate to fix."
+            logger.warning(
+                "[Copilot] Qdrant collections have INCONSISTENT dimensions! "
+                "Embedding/indexing will be blocked until resolved. "
+                "Use POST /api/rag/collections/recreate to fix."
             )
             llm_manager.set_inconsistent_state(True)
     else:
-        print("[Copilot] No existing Qdrant collections found, dimension will lock on first embedding")
+        logger.info("[Copilot] No existing Qdrant collections found, dimension will lock on first embedding")
 
+    await start_sandbox_pool()
     start_scheduler()
 
     yield
 
     # Shutdown
     stop_scheduler()
-    print("[Copilot] Shutting down...")
+    stop_sandbox_pool()
+    await close_http_client()
+    await rag_indexer.close()
+    logger.info("[Copilot] Shutting down...")
+    stop_logging()
 
 
 app = FastAPI(
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import logging
-from logging.handlers import SysLogHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, SysLogHandler
 
 import httpx
 
@@ -75,28 +76,70 @@ class GotifyHandler(logging.Handler):
             pass
 
 
+LOG_FORMAT = (
+    "%(asctime)s %(levelname)s %(name)s request_id=%(request_id)s "
+    "trace_id=%(trace_id)s span_id=%(span_id)s %(message)s"
+)
+
+_queue_handler: QueueHandler | None = None
+_queue_listener: QueueListener | None = None
+
+
 def configure_logging() -> None:
-    """Configure base logging to include request context."""
+    """Configure base logging to include request context.
+
+    Records are handed to a QueueHandler on the root logger and written by a
+    QueueListener thread, so stdout flushes, syslog sends and ntfy/gotify
+    posts never block the event loop. RequestIdFilter runs on the queue
+    handler, in the thread that logs, so request and trace ids are captured
+    before the record is queued. Safe to call again after stop_logging().
+    """
+    global _queue_handler, _queue_listener
+    if _queue_listener is not None:
+        return
+
     settings = get_settings()
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s %(levelname)s %(name)s request_id=%(request_id)s trace_id=%(trace_id)s span_id=%(span_id)s %(message)s",
-    )
-    root_logger = logging.getLogger()
-    root_logger.addFilter(RequestIdFilter())
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    handlers: list[logging.Handler] = [stream_handler]
 
     if settings.syslog_host:
         syslog_handler = SysLogHandler(address=(settings.syslog_host, settings.syslog_port))
         syslog_handler.setLevel(logging.INFO)
         syslog_handler.setFormatter(logging.Formatter("%(name)s %(levelname)s %(message)s"))
-        root_logger.addHandler(syslog_handler)
+        handlers.append(syslog_handler)
 
     if settings.ntfy_url and settings.ntfy_topic:
         ntfy_handler = NtfyHandler(settings.ntfy_url, settings.ntfy_topic)
         ntfy_handler.setFormatter(logging.Formatter("%(levelname)s %(name)s %(message)s"))
-        root_logger.addHandler(ntfy_handler)
+        handlers.append(ntfy_handler)
 
     if settings.gotify_url and settings.gotify_token:
         gotify_handler = GotifyHandler(settings.gotify_url, settings.gotify_token)
         gotify_handler.setFormatter(logging.Formatter("%(levelname)s %(name)s %(message)s"))
-        root_logger.addHandler(gotify_handler)
+        handlers.append(gotify_handler)
+
+    _queue_handler = QueueHandler(queue.SimpleQueue())
+    _queue_handler.addFilter(RequestIdFilter())
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(_queue_handler)
+
+    _queue_listener = QueueListener(_queue_handler.queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+
+
+def stop_logging() -> None:
+    """Detach the queue handler, write out queued records and stop the listener.
+
+    Detaching first means no record is queued after the listener has gone.
+    """
+    global _queue_handler, _queue_listener
+    if _queue_listener is None:
+        return
+    logging.getLogger().removeHandler(_queue_handler)
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.close()
+    _queue_handler = None
+    _queue_listener = None
@@ -13,7 +13,7 @@ from homelab.plugins.loader import (
     discover_plugins,
     infer_trust_level,
 )
-from homelab.plugins.sandbox import run_sandboxed
+from homelab.plugins.sandbox import run_sandboxed, start_sandbox_pool, stop_sandbox_pool
 
 __all__ = [
     # Manifest schema
@@ -31,4 +31,6 @@ __all__ = [
     
     # Sandbox
     "run_sandboxed",
+    "start_sandbox_pool",
+    "stop_sandbox_pool",
 ]
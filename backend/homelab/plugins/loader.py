@@ -24,11 +24,12 @@ class PluginLoadError(Exception):
     pass
 
 
-def load_manifest(plugin_dir: Path) -> PluginManifest:
+def load_manifest(plugin_dir: Path, manifest_bytes: bytes | None = None) -> PluginManifest:
     """Load and validate plugin manifest.
     
     Args:
         plugin_dir: Directory containing manifest.yaml
+        manifest_bytes: Raw manifest contents if already read by the caller
     
     Returns:
         Validated plugin manifest
@@ -36,14 +37,17 @@ def load_manifest(plugin_dir: Path) -> PluginManifest:
     Raises:
         PluginLoadError: If manifest is missing or invalid
     """
-    manifest_path = plugin_dir / "manifest.yaml"
-    
-    if not manifest_path.exists():
-        raise PluginLoadError(f"No manifest.yaml found in {plugin_dir}")
+    if manifest_bytes is None:
+        manifest_path = plugin_dir / "manifest.yaml"
+        
+        # Open directly instead of exists() + open() to save a stat per plugin
+        try:
+            manifest_bytes = manifest_path.read_bytes()
+        except FileNotFoundError:
+            raise PluginLoadError(f"No manifest.yaml found in {plugin_dir}")
     
     try:
-        with open(manifest_path) as f:
-            data = yaml.safe_load(f)
+        data = yaml.safe_load(manifest_bytes)
     except yaml.YAMLError as e:
         raise PluginLoadError(f"Invalid YAML in manifest: {e}")
     
@@ -75,10 +79,11 @@ def load_plugin_class(
     except ValueError:
         raise PluginLoadError(f"Invalid entry point format: {manifest.entry_point}")
     
-    # Find plugin file
+    # Find plugin file. Checked up front: a FileNotFoundError from exec_module
+    # may come from the plugin's own import-time code, not the entry point.
     plugin_file = plugin_dir / f"{module_path}.py"
     
-    if not plugin_file.exists():
+    if not plugin_file.is_file():
         raise PluginLoadError(f"Entry point file not found: {plugin_file}")
     
     # Load module
@@ -111,11 +116,15 @@ def load_plugin_class(
     return plugin_class
 
 
-def load_plugin(plugin_dir: Path) -> tuple[PluginManifest, Type[ExecutionPlugin]]:
+def load_plugin(
+    plugin_dir: Path,
+    manifest_bytes: bytes | None = None,
+) -> tuple[PluginManifest, Type[ExecutionPlugin]]:
     """Load plugin from directory.
     
     Args:
         plugin_dir: Directory containing manifest.yaml and plugin code
+        manifest_bytes: Raw manifest contents if already read by the caller
     
     Returns:
         (manifest, plugin_class)
@@ -123,7 +132,7 @@ def load_plugin(plugin_dir: Path) -> tuple[PluginManifest, Type[ExecutionPlugin]
     Raises:
         PluginLoadError: If plugin cannot be loaded
     """
-    manifest = load_manifest(plugin_dir)
+    manifest = load_manifest(plugin_dir, manifest_bytes)
     plugin_class = load_plugin_class(plugin_dir, manifest)
     
     logger.info(
@@ -164,12 +173,19 @@ def discover_plugins(base_dir: Path) -> list[tuple[PluginManifest, Type[Executio
         logger.warning(f"Plugin directory does not exist: {base_dir}")
         return plugins
     
-    # Search for manifest.yaml files
-    for manifest_path in base_dir.rglob("manifest.yaml"):
+    # Search for manifest.yaml files (sorted for a deterministic load order)
+    for manifest_path in sorted(base_dir.rglob("manifest.yaml")):
         plugin_dir = manifest_path.parent
         
+        # Read the manifest once here and hand the bytes to the loader
+        try:
+            manifest_bytes = manifest_path.read_bytes()
+        except OSError as e:
+            logger.warning(f"Failed to read manifest in {plugin_dir}: {e}")
+            continue
+        
         try:
-            manifest, plugin_class = load_plugin(plugin_dir)
+            manifest, plugin_class = load_plugin(plugin_dir, manifest_bytes)
             plugins.append((manifest, plugin_class))
         except PluginLoadError as e:
             logger.warning(f"Failed to load plugin from {plugin_dir}: {e}")
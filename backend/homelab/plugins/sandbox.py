@@ -5,22 +5,32 @@ from __future__ import annotations
 import logging
 import platform
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from homelab.plugins.manifest_schema import TrustLevel
 
 
 logger = logging.getLogger(__name__)
 
+# Caller-supplied environment variables passed through to sandboxed plugins
+SAFE_ENV_KEYS = frozenset({"PLUGIN_DATA", "PLUGIN_CONFIG"})
+
 
 # Lazy imports to avoid import-time failures
 _sandbox_linux = None
 _sandbox_fallback = None
 
+# Resolved backend and its runner, cached after first resolution
+_BACKEND = None
+_BACKEND_RUNNER = None
+
 
 def _get_sandbox_backend():
     """Get appropriate sandbox backend for current platform."""
-    global _sandbox_linux, _sandbox_fallback
+    global _sandbox_linux, _sandbox_fallback, _BACKEND
+    
+    if _BACKEND is not None:
+        return _BACKEND
     
     system = platform.system()
     
@@ -33,7 +43,8 @@ def _get_sandbox_backend():
                 
                 if sandbox_linux.is_seccomp_available():
                     logger.info("Using Linux seccomp sandboxing")
-                    return _sandbox_linux
+                    _BACKEND = _sandbox_linux
+                    return _BACKEND
                 else:
                     logger.warning("seccomp not available, falling back to restricted imports")
             except ImportError as e:
@@ -45,7 +56,36 @@ def _get_sandbox_backend():
         _sandbox_fallback = sandbox_fallback
         logger.info(f"Using fallback sandboxing for {system}")
     
-    return _sandbox_fallback
+    _BACKEND = _sandbox_fallback
+    return _BACKEND
+
+
+def _get_sandbox_runner():
+    """Get the run function of the resolved sandbox backend."""
+    global _BACKEND_RUNNER
+    
+    if _BACKEND_RUNNER is None:
+        backend = _get_sandbox_backend()
+        if hasattr(backend, "run_sandboxed_linux"):
+            _BACKEND_RUNNER = backend.run_sandboxed_linux
+        else:
+            _BACKEND_RUNNER = backend.run_sandboxed_fallback
+    
+    return _BACKEND_RUNNER
+
+
+async def start_sandbox_pool() -> None:
+    """Pre-spawn warm sandbox workers if the active backend supports them."""
+    start_worker_pool = getattr(_get_sandbox_backend(), "start_worker_pool", None)
+    if start_worker_pool is not None:
+        await start_worker_pool()
+
+
+def stop_sandbox_pool() -> None:
+    """Stop the backend's warm sandbox workers, if any."""
+    stop_worker_pool = getattr(_get_sandbox_backend(), "stop_worker_pool", None)
+    if stop_worker_pool is not None:
+        stop_worker_pool()
 
 
 async def run_sandboxed(
@@ -54,6 +94,7 @@ async def run_sandboxed(
     args: list[str] | None = None,
     timeout: int = 60,
     env: dict[str, str] | None = None,
+    stream_callback: Callable[[bytes], None] | None = None,
 ) -> dict[str, Any]:
     """Run script with appropriate sandboxing based on trust level.
     
@@ -63,6 +104,8 @@ async def run_sandboxed(
         args: Command-line arguments
         timeout: Execution timeout in seconds
         env: Environment variables
+        stream_callback: Receives stdout/stderr chunks as they arrive;
+            when set, the returned stdout/stderr are empty
     
     Returns:
         Execution result with stdout, stderr, returncode
@@ -79,16 +122,8 @@ async def run_sandboxed(
     
     elif trust_level in (TrustLevel.VERIFIED, TrustLevel.SANDBOXED):
         # Verified and sandboxed plugins run in sandbox
-        backend = _get_sandbox_backend()
-        
-        if hasattr(backend, "run_sandboxed_linux"):
-            return await backend.run_sandboxed_linux(
-                script_path, args, timeout, env
-            )
-        else:
-            return await backend.run_sandboxed_fallback(
-                script_path, args, timeout, env
-            )
+        runner = _get_sandbox_runner()
+        return await runner(script_path, args, timeout, env, stream_callback)
     
     else:
         raise ValueError(f"Invalid trust level: {trust_level}")
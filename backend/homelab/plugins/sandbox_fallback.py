@@ -5,7 +5,10 @@ from __future__ import annotations
 import asyncio
 import logging
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable
+
+from homelab.plugins.sandbox import SAFE_ENV_KEYS
 
 
 logger = logging.getLogger(__name__)
@@ -22,6 +25,13 @@ BLOCKED_IMPORTS = {
 }
 
 
+# Base environment for sandboxed processes (minimal, isolated)
+_BASE_ENV = MappingProxyType({
+    "PYTHONPATH": "",  # Isolate from system packages
+    "PYTHONDONTWRITEBYTECODE": "1",  # Don't create .pyc files
+})
+
+
 # Sandbox wrapper script
 SANDBOX_WRAPPER = '''
 import sys
@@ -30,11 +40,13 @@ import builtins
 # Block dangerous imports
 _original_import = builtins.__import__
 _blocked = {blocked_modules}
+_blocked_contains = _blocked.__contains__
 
 def _restricted_import(name, *args, **kwargs):
     """Restricted import that blocks dangerous modules."""
-    base_module = name.split('.')[0]
-    if base_module in _blocked:
+    # partition() avoids allocating a list just to read the first segment
+    base_module = name.partition('.')[0]
+    if _blocked_contains(base_module):
         raise ImportError(
             f"Import of '{{name}}' is not allowed in sandboxed mode. "
             f"Sandboxed plugins can only use safe built-in modules."
@@ -77,11 +89,24 @@ except Exception as e:
 '''
 
 
+_STREAM_CHUNK_SIZE = 8192
+
+
+async def _read_stream(
+    stream: asyncio.StreamReader,
+    callback: Callable[[bytes], None],
+) -> None:
+    """Forward chunks from a subprocess pipe to callback until EOF."""
+    while chunk := await stream.read(_STREAM_CHUNK_SIZE):
+        callback(chunk)
+
+
 async def run_sandboxed_fallback(
     script_path: Path,
     args: list[str] | None = None,
     timeout: int = 60,
     env: dict[str, str] | None = None,
+    stream_callback: Callable[[bytes], None] | None = None,
 ) -> dict[str, Any]:
     """Run script in subprocess with restricted imports (fallback for Windows/Mac).
     
@@ -90,6 +115,8 @@ async def run_sandboxed_fallback(
         args: Command-line arguments (limited support)
         timeout: Execution timeout in seconds
         env: Environment variables (restricted)
+        stream_callback: Receives stdout/stderr chunks as they arrive;
+            when set, the returned stdout/stderr are empty
     
     Returns:
         Execution result with stdout, stderr, returncode
@@ -105,20 +132,12 @@ async def run_sandboxed_fallback(
         script_path=str(script_path).replace("\\", "\\\\"),
     )
     
-    # Prepare environment (minimal, isolated)
-    sandbox_env = {
-        "PYTHONPATH": "",  # Isolate from system packages
-        "PYTHONDONTWRITEBYTECODE": "1",  # Don't create .pyc files
-    }
-    
+    # Prepare environment (minimal, isolated), passing through only safe keys
+    sandbox_env = dict(_BASE_ENV)
     if env:
-        # Only allow safe environment variables
-        safe_keys = {"PLUGIN_DATA", "PLUGIN_CONFIG"}
-        for key, value in env.items():
-            if key in safe_keys:
-                sandbox_env[key] = value
+        sandbox_env.update({k: v for k, v in env.items() if k in SAFE_ENV_KEYS})
     
-    logger.info(f"Running sandboxed (fallback): {script_path}")
+    logger.info("Running sandboxed (fallback): %s", script_path)
     
     # Run wrapper
     result = await asyncio.create_subprocess_exec(
@@ -129,10 +148,21 @@ async def run_sandboxed_fallback(
     )
     
     try:
-        stdout, stderr = await asyncio.wait_for(
-            result.communicate(),
-            timeout=timeout
-        )
+        if stream_callback is None:
+            stdout, stderr = await asyncio.wait_for(
+                result.communicate(),
+                timeout=timeout
+            )
+        else:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    _read_stream(result.stdout, stream_callback),
+                    _read_stream(result.stderr, stream_callback),
+                    result.wait(),
+                ),
+                timeout=timeout
+            )
+            stdout = stderr = b""
     except asyncio.TimeoutError:
         result.kill()
         await result.wait()
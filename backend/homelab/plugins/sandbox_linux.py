@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import asyncio
+import ctypes
+import errno
+import fcntl
+import functools
 import json
 import logging
+import os
+import signal
+import struct
 import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable
+
+from homelab.plugins.sandbox import SAFE_ENV_KEYS
 
 
 logger = logging.getLogger(__name__)
@@ -61,12 +74,542 @@ SECCOMP_POLICY = {
     ]
 }
 
+# Base environment for sandboxed processes (minimal, isolated)
+_BASE_ENV = MappingProxyType({
+    "PYTHONPATH": "",  # Isolate from system packages
+    "PATH": "/usr/bin:/bin",  # Minimal PATH
+    "HOME": "/tmp",  # Isolated home
+})
+
+# libseccomp action values (see seccomp.h)
+_SCMP_ACT_ALLOW = 0x7FFF0000
+_SCMP_ACT_ERRNO_EPERM = 0x00050000 | errno.EPERM
+
+# Env vars telling the child where to find its seccomp program
+SECCOMP_FD_ENV = "WINGMAN_SECCOMP_FD"
+SECCOMP_FORMAT_ENV = "WINGMAN_SECCOMP_FORMAT"
+
+# Sealed memfd holding the compiled policy, created once per process
+_policy_fd: int | None = None
+_policy_format: str = "bpf"
+# Plain thread lock: creation is synchronous, and an asyncio.Lock made at
+# import time is tied to whichever event loop first waits on it
+_policy_lock = threading.Lock()
+
+
+def _compile_policy_bpf() -> bytes | None:
+    """Compile SECCOMP_POLICY to a raw BPF program with libseccomp.
+    
+    Returns None if libseccomp is missing or rejects the policy.
+    """
+    try:
+        lib = ctypes.CDLL("libseccomp.so.2")
+    except OSError:
+        return None
+    
+    lib.seccomp_init.argtypes = [ctypes.c_uint32]
+    lib.seccomp_init.restype = ctypes.c_void_p
+    lib.seccomp_syscall_resolve_name.argtypes = [ctypes.c_char_p]
+    lib.seccomp_syscall_resolve_name.restype = ctypes.c_int
+    lib.seccomp_rule_add.argtypes = [ctypes.c_void_p, ctypes.c_uint32, ctypes.c_int, ctypes.c_uint]
+    lib.seccomp_rule_add.restype = ctypes.c_int
+    lib.seccomp_export_bpf.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    lib.seccomp_export_bpf.restype = ctypes.c_int
+    lib.seccomp_release.argtypes = [ctypes.c_void_p]
+    
+    ctx = lib.seccomp_init(_SCMP_ACT_ERRNO_EPERM)
+    if not ctx:
+        return None
+    
+    try:
+        for rule in SECCOMP_POLICY["syscalls"]:
+            if rule["action"] != "SCMP_ACT_ALLOW":
+                continue
+            for name in rule["names"]:
+                nr = lib.seccomp_syscall_resolve_name(name.encode())
+                if nr < 0:
+                    # Not a syscall on this architecture (e.g. "open" on arm64)
+                    continue
+                if lib.seccomp_rule_add(ctx, _SCMP_ACT_ALLOW, nr, 0) < 0:
+                    return None
+        
+        fd = os.memfd_create("wingman-seccomp-export", os.MFD_CLOEXEC)
+        try:
+            if lib.seccomp_export_bpf(ctx, fd) < 0:
+                return None
+            return os.pread(fd, os.fstat(fd).st_size, 0)
+        finally:
+            os.close(fd)
+    finally:
+        lib.seccomp_release(ctx)
+
+
+def _create_policy_memfd() -> tuple[int, str]:
+    """Compile the policy once into a sealed, read-only memfd.
+    
+    Falls back to the JSON policy if it cannot be compiled to BPF.
+    """
+    program = _compile_policy_bpf()
+    policy_format = "bpf"
+    if program is None:
+        logger.warning("Could not compile seccomp policy to BPF, passing JSON policy")
+        program = json.dumps(SECCOMP_POLICY).encode()
+        policy_format = "json"
+    
+    fd = os.memfd_create(
+        "wingman-seccomp", os.MFD_CLOEXEC | os.MFD_ALLOW_SEALING
+    )
+    os.write(fd, program)
+    fcntl.fcntl(
+        fd,
+        fcntl.F_ADD_SEALS,
+        fcntl.F_SEAL_SHRINK | fcntl.F_SEAL_GROW | fcntl.F_SEAL_WRITE | fcntl.F_SEAL_SEAL,
+    )
+    return fd, policy_format
+
+
+async def _get_policy_fd() -> tuple[int, str]:
+    """Get the shared policy memfd; only the first call compiles the policy."""
+    global _policy_fd, _policy_format
+    if _policy_fd is None:
+        with _policy_lock:
+            if _policy_fd is None:
+                _policy_fd, _policy_format = _create_policy_memfd()
+    return _policy_fd, _policy_format
+
+
+# fork/exec blocks the calling thread until the child has exec'd, so only
+# the spawn itself runs on a bounded pool; pipes and exits are awaited on the
+# event loop, so a running script never holds one of these threads.
+_SPAWN_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+_spawn_executor: ThreadPoolExecutor | None = None
+
+
+def _get_spawn_executor() -> ThreadPoolExecutor:
+    """Get the bounded thread pool used to spawn sandboxed processes."""
+    global _spawn_executor
+    if _spawn_executor is None:
+        _spawn_executor = ThreadPoolExecutor(
+            max_workers=_SPAWN_MAX_WORKERS,
+            thread_name_prefix="sandbox-spawn",
+        )
+    return _spawn_executor
+
+
+async def _spawn_in_executor(
+    spawn: Callable[[], subprocess.Popen],
+    discard: Callable[[subprocess.Popen], None],
+) -> subprocess.Popen:
+    """Run a blocking spawn on the spawn executor.
+    
+    If the caller is cancelled while Popen is still running, the child is
+    handed to discard (kill and reap, on the executor) once it exists
+    instead of being left running with nobody to wait on it.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(_get_spawn_executor(), spawn)
+    try:
+        # Shielded so cancellation cannot drop the Popen result
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        future.add_done_callback(functools.partial(_discard_spawned, discard))
+        raise
+
+
+def _discard_spawned(
+    discard: Callable[[subprocess.Popen], None],
+    future: asyncio.Future,
+) -> None:
+    if future.cancelled() or future.exception() is not None:
+        return
+    future.get_loop().run_in_executor(_get_spawn_executor(), discard, future.result())
+
+
+def _kill_and_reap(proc: subprocess.Popen) -> None:
+    """Kill a one-shot sandbox child and wait for it (blocking)."""
+    proc.kill()
+    proc.communicate()
+
+
+_STREAM_CHUNK_SIZE = 8192
+
+
+async def _readable(fd: int) -> None:
+    """Wait on the event loop until fd is readable."""
+    loop = asyncio.get_running_loop()
+    ready = loop.create_future()
+    loop.add_reader(fd, _set_ready, ready)
+    try:
+        await ready
+    finally:
+        loop.remove_reader(fd)
+
+
+def _set_ready(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+async def _read_pipe(pipe, callback: Callable[[bytes], None] | None) -> bytes:
+    """Read a child's pipe to EOF on the event loop.
+    
+    Chunks go to callback as they arrive when one is given (and nothing is
+    buffered); otherwise the whole output is returned.
+    """
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    transport, _ = await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader), pipe,
+    )
+    try:
+        if callback is None:
+            return await reader.read()
+        while chunk := await reader.read(_STREAM_CHUNK_SIZE):
+            callback(chunk)
+        return b""
+    finally:
+        transport.close()
+
+
+async def _wait_child(proc: subprocess.Popen) -> int:
+    """Reap a child once it exits, without holding a thread while it runs.
+    
+    Waits for the child's pidfd to become readable; if pidfd_open is not
+    available the blocking wait runs on the default executor instead.
+    """
+    try:
+        pidfd = os.pidfd_open(proc.pid)
+    except (AttributeError, OSError):
+        return await asyncio.to_thread(proc.wait)
+    try:
+        await _readable(pidfd)
+    finally:
+        os.close(pidfd)
+    return proc.wait()
+
+
+# Warm worker pool. Each worker is a long-lived interpreter started with the
+# sandbox environment; per request it forks a fresh child that runs the
+# script, so runs never share interpreter state but skip Python startup.
+SANDBOX_POOL_SIZE_ENV = "WINGMAN_SANDBOX_POOL_SIZE"
+_DEFAULT_POOL_SIZE = 2
+
+# Request frame: u32 length + JSON {"script", "args", "env"}
+# Result frame: i32 returncode, u32 stdout length, u32 stderr length + bytes
+_REQUEST_HEADER = struct.Struct(">I")
+_RESULT_HEADER = struct.Struct(">iII")
+
+WORKER_LOOP = r'''
+import json
+import os
+import runpy
+import selectors
+import struct
+import sys
+import traceback
+
+_REQUEST_HEADER = struct.Struct(">I")
+_RESULT_HEADER = struct.Struct(">iII")
+
+
+def _read_exact(n):
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = os.read(0, n - len(buf))
+        if not chunk:
+            os._exit(0)
+        buf += chunk
+    return bytes(buf)
+
+
+def _write_all(data):
+    view = memoryview(data)
+    while view:
+        view = view[os.write(1, view):]
+
+
+def _run_child(request, out_w, err_w):
+    null_fd = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(null_fd, 0)
+    os.dup2(out_w, 1)
+    os.dup2(err_w, 2)
+    os.environ.update(request["env"])
+    script = request["script"]
+    sys.argv = [script] + request["args"]
+    sys.path[0] = os.path.dirname(os.path.abspath(script))
+    code = 0
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            code = e.code
+        elif e.code is not None:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    try:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    finally:
+        os._exit(code)
+
+
+while True:
+    (size,) = _REQUEST_HEADER.unpack(_read_exact(_REQUEST_HEADER.size))
+    request = json.loads(_read_exact(size))
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(out_r)
+        os.close(err_r)
+        _run_child(request, out_w, err_w)
+    os.close(out_w)
+    os.close(err_w)
+    chunks = {out_r: [], err_r: []}
+    with selectors.DefaultSelector() as selector:
+        selector.register(out_r, selectors.EVENT_READ)
+        selector.register(err_r, selectors.EVENT_READ)
+        while selector.get_map():
+            for key, _ in selector.select():
+                chunk = os.read(key.fd, 65536)
+                if chunk:
+                    chunks[key.fd].append(chunk)
+                else:
+                    selector.unregister(key.fd)
+                    os.close(key.fd)
+    _, status = os.waitpid(pid, 0)
+    stdout = b"".join(chunks[out_r])
+    stderr = b"".join(chunks[err_r])
+    _write_all(
+        _RESULT_HEADER.pack(os.waitstatus_to_exitcode(status), len(stdout), len(stderr))
+        + stdout
+        + stderr
+    )
+'''
+
+
+class WorkerDiedError(RuntimeError):
+    """A pooled sandbox worker exited while handling a request."""
+
+
+async def _read_exact(fd: int, n: int) -> bytes:
+    """Read exactly n bytes from a worker's result pipe on the event loop."""
+    buf = bytearray()
+    while len(buf) < n:
+        await _readable(fd)
+        chunk = os.read(fd, n - len(buf))
+        if not chunk:
+            raise WorkerDiedError("Sandbox worker exited unexpectedly")
+        buf += chunk
+    return bytes(buf)
+
+
+async def _worker_roundtrip(
+    proc: subprocess.Popen,
+    request: bytes,
+) -> tuple[int, bytes, bytes]:
+    """Send one framed request to a worker and wait for its framed result.
+    
+    Returns (returncode, stdout, stderr). The caller bounds it with a timeout.
+    """
+    # Requests are a few hundred bytes, well under the pipe buffer, so the
+    # write does not block the loop
+    try:
+        proc.stdin.write(_REQUEST_HEADER.pack(len(request)) + request)
+        proc.stdin.flush()
+    except BrokenPipeError as e:
+        raise WorkerDiedError("Sandbox worker exited unexpectedly") from e
+    
+    fd = proc.stdout.fileno()
+    header = await _read_exact(fd, _RESULT_HEADER.size)
+    returncode, out_len, err_len = _RESULT_HEADER.unpack(header)
+    body = await _read_exact(fd, out_len + err_len)
+    
+    return returncode, body[:out_len], body[out_len:]
+
+
+class _WorkerPool:
+    """Pre-spawned sandbox workers, checked out for one request at a time."""
+    
+    def __init__(self) -> None:
+        self._idle: list[subprocess.Popen] = []
+        self._workers: set[subprocess.Popen] = set()
+        self._size = 0
+        self._env: dict[str, str] = {}
+        self._pass_fds: tuple[int, ...] = ()
+    
+    @property
+    def size(self) -> int:
+        return self._size
+    
+    def _spawn(self) -> subprocess.Popen:
+        """Start one worker (blocking; call from the spawn executor)."""
+        return subprocess.Popen(
+            ["python3", "-c", WORKER_LOOP],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=self._env,
+            pass_fds=self._pass_fds,
+            # Own process group, so a kill also reaches the forked script
+            start_new_session=True,
+        )
+    
+    @staticmethod
+    def _kill(proc: subprocess.Popen) -> None:
+        """Kill a worker and the script it may be running, then reap it."""
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        proc.stdin.close()
+        proc.stdout.close()
+        proc.wait()
+    
+    async def start(self, size: int, env: dict[str, str], pass_fds: tuple[int, ...]) -> None:
+        """Spawn size workers sharing env and the inherited fds."""
+        self._size = size
+        self._env = env
+        self._pass_fds = pass_fds
+        
+        await asyncio.gather(*(
+            self._add_worker()
+            for _ in range(size - len(self._workers))
+        ))
+    
+    async def _add_worker(self) -> None:
+        """Spawn one worker and make it available as soon as it is up."""
+        proc = await _spawn_in_executor(self._spawn, self._kill)
+        self._workers.add(proc)
+        self._idle.append(proc)
+    
+    def stop(self) -> None:
+        """Kill every worker, idle or busy."""
+        self._size = 0
+        self._idle.clear()
+        for proc in self._workers:
+            self._kill(proc)
+        self._workers.clear()
+    
+    def acquire(self) -> subprocess.Popen | None:
+        """Check out a live idle worker, or None if the pool is exhausted."""
+        while self._idle:
+            proc = self._idle.pop()
+            if proc.poll() is None:
+                return proc
+            # Died while idle: reap and replace it
+            self.replace(proc)
+        return None
+    
+    def release(self, proc: subprocess.Popen) -> None:
+        """Return a healthy worker to the pool."""
+        if proc in self._workers:
+            self._idle.append(proc)
+    
+    def replace(self, proc: subprocess.Popen) -> None:
+        """Kill a worker and spawn its replacement in the background."""
+        self._workers.discard(proc)
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(_get_spawn_executor(), self._recycle, proc)
+        future.add_done_callback(self._on_recycled)
+    
+    def _recycle(self, proc: subprocess.Popen) -> subprocess.Popen | None:
+        self._kill(proc)
+        if len(self._workers) >= self._size:
+            return None
+        return self._spawn()
+    
+    def _on_recycled(self, future: asyncio.Future) -> None:
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            logger.warning("Failed to replace sandbox worker: %s", future.exception())
+            return
+        proc = future.result()
+        if proc is None:
+            return
+        if len(self._workers) >= self._size:
+            # Pool was stopped or shrunk while we were spawning
+            self._kill(proc)
+            return
+        self._workers.add(proc)
+        self._idle.append(proc)
+
+
+_worker_pool = _WorkerPool()
+
+
+async def start_worker_pool(size: int | None = None) -> None:
+    """Pre-spawn warm sandbox workers.
+    
+    Args:
+        size: Number of workers; defaults to WINGMAN_SANDBOX_POOL_SIZE
+            (or 2). Zero disables the pool.
+    """
+    if size is None:
+        size = int(os.environ.get(SANDBOX_POOL_SIZE_ENV, _DEFAULT_POOL_SIZE))
+    if size <= 0:
+        return
+    
+    policy_fd, policy_format = await _get_policy_fd()
+    env = dict(_BASE_ENV)
+    env[SECCOMP_FD_ENV] = str(policy_fd)
+    env[SECCOMP_FORMAT_ENV] = policy_format
+    
+    await _worker_pool.start(size, env, (policy_fd,))
+    logger.info("Started %d sandbox workers", size)
+
+
+def stop_worker_pool() -> None:
+    """Kill all pooled sandbox workers."""
+    _worker_pool.stop()
+
+
+async def _run_in_worker(
+    proc: subprocess.Popen,
+    script_path: Path,
+    args: list[str],
+    timeout: int,
+    env: dict[str, str],
+) -> dict[str, Any]:
+    """Run one script on a checked-out pool worker."""
+    request = json.dumps({
+        "script": str(script_path),
+        "args": args,
+        "env": env,
+    }).encode()
+    
+    try:
+        returncode, stdout, stderr = await asyncio.wait_for(
+            _worker_roundtrip(proc, request),
+            timeout=timeout,
+        )
+    except asyncio.TimeoutError:
+        _worker_pool.replace(proc)
+        raise TimeoutError(f"Script execution exceeded {timeout}s timeout")
+    except BaseException:
+        # Worker state is unknown (died, or cancelled mid-request)
+        _worker_pool.replace(proc)
+        raise
+    
+    _worker_pool.release(proc)
+    
+    return {
+        "stdout": stdout.decode("utf-8", errors="replace"),
+        "stderr": stderr.decode("utf-8", errors="replace"),
+        "returncode": returncode,
+    }
+
 
 async def run_sandboxed_linux(
     script_path: Path,
     args: list[str] | None = None,
     timeout: int = 60,
     env: dict[str, str] | None = None,
+    stream_callback: Callable[[bytes], None] | None = None,
 ) -> dict[str, Any]:
     """Run script in sandboxed subprocess with seccomp.
     
@@ -75,6 +618,11 @@ async def run_sandboxed_linux(
         args: Command-line arguments
         timeout: Execution timeout in seconds
         env: Environment variables (restricted)
+        stream_callback: Receives stdout/stderr chunks as they arrive;
+            when set, the returned stdout/stderr are empty
+    
+    Non-streaming runs go to a warm pool worker when one is idle; otherwise
+    a fresh interpreter is spawned.
     
     Returns:
         Execution result with stdout, stderr, returncode
@@ -84,73 +632,85 @@ async def run_sandboxed_linux(
         subprocess.CalledProcessError: If script fails
     """
     args = args or []
+    safe_env = {k: v for k, v in env.items() if k in SAFE_ENV_KEYS} if env else {}
     
-    # Write seccomp policy to temp file
-    policy_path = Path("/tmp") / f"seccomp-{script_path.stem}.json"
+    if stream_callback is None:
+        worker = _worker_pool.acquire()
+        if worker is not None:
+            logger.info("Running sandboxed (Linux, pooled): %s", script_path)
+            return await _run_in_worker(worker, script_path, args, timeout, safe_env)
     
-    try:
-        with open(policy_path, "w") as f:
-            json.dump(SECCOMP_POLICY, f)
-        
-        # Prepare environment (minimal, isolated)
-        sandbox_env = {
-            "PYTHONPATH": "",  # Isolate from system packages
-            "PATH": "/usr/bin:/bin",  # Minimal PATH
-            "HOME": "/tmp",  # Isolated home
-        }
-        
-        if env:
-            # Only allow safe environment variables
-            safe_keys = {"PLUGIN_DATA", "PLUGIN_CONFIG"}
-            for key, value in env.items():
-                if key in safe_keys:
-                    sandbox_env[key] = value
-        
-        # Run with seccomp (requires libseccomp)
-        # Note: This requires the script to set up seccomp itself
-        # or use a wrapper like firejail
-        cmd = ["python3", str(script_path)] + args
-        
-        logger.info(f"Running sandboxed (Linux): {cmd}")
-        
-        result = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+    # Precompiled seccomp program, shared by every invocation
+    policy_fd, policy_format = await _get_policy_fd()
+    
+    # Prepare environment (minimal, isolated), passing through only safe keys
+    sandbox_env = dict(_BASE_ENV)
+    sandbox_env.update(safe_env)
+    
+    # The child inherits the policy memfd. Multiple children share its file
+    # offset, so it must be read with os.pread(fd, size, 0) or by opening
+    # /proc/self/fd/<fd>.
+    sandbox_env[SECCOMP_FD_ENV] = str(policy_fd)
+    sandbox_env[SECCOMP_FORMAT_ENV] = policy_format
+    
+    # Run with seccomp (requires libseccomp)
+    # Note: This requires the script to install the inherited filter itself
+    # (prctl(PR_SET_SECCOMP, SECCOMP_MODE_FILTER, ...)) once its own startup
+    # is done, or use a wrapper like firejail
+    cmd = ["python3", str(script_path)] + args
+    
+    logger.info("Running sandboxed (Linux): %s", cmd)
+    
+    result = await _spawn_in_executor(
+        functools.partial(
+            subprocess.Popen,
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             env=sandbox_env,
+            pass_fds=(policy_fd,),
+        ),
+        _kill_and_reap,
+    )
+    
+    try:
+        stdout, stderr, _ = await asyncio.wait_for(
+            asyncio.gather(
+                _read_pipe(result.stdout, stream_callback),
+                _read_pipe(result.stderr, stream_callback),
+                _wait_child(result),
+            ),
+            timeout=timeout
         )
-        
-        try:
-            stdout, stderr = await asyncio.wait_for(
-                result.communicate(),
-                timeout=timeout
-            )
-        except asyncio.TimeoutError:
-            result.kill()
-            await result.wait()
-            raise TimeoutError(f"Script execution exceeded {timeout}s timeout")
-        
-        return {
-            "stdout": stdout.decode("utf-8", errors="replace"),
-            "stderr": stderr.decode("utf-8", errors="replace"),
-            "returncode": result.returncode,
-        }
+    except asyncio.TimeoutError:
+        result.kill()
+        await _wait_child(result)
+        raise TimeoutError(f"Script execution exceeded {timeout}s timeout")
+    except asyncio.CancelledError:
+        result.kill()
+        # Reap the child even if this task is cancelled again while waiting
+        await asyncio.shield(_wait_child(result))
+        raise
     
-    finally:
-        # Clean up policy file
-        if policy_path.exists():
-            policy_path.unlink()
+    return {
+        "stdout": stdout.decode("utf-8", errors="replace"),
+        "stderr": stderr.decode("utf-8", errors="replace"),
+        "returncode": result.returncode,
+    }
 
 
+@functools.lru_cache(maxsize=1)
 def is_seccomp_available() -> bool:
-    """Check if seccomp is available on this system."""
+    """Check if seccomp is available on this system.
+    
+    Probes libseccomp in-process (no helper interpreter) and caches the result.
+    """
+    if sys.platform != "linux":
+        return False
+    
     try:
         # Check if libseccomp is available
-        result = subprocess.run(
-            ["python3", "-c", "import ctypes; ctypes.CDLL('libseccomp.so.2')"],
-            capture_output=True,
-            timeout=5,
-        )
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+        ctypes.CDLL("libseccomp.so.2")
+        return True
+    except OSError:
         return False
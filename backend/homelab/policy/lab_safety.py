@@ -8,10 +8,13 @@ Ensures LAB mode:
 """
 
 import os
+import re
+import time
 import logging
 from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import datetime, timezone
-from typing import Optional
+from typing import NamedTuple, Optional
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -27,18 +30,78 @@ class LabModeViolation(SafetyViolation):
     pass
 
 
-@dataclass
+# Environment variables that feed LabSafetyConfig.from_env()
+_CONFIG_ENV_VARS = (
+    "WINGMAN_CONTAINER_ALLOWLIST",
+    "WINGMAN_VM_ALLOWLIST",
+    "WINGMAN_NODE_ALLOWLIST",
+    "WINGMAN_ALLOW_DANGEROUS_OPS",
+    "WINGMAN_READ_ONLY",
+)
+
+# Skill classification patterns. Read-only skills either start with a
+# read-only category prefix or contain a read-only verb; dangerous skills
+# contain a destructive verb anywhere (case-insensitive).
+READ_ONLY_SKILL_PREFIXES = ("diag-", "health-", "mon-", "inv-")
+READ_ONLY_SKILL_VERBS = ("collect", "inspect", "list", "status", "check")
+DANGEROUS_SKILL_PATTERNS = (
+    "prune", "delete", "remove", "destroy",
+    "force", "rollback", "snapshot",
+)
+
+
+def _compile_alternation(patterns: tuple[str, ...], flags: int = 0) -> re.Pattern:
+    """Compile literal patterns into one alternation, scanned once in C.
+    
+    Longest-first ordering keeps matches deterministic when one pattern is
+    a prefix of another, however large the pattern set grows.
+    """
+    ordered = sorted(set(patterns), key=len, reverse=True)
+    return re.compile("|".join(re.escape(p) for p in ordered), flags)
+
+
+_READ_ONLY_VERB_RE = _compile_alternation(READ_ONLY_SKILL_VERBS)
+_DANGEROUS_RE = _compile_alternation(DANGEROUS_SKILL_PATTERNS, re.IGNORECASE)
+
+# Parsed configs keyed by the raw values of _CONFIG_ENV_VARS
+_CONFIG_CACHE: dict[tuple[str, ...], "LabSafetyConfig"] = {}
+_CONFIG_CACHE_MAX = 16
+
+
+def _split_allowlist(value: str) -> tuple[str, ...]:
+    """Parse a comma-separated allowlist env value."""
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+
+def _minimal_prefixes(allowlist: tuple[str, ...]) -> tuple[str, ...]:
+    """Shortest-first prefixes, dropping entries already covered by a shorter one.
+    
+    The result feeds a single C-level str.startswith(tuple) call, so keeping
+    it small and putting broad prefixes first shortens every lookup.
+    """
+    prefixes: list[str] = []
+    for entry in sorted(set(allowlist), key=len):
+        if not entry.startswith(tuple(prefixes)):
+            prefixes.append(entry)
+    return tuple(prefixes)
+
+
+@dataclass(frozen=True)
 class LabSafetyConfig:
-    """Configuration for LAB mode safety."""
+    """Configuration for LAB mode safety.
+    
+    Immutable once constructed, so derived lookup forms and the API dict
+    are computed at most once per instance.
+    """
     
     # LAB mode can only be enabled via these env vars (fail-closed)
     required_env_var: str = "WINGMAN_EXECUTION_MODE"
     required_value: str = "lab"
     
     # Allowlists - must be non-empty in LAB mode
-    container_allowlist: list[str] = field(default_factory=list)
-    vm_allowlist: list[str] = field(default_factory=list)  # Proxmox VM IDs
-    node_allowlist: list[str] = field(default_factory=list)  # Proxmox nodes
+    container_allowlist: tuple[str, ...] = ()
+    vm_allowlist: tuple[str, ...] = ()  # Proxmox VM IDs
+    node_allowlist: tuple[str, ...] = ()  # Proxmox nodes
     
     # Dangerous operations require additional opt-in
     dangerous_ops_enabled: bool = False
@@ -48,33 +111,50 @@ class LabSafetyConfig:
     read_only_mode: bool = False
     read_only_env_var: str = "WINGMAN_READ_ONLY"
     
+    # Lookup forms of the allowlists, derived in __post_init__
+    container_allowlist_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    container_prefixes: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    vm_allowlist_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    node_allowlist_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "container_allowlist_set", frozenset(self.container_allowlist))
+        object.__setattr__(
+            self, "container_prefixes", _minimal_prefixes(self.container_allowlist)
+        )
+        object.__setattr__(self, "vm_allowlist_set", frozenset(self.vm_allowlist))
+        object.__setattr__(self, "node_allowlist_set", frozenset(self.node_allowlist))
+    
     @classmethod
     def from_env(cls) -> "LabSafetyConfig":
-        """Load LAB safety config from environment."""
-        config = cls()
+        """Load LAB safety config from environment.
         
-        # Load allowlists from comma-separated env vars
-        container_list = os.environ.get("WINGMAN_CONTAINER_ALLOWLIST", "")
-        if container_list:
-            config.container_allowlist = [c.strip() for c in container_list.split(",") if c.strip()]
+        Parsed configs are cached by the raw env values, so repeated calls
+        only re-parse when one of the variables actually changed.
+        """
+        environ = os.environ
+        env_key = tuple(environ.get(name, "") for name in _CONFIG_ENV_VARS)
         
-        vm_list = os.environ.get("WINGMAN_VM_ALLOWLIST", "")
-        if vm_list:
-            config.vm_allowlist = [v.strip() for v in vm_list.split(",") if v.strip()]
+        cached = _CONFIG_CACHE.get(env_key)
+        if cached is not None:
+            return cached
         
-        node_list = os.environ.get("WINGMAN_NODE_ALLOWLIST", "")
-        if node_list:
-            config.node_allowlist = [n.strip() for n in node_list.split(",") if n.strip()]
+        container_list, vm_list, node_list, dangerous_ops, read_only = env_key
         
-        # Dangerous operations opt-in
-        config.dangerous_ops_enabled = os.environ.get(
-            config.dangerous_ops_env_var, ""
-        ).lower() in ("true", "1", "yes")
+        config = cls(
+            # Load allowlists from comma-separated env vars
+            container_allowlist=_split_allowlist(container_list),
+            vm_allowlist=_split_allowlist(vm_list),
+            node_allowlist=_split_allowlist(node_list),
+            # Dangerous operations opt-in
+            dangerous_ops_enabled=dangerous_ops.lower() in ("true", "1", "yes"),
+            # Read-only mode
+            read_only_mode=read_only.lower() in ("true", "1", "yes"),
+        )
         
-        # Read-only mode
-        config.read_only_mode = os.environ.get(
-            config.read_only_env_var, ""
-        ).lower() in ("true", "1", "yes")
+        if len(_CONFIG_CACHE) >= _CONFIG_CACHE_MAX:
+            _CONFIG_CACHE.clear()
+        _CONFIG_CACHE[env_key] = config
         
         return config
     
@@ -86,16 +166,20 @@ class LabSafetyConfig:
             self.node_allowlist
         )
     
-    def to_dict(self) -> dict:
-        """Convert to dictionary for API responses."""
+    @cached_property
+    def _dict(self) -> dict:
         return {
-            "container_allowlist": self.container_allowlist,
-            "vm_allowlist": self.vm_allowlist,
-            "node_allowlist": self.node_allowlist,
+            "container_allowlist": list(self.container_allowlist),
+            "vm_allowlist": list(self.vm_allowlist),
+            "node_allowlist": list(self.node_allowlist),
             "dangerous_ops_enabled": self.dangerous_ops_enabled,
             "read_only_mode": self.read_only_mode,
             "has_allowlists": self.has_any_allowlist(),
         }
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for API responses (built once, then shared)."""
+        return self._dict
 
 
 class LabModeStatus(str, Enum):
@@ -122,8 +206,19 @@ class LabSafetyStatus:
     
     config: Optional[LabSafetyConfig] = None
     
+    _dict_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    
     def to_dict(self) -> dict:
-        """Convert to dictionary for API responses."""
+        """Convert to dictionary for API responses.
+        
+        Statuses are replaced rather than mutated (see refresh_config), so the
+        dict is built on first use and reused afterwards.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return self._dict_cache
+    
+    def _build_dict(self) -> dict:
         return {
             "status": self.status.value,
             "is_lab_mode": self.is_lab_mode,
@@ -137,26 +232,41 @@ class LabSafetyStatus:
         }
 
 
+# How long get_status() serves a computed status before re-checking the env
+STATUS_TTL_SECONDS = 1.0
+
+
+class _State(NamedTuple):
+    """Snapshot of a computed LAB status, replaced wholesale on recompute."""
+    
+    config: LabSafetyConfig
+    status: LabSafetyStatus
+    computed_at: datetime
+    lab_requested: bool
+    expires_at: float  # time.monotonic() deadline for get_status()
+
+
 class LabSafetyEnforcer:
-    """Enforces LAB mode safety policies."""
+    """Enforces LAB mode safety policies.
+    
+    The enforcer is a shared singleton; its computed state lives in a single
+    immutable `_State` that is swapped by one reference assignment, so
+    concurrent readers always see a consistent config/status pair without
+    locking.
+    """
     
     def __init__(self):
-        self._config: Optional[LabSafetyConfig] = None
-        self._status: Optional[LabSafetyStatus] = None
-        self._last_check: Optional[datetime] = None
+        self._state: Optional[_State] = None
     
     @property
     def config(self) -> LabSafetyConfig:
-        """Get or load safety config."""
-        if self._config is None:
-            self._config = LabSafetyConfig.from_env()
-        return self._config
+        """Get safety config for the current environment (cached by env values)."""
+        return LabSafetyConfig.from_env()
     
     def refresh_config(self) -> LabSafetyConfig:
         """Reload config from environment."""
-        self._config = LabSafetyConfig.from_env()
-        self._status = None  # Force status recalculation
-        return self._config
+        self._state = None  # Force status recalculation
+        return self.config
     
     def is_lab_mode_requested(self) -> bool:
         """Check if LAB mode was explicitly requested via env var."""
@@ -171,12 +281,39 @@ class LabSafetyEnforcer:
         - Must be explicitly requested via WINGMAN_EXECUTION_MODE=lab
         - Must have at least one allowlist configured
         - Dangerous ops must be explicitly enabled
-        """
-        warnings = []
-        blockers = []
         
+        The status is only rebuilt when the relevant environment changed
+        (or after refresh_config()); otherwise the cached one is returned.
+        """
         is_lab_requested = self.is_lab_mode_requested()
         config = self.config
+        expires_at = time.monotonic() + STATUS_TTL_SECONDS
+        
+        # from_env() returns the same config object until the env changes
+        state = self._state
+        if (
+            state is not None
+            and state.config is config
+            and state.lab_requested == is_lab_requested
+        ):
+            self._state = state._replace(expires_at=expires_at)
+            return state.status
+        
+        status = self._build_status(config, is_lab_requested)
+        self._state = _State(
+            config, status, datetime.now(timezone.utc), is_lab_requested, expires_at
+        )
+        
+        return status
+    
+    def _build_status(
+        self,
+        config: LabSafetyConfig,
+        is_lab_requested: bool,
+    ) -> LabSafetyStatus:
+        """Compute LAB safety status for a config."""
+        warnings = []
+        blockers = []
         
         if not is_lab_requested:
             # Not requesting LAB mode - safe default
@@ -211,18 +348,19 @@ class LabSafetyEnforcer:
             status = LabModeStatus.BLOCKED
             is_lab_mode = False
             is_fail_safe = True  # We're safe because we blocked it
-            logger.warning(f"[LabSafety] LAB mode BLOCKED: {blockers}")
+            logger.warning("[LabSafety] LAB mode BLOCKED: %s", blockers)
         else:
             status = LabModeStatus.ARMED
             is_lab_mode = True
             is_fail_safe = False  # We're in danger zone
-            logger.info(f"[LabSafety] LAB mode ARMED with allowlists: {config.to_dict()}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("[LabSafety] LAB mode ARMED with allowlists: %s", config.to_dict())
             if not warnings:
                 warnings.append(
                     "🔴 LAB mode is ARMED. Operations will affect real infrastructure."
                 )
         
-        self._status = LabSafetyStatus(
+        return LabSafetyStatus(
             status=status,
             is_lab_mode=is_lab_mode,
             is_fail_safe=is_fail_safe,
@@ -233,15 +371,13 @@ class LabSafetyEnforcer:
             blockers=blockers,
             config=config,
         )
-        self._last_check = datetime.now(timezone.utc)
-        
-        return self._status
     
     def get_status(self) -> LabSafetyStatus:
-        """Get current LAB safety status."""
-        if self._status is None:
+        """Get current LAB safety status (re-checked at most every STATUS_TTL_SECONDS)."""
+        state = self._state
+        if state is None or time.monotonic() >= state.expires_at:
             return self.validate_lab_mode()
-        return self._status
+        return state.status
     
     def require_lab_mode(self) -> LabSafetyStatus:
         """
@@ -262,22 +398,28 @@ class LabSafetyEnforcer:
         self,
         target: str,
         target_type: str = "container",
+        config: Optional[LabSafetyConfig] = None,
     ) -> tuple[bool, str]:
         """
         Check if a target is in the allowlist.
         
+        `config` lets a caller check against the snapshot it already
+        decided on; by default the current config is read.
+        
         Returns (is_allowed, reason).
         """
-        config = self.config
+        if config is None:
+            config = self.config
         
         if target_type == "container":
             if not config.container_allowlist:
                 return False, "No containers in allowlist"
             
             # Check exact match or prefix match
-            for allowed in config.container_allowlist:
-                if target == allowed or target.startswith(allowed):
-                    return True, f"Container '{target}' matches allowlist entry '{allowed}'"
+            if target in config.container_allowlist_set or target.startswith(
+                config.container_prefixes
+            ):
+                return True, f"Container '{target}' matches allowlist"
             
             return False, f"Container '{target}' not in allowlist: {config.container_allowlist}"
         
@@ -285,7 +427,7 @@ class LabSafetyEnforcer:
             if not config.vm_allowlist:
                 return False, "No VMs in allowlist"
             
-            if target in config.vm_allowlist:
+            if target in config.vm_allowlist_set:
                 return True, f"VM '{target}' in allowlist"
             
             return False, f"VM '{target}' not in allowlist: {config.vm_allowlist}"
@@ -294,7 +436,7 @@ class LabSafetyEnforcer:
             if not config.node_allowlist:
                 return False, "No nodes in allowlist"
             
-            if target in config.node_allowlist:
+            if target in config.node_allowlist_set:
                 return True, f"Node '{target}' in allowlist"
             
             return False, f"Node '{target}' not in allowlist: {config.node_allowlist}"
@@ -314,7 +456,8 @@ class LabSafetyEnforcer:
         Returns (is_allowed, reason).
         """
         status = self.get_status()
-        config = self.config
+        # Use the config the status was computed from, not a fresh read
+        config = status.config or self.config
         
         # If not in LAB mode, block real operations
         if not status.is_lab_mode:
@@ -327,7 +470,7 @@ class LabSafetyEnforcer:
                 return False, f"Read-only mode enabled, skill '{skill_id}' blocked"
         
         # Check if target is in allowlist
-        target_allowed, target_reason = self.check_target_allowed(target, target_type)
+        target_allowed, target_reason = self.check_target_allowed(target, target_type, config)
         if not target_allowed:
             return False, target_reason
         
@@ -340,19 +483,14 @@ class LabSafetyEnforcer:
     
     def _is_read_only_skill(self, skill_id: str) -> bool:
         """Check if a skill is read-only (safe in read-only mode)."""
-        read_only_prefixes = (
-            "diag-", "health-", "mon-", "inv-",
-            "collect", "inspect", "list", "status", "check",
+        return (
+            skill_id.startswith(READ_ONLY_SKILL_PREFIXES)
+            or _READ_ONLY_VERB_RE.search(skill_id) is not None
         )
-        return any(skill_id.startswith(prefix) or prefix in skill_id for prefix in read_only_prefixes)
     
     def _is_dangerous_skill(self, skill_id: str) -> bool:
         """Check if a skill is dangerous (requires explicit opt-in)."""
-        dangerous_patterns = (
-            "prune", "delete", "remove", "destroy",
-            "force", "rollback", "snapshot",
-        )
-        return any(pattern in skill_id.lower() for pattern in dangerous_patterns)
+        return _DANGEROUS_RE.search(skill_id) is not None
     
     def get_banner_message(self) -> Optional[str]:
         """Get banner message for UI display."""
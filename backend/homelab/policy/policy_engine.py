@@ -1,23 +1,27 @@
 """Policy engine for Guide Mode validation."""
 
-from typing import Any
-from datetime import datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping
+from datetime import datetime, timedelta, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, union_all
 
+from homelab.config import get_settings
 from homelab.control_plane.plan_proposal import PlanProposal, PlanStep
 from homelab.storage.models import ActionTemplate, ActionHistory
+from homelab.policy.rate_limiter import action_rate_limiter
 
 
 # Safe actions that can be proposed
-ALLOWED_ACTIONS = {
+ALLOWED_ACTIONS = frozenset({
     ActionTemplate.restart_resource,
     ActionTemplate.start_resource,
     ActionTemplate.stop_resource,
     ActionTemplate.collect_diagnostics,
     ActionTemplate.create_snapshot,
     # Future: extend to VM or LXC-specific templates
-}
+})
 
 # Map skill IDs to action templates for policy validation
 SKILL_TO_ACTION_MAP = {
@@ -37,17 +41,84 @@ SKILL_TO_ACTION_MAP = {
 MAX_PLAN_STEPS = 10
 
 # Actions that require explicit confirmation
-DANGEROUS_ACTIONS = {
+DANGEROUS_ACTIONS = frozenset({
     ActionTemplate.stop_resource,
-}
+})
 
-# Resources that should never be touched automatically
-DENIED_RESOURCES = {
+# Resources that should never be touched automatically. An entry ending in
+# "*" denies every target starting with the text before it.
+DENIED_RESOURCES = frozenset({
     "docker://storage-controller",
     "proxmox://pve/lxc/100", # Example critical container
-}
+})
+
+# Valid target URI schemes
+TARGET_SCHEMES = ("docker://", "proxmox://")
 
 MAX_ACTIONS_PER_HOUR = 3
+RATE_LIMIT_WINDOW = timedelta(hours=1)
+
+
+# Marks the end of a denied prefix in ResourceDenylist's trie
+_PREFIX_END = ""
+
+
+class ResourceDenylist:
+    """Denied resource URIs, matched exactly or by wildcard prefix.
+    
+    Exact entries are a set lookup. "prefix*" entries live in a character
+    trie, so a check walks the target once however many prefixes there are.
+    """
+    
+    __slots__ = ("_exact", "_prefixes", "_deny_all")
+    
+    def __init__(self, patterns: Iterable[str]):
+        self._exact: set[str] = set()
+        self._prefixes: dict[str, dict] = {}
+        self._deny_all = False
+        
+        for pattern in patterns:
+            if not pattern.endswith("*"):
+                self._exact.add(pattern)
+                continue
+            prefix = pattern[:-1]
+            if not prefix:
+                self._deny_all = True
+            node = self._prefixes
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node[_PREFIX_END] = {}
+    
+    def __contains__(self, target: str) -> bool:
+        if self._deny_all or target in self._exact:
+            return True
+        
+        node = self._prefixes
+        for char in target:
+            node = node.get(char)
+            if node is None:
+                return False
+            if _PREFIX_END in node:
+                return True
+        return False
+
+
+# Effective policy lists, built once and cleared by PolicyEngine.reload()
+@lru_cache(maxsize=1)
+def _load_allowed_actions() -> frozenset[ActionTemplate]:
+    return ALLOWED_ACTIONS
+
+
+@lru_cache(maxsize=1)
+def _load_denied_resources() -> ResourceDenylist:
+    """Built-in denylist plus POLICY_DENIED_RESOURCES from settings."""
+    extra = get_settings().policy_denied_resources
+    return ResourceDenylist(DENIED_RESOURCES | {r.strip() for r in extra.split(",") if r.strip()})
+
+
+@lru_cache(maxsize=1)
+def _load_skill_map() -> Mapping[str, ActionTemplate]:
+    return MappingProxyType(dict(SKILL_TO_ACTION_MAP))
 
 
 class PolicyViolation(Exception):
@@ -75,21 +146,34 @@ class PolicyEngine:
         if len(plan.steps) == 0:
             violations.append("Plan has no steps")
         
-        # Validate each step
+        # Single pass: per-step checks, duplicate targets, rate-limit pairs
+        seen_targets: set[str] = set()
+        pairs: dict[tuple[str, ActionTemplate], None] = {}  # ordered, unique
+        
         for step in plan.steps:
             step_violations = self._validate_step(step)
             violations.extend(step_violations)
             
-            # Rate Limiting Check
-            if step.target:
-                is_limited, limit_msg = await self._check_rate_limit(db, step.target, step.action)
-                if is_limited:
-                    violations.append(limit_msg)
+            if step.target in seen_targets:
+                violations.append(f"Duplicate target '{step.target}' (potential conflict)")
+                continue
+            seen_targets.add(step.target)
+            
+            # Cheap checks first: steps that already fail skip the rate-limit lookup
+            if not step_violations:
+                pairs[(step.target, step.action)] = None
+        
+        # Rate Limiting Check: counts for every pair at once, against one
+        # UTC cutoff computed per validation
+        cutoff = datetime.now(timezone.utc) - RATE_LIMIT_WINDOW
+        recent_counts = await self._recent_counts(db, pairs, cutoff)
         
-        # Check for duplicate targets
-        targets = [s.target for s in plan.steps]
-        if len(targets) != len(set(targets)):
-            violations.append("Plan contains duplicate targets (potential conflict)")
+        for target, action in pairs:
+            count = recent_counts.get((target, action), 0)
+            if count >= MAX_ACTIONS_PER_HOUR:
+                violations.append(
+                    f"Rate limit exceeded for {target} ({count}+ actions in last hour)"
+                )
         
         return len(violations) == 0, violations
     
@@ -98,7 +182,7 @@ class PolicyEngine:
         violations = []
         
         # Check action is allowed
-        if step.action not in ALLOWED_ACTIONS:
+        if step.action not in _load_allowed_actions():
             violations.append(f"Action '{step.action.value}' is not allowed")
         
         # Check target is specified
@@ -106,31 +190,96 @@ class PolicyEngine:
             violations.append(f"Step {step.order} has no target")
         
         # Check Denylist
-        if step.target in DENIED_RESOURCES:
+        if step.target in _load_denied_resources():
             violations.append(f"Target '{step.target}' is in the DENYLIST")
         
         # Validate target format
-        if not step.target.startswith(("docker://", "proxmox://")):
+        if not step.target.startswith(TARGET_SCHEMES):
             violations.append(f"Step {step.order} has invalid target format")
         
         return violations
     
-    async def _check_rate_limit(self, db: AsyncSession, target: str, action: ActionTemplate) -> tuple[bool, str | None]:
-        """Check if action rate limit is exceeded for target."""
-        # Check actions on this target in the last hour
-        one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
-        
-        query = select(func.count()).select_from(ActionHistory).where(
-            ActionHistory.target_resource == target,
-            ActionHistory.action_template == action,
-            ActionHistory.executed_at >= one_hour_ago
+    async def _recent_counts(
+        self,
+        db: AsyncSession,
+        pairs: Iterable[tuple[str, ActionTemplate]],
+        since: datetime | None = None,
+    ) -> dict[tuple[str, ActionTemplate], int]:
+        """Count recent actions per pair: in-process cache, then Redis, then SQL.
+        
+        Pairs Redis has not tracked for a full window are counted with SQL.
+        """
+        counts, misses = action_rate_limiter.cached_counts(pairs)
+        if not misses:
+            return counts
+        
+        fetched = await action_rate_limiter.count_recent(misses) or {}
+        cold = [pair for pair in misses if pair not in fetched]
+        if cold:
+            if since is None:
+                since = datetime.now(timezone.utc) - RATE_LIMIT_WINDOW
+            found = await self._count_recent_actions(db, cold, since)
+            fetched.update((pair, found.get(pair, 0)) for pair in cold)
+        
+        action_rate_limiter.remember_counts(fetched)
+        counts.update(fetched)
+        return counts
+    
+    async def _count_recent_actions(
+        self,
+        db: AsyncSession,
+        pairs: Iterable[tuple[str, ActionTemplate]],
+        since: datetime,
+    ) -> dict[tuple[str, ActionTemplate], int]:
+        """Count actions per (target, action) pair since a cutoff in one query.
+        
+        Counts are capped at MAX_ACTIONS_PER_HOUR: each pair's rows come from
+        its own LIMITed index range scan, so the work per pair stays constant
+        however much history the target has.
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return {}
+        
+        capped = union_all(*(
+            select(ActionHistory.target_resource, ActionHistory.action_template)
+            .where(
+                ActionHistory.target_resource == target,
+                ActionHistory.action_template == action,
+                ActionHistory.executed_at >= since,
+            )
+            .limit(MAX_ACTIONS_PER_HOUR)
+            .subquery()
+            .select()
+            for target, action in pairs
+        )).subquery()
+        
+        query = (
+            select(capped.c.target_resource, capped.c.action_template, func.count())
+            .group_by(capped.c.target_resource, capped.c.action_template)
         )
         
         result = await db.execute(query)
-        count = result.scalar() or 0
+        return {(target, action): count for target, action, count in result.all()}
+    
+    async def _check_rate_limit(
+        self,
+        db: AsyncSession,
+        target: str,
+        action: ActionTemplate,
+        since: datetime | None = None,
+    ) -> tuple[bool, str | None]:
+        """Check if action rate limit is exceeded for target.
         
+        `since` is the window cutoff; callers checking several targets should
+        compute it once and pass it in.
+        """
+        pair = (target, action)
+        counts = await self._recent_counts(db, [pair], since)
+        
+        count = counts.get(pair, 0)
         if count >= MAX_ACTIONS_PER_HOUR:
-            return True, f"Rate limit exceeded for {target} ({count} actions in last hour)"
+            return True, f"Rate limit exceeded for {target} ({count}+ actions in last hour)"
         
         return False, None
     
@@ -159,19 +308,19 @@ class PolicyEngine:
         violations = []
         
         # Map skill to action template
-        action = SKILL_TO_ACTION_MAP.get(skill_id)
+        action = _load_skill_map().get(skill_id)
         if action is None:
             # Unknown skill - allow but log warning
             pass
-        elif action not in ALLOWED_ACTIONS:
+        elif action not in _load_allowed_actions():
             violations.append(f"Skill action '{action.value}' is not allowed by policy")
         
         # Check target is not on denylist
-        if target in DENIED_RESOURCES:
+        if target in _load_denied_resources():
             violations.append(f"Target '{target}' is in the DENYLIST - skill execution blocked")
         
         # Validate target format
-        if not target.startswith(("docker://", "proxmox://")):
+        if not target.startswith(TARGET_SCHEMES):
             violations.append(f"Invalid target format: {target}")
         
         # Check rate limiting
@@ -184,9 +333,19 @@ class PolicyEngine:
     
     def is_skill_dangerous(self, skill_id: str) -> bool:
         """Check if a skill maps to a dangerous action requiring extra confirmation."""
-        action = SKILL_TO_ACTION_MAP.get(skill_id)
+        action = _load_skill_map().get(skill_id)
         return action in DANGEROUS_ACTIONS if action else False
     
+    def reload(self) -> None:
+        """Rebuild the allowed-action, denylist and skill-map caches on next use.
+        
+        Settings themselves are cached by get_settings(); clear that cache
+        first to pick up changed environment variables.
+        """
+        _load_allowed_actions.cache_clear()
+        _load_denied_resources.cache_clear()
+        _load_skill_map.cache_clear()
+    
     def is_guide_mode_required(self) -> bool:
         """
         Check if guide mode is required.
@@ -0,0 +1,166 @@
+"""Sliding-window action counters for policy rate limiting.
+
+When ``REDIS_URL`` is configured and the ``redis`` package is installed,
+executed actions are recorded in one Redis sorted set per (target, action),
+scored by execution time. Counting the last hour is then a
+ZREMRANGEBYSCORE + ZCARD pipeline instead of a COUNT over ActionHistory.
+
+A sorted set only holds actions recorded since Redis started tracking that
+pair, so each pair also has a "since" key set on its first record. Until a
+full window has passed since then (after Redis is enabled, restarted or
+flushed) the pair's count is reported as unknown.
+
+Without Redis (or when it is unreachable, or for pairs without a full
+window) counts are "unknown" and the policy engine falls back to its SQL
+query.
+
+Either way, counts are also cached in-process for a few seconds so bursts
+of validations for the same pair skip the round-trip. Recording an action
+drops that pair's cached count.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Iterable, Optional
+from uuid import uuid4
+
+from homelab.config import get_settings
+from homelab.storage.models import ActionTemplate
+
+
+logger = logging.getLogger(__name__)
+
+# Rate-limit window, matching the policy engine's one-hour lookback
+WINDOW_SECONDS = 3600
+
+# How long an in-process count may be reused
+LOCAL_CACHE_TTL_SECONDS = 10.0
+
+# Lifetime of a pair's "tracked since" key; once it lapses the pair needs a
+# fresh full window before Redis counts are trusted again
+SINCE_KEY_TTL_SECONDS = 30 * 24 * 3600
+
+
+def _window_key(target: str, action: ActionTemplate) -> str:
+    return f"rl:{target}:{action.value}"
+
+
+def _since_key(target: str, action: ActionTemplate) -> str:
+    return f"rl:since:{target}:{action.value}"
+
+
+class ActionRateLimiter:
+    """Redis sorted-set sliding window over executed actions."""
+
+    def __init__(self, redis_url: Optional[str] = None):
+        self._redis_url = redis_url
+        self._client = None
+        self._unavailable = False
+        # (target, action) -> (monotonic time cached, count)
+        self._local_counts: dict[tuple[str, ActionTemplate], tuple[float, int]] = {}
+
+    def _get_client(self):
+        """Get the Redis client, or None if Redis is not configured/installed."""
+        if self._client is not None or self._unavailable:
+            return self._client
+
+        redis_url = self._redis_url or get_settings().redis_url
+        if not redis_url:
+            self._unavailable = True
+            return None
+
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError:
+            logger.warning("[RateLimiter] REDIS_URL set but redis package not installed")
+            self._unavailable = True
+            return None
+
+        self._client = redis_asyncio.from_url(redis_url)
+        return self._client
+
+    def cached_counts(
+        self,
+        pairs: Iterable[tuple[str, ActionTemplate]],
+    ) -> tuple[dict[tuple[str, ActionTemplate], int], list[tuple[str, ActionTemplate]]]:
+        """Split pairs into fresh in-process counts and pairs that need a lookup."""
+        fresh_after = time.monotonic() - LOCAL_CACHE_TTL_SECONDS
+        counts = {}
+        misses = []
+        for pair in pairs:
+            entry = self._local_counts.get(pair)
+            if entry is not None and entry[0] > fresh_after:
+                counts[pair] = entry[1]
+            else:
+                misses.append(pair)
+        return counts, misses
+
+    def remember_counts(self, counts: dict[tuple[str, ActionTemplate], int]) -> None:
+        """Cache looked-up counts in-process for LOCAL_CACHE_TTL_SECONDS."""
+        now = time.monotonic()
+        self._local_counts.update((pair, (now, count)) for pair, count in counts.items())
+
+    async def count_recent(
+        self,
+        pairs: Iterable[tuple[str, ActionTemplate]],
+    ) -> Optional[dict[tuple[str, ActionTemplate], int]]:
+        """Count actions in the last window for each (target, action) pair.
+
+        Only pairs Redis has tracked for a full window are included; an
+        absent key is never taken as zero. Returns None when Redis is
+        unavailable. Callers count missing pairs with SQL.
+        """
+        client = self._get_client()
+        if client is None:
+            return None
+
+        pairs = list(pairs)
+        if not pairs:
+            return {}
+
+        cutoff_ms = int((time.time() - WINDOW_SECONDS) * 1000)
+
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for target, action in pairs:
+                    key = _window_key(target, action)
+                    pipe.get(_since_key(target, action))
+                    pipe.zremrangebyscore(key, 0, cutoff_ms)
+                    pipe.zcard(key)
+                results = await pipe.execute()
+        except Exception as e:
+            logger.warning("[RateLimiter] Redis count failed, falling back to SQL: %s", e)
+            return None
+
+        # Results come in (since, removed, count) triples per pair
+        return {
+            pair: int(count)
+            for pair, since, count in zip(pairs, results[0::3], results[2::3])
+            if since is not None and int(since) <= cutoff_ms
+        }
+
+    async def record(self, target: str, action: ActionTemplate) -> None:
+        """Record an executed action in its sliding window."""
+        self._local_counts.pop((target, action), None)
+
+        client = self._get_client()
+        if client is None:
+            return
+
+        now_ms = int(time.time() * 1000)
+        key = _window_key(target, action)
+
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.zadd(key, {f"{now_ms}:{uuid4().hex}": now_ms})
+                pipe.expire(key, WINDOW_SECONDS)
+                pipe.set(_since_key(target, action), now_ms, nx=True, ex=SINCE_KEY_TTL_SECONDS)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("[RateLimiter] Redis record failed for %s: %s", key, e)
+
+
+# Singleton
+action_rate_limiter = ActionRateLimiter()
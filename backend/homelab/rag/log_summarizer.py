@@ -1,14 +1,41 @@
 """Log Summarizer - Compresses historical logs into RAG-able summaries."""
 
+import asyncio
+import logging
 from collections import Counter
-from datetime import datetime, timedelta
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Sequence
+from uuid import uuid4
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from sqlalchemy import Row, select, func
 
 from homelab.storage.models import LogEntry, LogSummary
+from homelab.collectors.log_collector import match_error_keyword
 from homelab.rag.rag_indexer import rag_indexer, EmbeddingBlockedError
 from homelab.notifications.router import notification_router
 
+logger = logging.getLogger(__name__)
+
+# Logs sampled per resource for its summary
+LOG_SAMPLE_SIZE = 100
+
+# Rows per server-side cursor fetch when reading logs
+LOG_FETCH_BATCH_SIZE = 100
+
+
+async def _group_by_resource(stream: AsyncResult) -> AsyncIterator[tuple[str, list[Row]]]:
+    """Yield (resource_ref, rows) for consecutive rows of the same resource."""
+    current, group = None, []
+    async for row in stream:
+        if group and row.resource_ref != current:
+            yield current, group
+            group = []
+        current = row.resource_ref
+        group.append(row)
+    if group:
+        yield current, group
+
+
 class LogSummarizer:
     """Summarizes logs before they are purged."""
 
@@ -31,57 +58,88 @@ class LogSummarizer:
         retention_window_start = now - timedelta(days=retention_days)
         retention_window_end = now + timedelta(days=1)
         
-        # 1. Group by Resource
-        # We want to know which resources have expiring logs
-        query = (
-            select(LogEntry.resource_ref, func.count(LogEntry.id))
+        # 1. Sample logs per Resource
+        # One windowed query returns, for every resource with expiring logs,
+        # its first 100 logs (for MVP; first 50 and last 50 error logs
+        # ideally) plus the resource's total count. Only the columns the
+        # summary reads are selected, streamed from a server-side cursor.
+        rn = func.row_number().over(
+            partition_by=LogEntry.resource_ref,
+            order_by=LogEntry.timestamp.asc(),
+        ).label("rn")
+        total = func.count().over(partition_by=LogEntry.resource_ref).label("total")
+        ranked = (
+            select(
+                LogEntry.resource_ref,
+                LogEntry.timestamp,
+                LogEntry.content,
+                LogEntry.log_source,
+                rn,
+                total,
+            )
             .where(LogEntry.retention_date.between(retention_window_start, retention_window_end))
-            .group_by(LogEntry.resource_ref)
+            .subquery()
         )
-        result = await db.execute(query)
-        groups = result.all()
-        
+        log_query = (
+            select(ranked)
+            .where(ranked.c.rn <= LOG_SAMPLE_SIZE)
+            .order_by(ranked.c.resource_ref, ranked.c.rn)
+            .execution_options(yield_per=LOG_FETCH_BATCH_SIZE)
+        )
+        # Rows arrive grouped by resource; only one resource's sample is held
+        # in memory at a time
+        stream = await db.stream(log_query)
+        try:
+            return await self._summarize_stream(db, stream)
+        finally:
+            await stream.close()
+
+    async def _summarize_stream(self, db: AsyncSession, stream: AsyncResult) -> int:
+        """Summarize, index and commit each resource's sample from the log stream.
+
+        Each summary's embedding and upsert run in a task while the next
+        resource's rows are read from the cursor; at most one is in flight.
+        """
         summarized_count = 0
+        # Summaries indexed but not yet committed, with their digest payloads
+        pending: list[tuple[LogSummary, dict]] = []
+        # Index task for the previous resource, with what to stage once it lands
+        indexing: tuple[asyncio.Task, LogSummary, dict] | None = None
         
-        for resource_ref, count in groups:
-            print(f"[LogSummarizer] Consolidating {count} logs for {resource_ref}...")
-            
-            # Fetch sample of logs (first 50 and last 50 error logs ideally)
-            # For MVP, just grab up to 100 logs
-            log_query = (
-                select(LogEntry)
-                .where(LogEntry.resource_ref == resource_ref)
-                .where(LogEntry.retention_date.between(retention_window_start, retention_window_end))
-                .order_by(LogEntry.timestamp.asc())
-                .limit(100)
-            )
-            logs_res = await db.execute(log_query)
-            logs = logs_res.scalars().all()
-            
-            if not logs:
-                continue
+        try:
+            async for resource_ref, logs in _group_by_resource(stream):
+                count = logs[0].total
+                logger.debug("[LogSummarizer] Consolidating %d logs for %s...", count, resource_ref)
+                    
+                summary_text = self._summarize_logs_locally(resource_ref, logs)
                 
-            summary_text = self._summarize_logs_locally(resource_ref, logs)
-            
-            # 3. Store Summary
-            start_date = logs[0].timestamp
-            end_date = logs[-1].timestamp
-            retention_date = datetime.now(timezone.utc) + timedelta(days=365)
-            
-            summary = LogSummary(
-                resource_ref=resource_ref,
-                summary_text=summary_text,
-                period_start=start_date,
-                period_end=end_date,
-                log_count=count,
-                retention_date=retention_date,
-            )
-            db.add(summary)
+                # 3. Build Summary
+                start_date = logs[0].timestamp
+                end_date = logs[-1].timestamp
+                retention_date = datetime.now(timezone.utc) + timedelta(days=365)
+                
+                summary = LogSummary(
+                    id=str(uuid4()),
+                    resource_ref=resource_ref,
+                    summary_text=summary_text,
+                    period_start=start_date,
+                    period_end=end_date,
+                    log_count=count,
+                    retention_date=retention_date,
+                )
+                digest = {
+                    "summary_id": summary.id,
+                    "resource_ref": resource_ref,
+                    "period_start": start_date.isoformat(),
+                    "period_end": end_date.isoformat(),
+                    "log_count": count,
+                }
 
-            # 4. Index in Vector Store BEFORE commit to prevent partial state
-            # If indexing fails, we rollback and propagate the error
-            try:
-                await rag_indexer.index_log_summary(
+                if indexing is not None:
+                    summarized_count += await self._stage_indexed(*indexing, pending)
+
+                # 4. Index in Vector Store BEFORE commit to prevent partial state
+                task = asyncio.create_task(rag_indexer.index_log_summary(
                     resource_ref=resource_ref,
                     summary_text=summary_text,
                     time_range={
@@ -92,37 +150,76 @@ class LogSummarizer:
                         "log_count": count,
                         "retention_date": retention_date.isoformat(),
                     },
-                )
-            except EmbeddingBlockedError:
-                await db.rollback()
-                raise
+                ))
+                indexing = (task, summary, digest)
 
-            # Only commit after successful indexing
-            await db.commit()
-            await db.refresh(summary)
+            if indexing is not None:
+                summarized_count += await self._stage_indexed(*indexing, pending)
+                indexing = None
+        except BaseException:
+            if indexing is not None:
+                indexing[0].cancel()
+            # Whatever failed (a blocked embedding, the cursor, cancellation),
+            # persist the summaries already indexed so their vectors are not
+            # orphaned. Committing ends the transaction, so close the cursor first.
+            try:
+                await stream.close()
+                await self._commit_summaries(db, pending)
+            except Exception:
+                logger.exception("[LogSummarizer] Failed to commit %d indexed summaries", len(pending))
+            raise
+        
+        await self._commit_summaries(db, pending)
+            
+        return summarized_count
 
-            await notification_router.notify_event(
+    async def _stage_indexed(
+        self,
+        task: asyncio.Task,
+        summary: LogSummary,
+        digest: dict,
+        pending: list[tuple[LogSummary, dict]],
+    ) -> int:
+        """Wait for a summary's index task, then stage it for commit.
+
+        Returns the number of logs the summary covers. Errors from indexing
+        propagate; the caller commits what was already staged.
+        """
+        await task
+
+        # Only stage after successful indexing; committed once at the end
+        pending.append((summary, digest))
+        return digest["log_count"]
+
+    async def _commit_summaries(self, db: AsyncSession, pending: list[tuple[LogSummary, dict]]) -> None:
+        """Commit staged summaries in one transaction, then announce them.
+
+        Digest notifications are fired off the request path once the
+        transaction is closed.
+        """
+        if not pending:
+            return
+
+        db.add_all(summary for summary, _ in pending)
+        await db.commit()
+
+        for _, digest in pending:
+            asyncio.create_task(notification_router.notify_event(
                 "digest_ready",
-                {
-                    "summary_id": str(summary.id),
-                    "resource_ref": resource_ref,
-                    "period_start": start_date.isoformat(),
-                    "period_end": end_date.isoformat(),
-                    "log_count": count,
-                },
+                digest,
                 severity="info",
                 tags=["digest"],
-            )
-            
-            summarized_count += count
-            
-        return summarized_count
+            ))
+        pending.clear()
+
+    def _summarize_logs_locally(self, resource_ref: str, logs: Sequence[Any]) -> str:
+        """Generate a deterministic summary without LLM calls.
 
-    def _summarize_logs_locally(self, resource_ref: str, logs: list[LogEntry]) -> str:
-        """Generate a deterministic summary without LLM calls."""
+        `logs` may be LogEntry objects or rows with timestamp, content and
+        log_source columns.
+        """
         total_logs = len(logs)
         sources = Counter(log.log_source for log in logs)
-        keywords = ["error", "exception", "failed", "fatal", "panic", "crash"]
         keyword_counts = Counter()
         samples = []
 
@@ -130,11 +227,9 @@ class LogSummarizer:
             content = log.content.strip()
             if len(samples) < 5 and content:
                 samples.append(f"- [{log.timestamp.isoformat()}] {content[:200]}")
-            lower = content.lower()
-            for keyword in keywords:
-                if keyword in lower:
-                    keyword_counts[keyword] += 1
-                    break
+            keyword = match_error_keyword(content)
+            if keyword:
+                keyword_counts[keyword] += 1
 
         source_summary = ", ".join(f"{name}: {count}" for name, count in sources.items())
         keyword_summary = (
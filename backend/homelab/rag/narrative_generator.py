@@ -1,16 +1,53 @@
 """Narrative Generator - Uses LLM to summarize incidents."""
 
+import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Row, select, func
 
 from homelab.storage.models import Incident, IncidentNarrative, Fact, LogEntry
-from homelab.llm.validators import NarrativeOutput
+from homelab.llm.validators import narrative_text_adapter
 from homelab.llm.providers import llm_manager, LLMFunction
 
 logger = logging.getLogger(__name__)
 
+# Columns the prompt and evidence refs read; fetched as plain rows
+_FACT_COLUMNS = ("id", "timestamp", "fact_type", "value")
+_LOG_COLUMNS = ("id", "timestamp", "log_source", "content")
+
+# Narrative prompt; only the slots are formatted per incident
+_PROMPT_TEMPLATE = """
+You are an expert Site Reliability Engineer (SRE). Analyze the following incident and write a concise, technical narrative.
+
+**Incident Details:**
+- Severity: {severity}
+- Affected Resources: {resources}
+- Detected At: {detected_at}
+
+**Symptoms:**
+{symptoms}
+
+**Recent Infrastructure Facts:**
+{facts}
+
+**Recent Logs:**
+{logs}
+
+{rag_context}{history_context}**Instructions:**
+1. Summarize what is happening.
+2. Identify potential root causes based on the logs and facts.
+3. Suggest 2-3 specific troubleshooting steps.
+4. If similar incidents are provided, check if the current issue follows a pattern.
+5. If historical log patterns are provided, note any recurring issues or trends.
+6. Format output in Markdown.
+
+**Narrative:**
+"""
+
+# Incidents with fewer symptoms + affected resources than this skip RAG search
+RAG_MIN_SIGNALS = 2
+
 
 class NarrativeGenerator:
     """Generates human-readable narratives for incidents using configured LLM."""
@@ -20,6 +57,48 @@ class NarrativeGenerator:
         
     async def generate_narrative(self, db: AsyncSession, incident_id: str) -> IncidentNarrative | None:
         """Generate a narrative for a specific incident."""
+        prepared = await self._prepare(db, incident_id)
+        if prepared is None:
+            return None
+        incident, facts, logs, prompt = prepared
+        
+        # 6. Call LLM
+        narrative_text = await self._call_llm(prompt)
+        return await self._store_narrative(db, incident, facts, logs, narrative_text)
+
+    async def generate_narratives(self, db: AsyncSession, incident_ids: list[str]) -> list[IncidentNarrative]:
+        """Generate narratives for several incidents, overlapping the LLM calls.
+        
+        Context is fetched and narratives stored one incident at a time, since
+        they share the session; the LLM calls run together through
+        llm_manager.generate_many. Unknown incident ids are skipped.
+        """
+        prepared = []
+        for incident_id in incident_ids:
+            item = await self._prepare(db, incident_id)
+            if item is not None:
+                prepared.append(item)
+        
+        outputs = await llm_manager.generate_many(
+            [prompt for _, _, _, prompt in prepared],
+            function=LLMFunction.CHAT,
+        )
+        
+        narratives = []
+        for (incident, facts, logs, _), output in zip(prepared, outputs):
+            if isinstance(output, Exception):
+                output = self._llm_error_text(output)
+            elif isinstance(output, BaseException):
+                raise output
+            narratives.append(await self._store_narrative(db, incident, facts, logs, output))
+        return narratives
+
+    async def _prepare(
+        self,
+        db: AsyncSession,
+        incident_id: str,
+    ) -> tuple[Incident, list[Row], list[Row], str] | None:
+        """Load an incident with its context and build its prompt (None if not found)."""
         
         # 1. Fetch Incident and related data
         result = await db.execute(select(Incident).where(Incident.id == incident_id))
@@ -27,43 +106,53 @@ class NarrativeGenerator:
         if not incident:
             return None
             
-        # 2. Fetch related Facts (symptoms)
-        # In a real system, we'd fetch specific facts linked to symptoms.
-        # For MVP, we'll fetch recent facts for the affected resources.
-        facts = []
-        for resource_ref in incident.affected_resources:
-            fact_result = await db.execute(
-                select(Fact)
-                .where(Fact.resource_ref == resource_ref)
-                .order_by(Fact.timestamp.desc())
-                .limit(5)
-            )
-            facts.extend(fact_result.scalars().all())
-
-        # 3. Fetch recent Logs for context
-        logs = []
-        for resource_ref in incident.affected_resources:
-            log_result = await db.execute(
-                select(LogEntry)
-                .where(LogEntry.resource_ref == resource_ref)
-                .order_by(LogEntry.timestamp.desc())
-                .limit(20)
-            )
-            logs.extend(log_result.scalars().all())
-            
+        # 2-3. Fetch related Facts and recent Logs (one session, so sequential)
         # 4. RAG: Search for similar past incidents and historical log patterns
+        # The RAG searches don't touch the DB, so they overlap the fetches.
+        # Low-signal incidents (almost no symptoms/resources) skip RAG.
         from homelab.rag.rag_indexer import rag_indexer
 
         search_query = f"Incident on {', '.join(incident.affected_resources)}: {', '.join(incident.symptoms)}"
-        similar_docs = await rag_indexer.search_narratives(search_query, limit=2)
-        log_summaries = await rag_indexer.search_summaries(search_query, limit=2)
-
-        # 5. Construct Prompt
-        prompt = self._construct_prompt(incident, facts, logs, similar_docs, log_summaries)
+        context = self._fetch_context(db, incident.affected_resources)
         
-        # 6. Call LLM
-        narrative_text = await self._call_llm(prompt)
-        narrative_text = NarrativeOutput.model_validate({"text": narrative_text}, strict=True).text
+        if len(incident.symptoms) + len(incident.affected_resources) < RAG_MIN_SIGNALS:
+            facts, logs = await context
+            similar_docs, log_summaries = [], []
+        else:
+            (facts, logs), (similar_docs, log_summaries) = await asyncio.gather(
+                context,
+                rag_indexer.search_both(search_query, limit=2),
+            )
+
+        # 5. Construct Prompt (string building off the event loop). ORM
+        # attributes are read here, on the loop: an expired one would need
+        # an async lazy load, which cannot run from the worker thread.
+        prompt = await asyncio.to_thread(
+            self._construct_prompt,
+            severity=incident.severity.value,
+            resources=list(incident.affected_resources),
+            symptoms=list(incident.symptoms),
+            detected_at=incident.detected_at,
+            facts=facts,
+            logs=logs,
+            similar_docs=similar_docs,
+            log_summaries=log_summaries,
+        )
+        return incident, facts, logs, prompt
+
+    async def _store_narrative(
+        self,
+        db: AsyncSession,
+        incident: Incident,
+        facts: list[Row],
+        logs: list[Row],
+        narrative_text: str,
+    ) -> IncidentNarrative:
+        """Validate, save and index the LLM's narrative for an incident."""
+        from homelab.rag.rag_indexer import rag_indexer
+
+        incident_id = incident.id
+        narrative_text = narrative_text_adapter.validate_python(narrative_text)
         
         # 7. Create/Update IncidentNarrative
         # Check if narrative already exists
@@ -98,62 +187,110 @@ class NarrativeGenerator:
             
         return narrative
 
-    def _construct_prompt(self, incident: Incident, facts: list[Fact], logs: list[LogEntry], similar_docs: list = None, log_summaries: list = None) -> str:
-        """Construct the prompt for the LLM."""
+    async def _fetch_context(
+        self,
+        db: AsyncSession,
+        resource_refs: list[str],
+    ) -> tuple[list[Row], list[Row]]:
+        """Fetch recent Facts (symptoms) and Logs for the affected resources."""
+        # In a real system, we'd fetch specific facts linked to symptoms.
+        # For MVP, we'll fetch recent facts for the affected resources.
+        facts = await self._fetch_recent(db, Fact, _FACT_COLUMNS, resource_refs, limit=5)
+        logs = await self._fetch_recent(db, LogEntry, _LOG_COLUMNS, resource_refs, limit=20)
+        return facts, logs
 
-        fact_str = "\n".join([f"- [{f.timestamp}] {f.fact_type}: {f.value}" for f in facts])
-        log_str = "\n".join([f"- [{l.timestamp}] {l.log_source}: {l.content[:200]}" for l in logs])
-        symptom_str = "\n".join([f"- {s}" for s in incident.symptoms])
+    async def _fetch_recent(
+        self,
+        db: AsyncSession,
+        model: type[Fact] | type[LogEntry],
+        columns: tuple[str, ...],
+        resource_refs: list[str],
+        limit: int,
+    ) -> list[Row]:
+        """Fetch the newest `limit` rows of model per resource in one query.
 
-        rag_context = ""
-        if similar_docs:
-            rag_context = "**Similar Past Incidents:**\n"
-            for doc in similar_docs:
-                rag_context += f"- [Score {doc['score']:.2f}] {doc.get('text', '')[:200]}...\n"
-            rag_context += "\n"
+        Returns plain rows of `columns` (no ORM hydration), grouped in
+        resource_refs order, newest first.
+        """
+        if not resource_refs:
+            return []
 
-        history_context = ""
-        if log_summaries:
-            history_context = "**Historical Log Patterns:**\n"
-            for summary in log_summaries:
-                history_context += f"- [Score {summary['score']:.2f}] {summary.get('text', '')[:300]}...\n"
-            history_context += "\n"
+        rn = func.row_number().over(
+            partition_by=model.resource_ref,
+            order_by=model.timestamp.desc(),
+        ).label("rn")
+        ranked = (
+            select(model.resource_ref, *(getattr(model, c) for c in columns), rn)
+            .where(model.resource_ref.in_(resource_refs))
+            .subquery()
+        )
+        result = await db.execute(
+            select(ranked.c.resource_ref, *(ranked.c[c] for c in columns))
+            .where(ranked.c.rn <= limit)
+            .order_by(ranked.c.timestamp.desc())
+        )
 
-        return f"""
-You are an expert Site Reliability Engineer (SRE). Analyze the following incident and write a concise, technical narrative.
+        position = {ref: i for i, ref in enumerate(resource_refs)}
+        return sorted(result.all(), key=lambda r: position[r.resource_ref])
 
-**Incident Details:**
-- Severity: {incident.severity.value}
-- Affected Resources: {', '.join(incident.affected_resources)}
-- Detected At: {incident.detected_at}
+    def _construct_prompt(
+        self,
+        severity: str,
+        resources: list[str],
+        symptoms: list[str],
+        detected_at: datetime,
+        facts: list[Row],
+        logs: list[Row],
+        similar_docs: list = None,
+        log_summaries: list = None,
+    ) -> str:
+        """Construct the prompt for the LLM.
 
-**Symptoms:**
-{symptom_str}
+        Takes the incident's fields as plain values, so it is safe to run
+        off the event loop. `facts` and `logs` are rows shaped like
+        _FACT_COLUMNS / _LOG_COLUMNS, each prefixed with resource_ref.
+        """
 
-**Recent Infrastructure Facts:**
-{fact_str}
+        fact_str = "\n".join(f"- [{ts}] {fact_type}: {value}" for _, _, ts, fact_type, value in facts)
+        log_str = "\n".join(f"- [{ts}] {source}: {content[:200]}" for _, _, ts, source, content in logs)
+        symptom_str = "\n".join(f"- {s}" for s in symptoms)
 
-**Recent Logs:**
-{log_str}
+        rag_context = ""
+        if similar_docs:
+            rag_context = "**Similar Past Incidents:**\n" + "".join(
+                f"- [Score {doc['score']:.2f}] {doc.get('text', '')[:200]}...\n"
+                for doc in similar_docs
+            ) + "\n"
 
-{rag_context}{history_context}**Instructions:**
-1. Summarize what is happening.
-2. Identify potential root causes based on the logs and facts.
-3. Suggest 2-3 specific troubleshooting steps.
-4. If similar incidents are provided, check if the current issue follows a pattern.
-5. If historical log patterns are provided, note any recurring issues or trends.
-6. Format output in Markdown.
+        history_context = ""
+        if log_summaries:
+            history_context = "**Historical Log Patterns:**\n" + "".join(
+                f"- [Score {summary['score']:.2f}] {summary.get('text', '')[:300]}...\n"
+                for summary in log_summaries
+            ) + "\n"
 
-**Narrative:**
-"""
+        return _PROMPT_TEMPLATE.format(
+            severity=severity,
+            resources=", ".join(resources),
+            detected_at=detected_at,
+            symptoms=symptom_str,
+            facts=fact_str,
+            logs=log_str,
+            rag_context=rag_context,
+            history_context=history_context,
+        )
 
     async def _call_llm(self, prompt: str) -> str:
         """Call the configured LLM provider."""
         try:
             return await llm_manager.generate(prompt, function=LLMFunction.CHAT)
         except Exception as e:
-            logger.error("[NarrativeGenerator] LLM Error: %s", e)
-            return f"**Error generating narrative:** {str(e)}"
+            return self._llm_error_text(e)
+
+    def _llm_error_text(self, error: Exception) -> str:
+        """Log a failed LLM call; the narrative records the error instead."""
+        logger.error("[NarrativeGenerator] LLM Error: %s", error)
+        return f"**Error generating narrative:** {str(error)}"
 
 # Singleton
 narrative_generator = NarrativeGenerator()
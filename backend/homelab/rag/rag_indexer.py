@@ -1,9 +1,28 @@
 """RAG Indexer - indexes documents into Qdrant vector store."""
 
+import asyncio
+import hashlib
+import logging
 import os
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
-from datetime import datetime
+import random
+import zlib
+from array import array
+from collections import Counter, OrderedDict, defaultdict
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client.models import (
+    Distance,
+    HnswConfigDiff,
+    OptimizersConfigDiff,
+    PointStruct,
+    QuantizationSearchParams,
+    QueryRequest,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    VectorParams,
+)
+from datetime import datetime, timezone
 import uuid
 
 from homelab.config import get_settings
@@ -11,56 +30,343 @@ from homelab.llm.providers import llm_manager, EmbeddingBlockedError
 
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 # Collection names
 NARRATIVES_COLLECTION = "incident_narratives"
 SUMMARIES_COLLECTION = "log_summaries"
 
+# Character limits: text stored in point payloads, and text sent for
+# embedding. Slicing a str copies only the kept prefix (and nothing when the
+# text is already short), so truncation stays in characters.
+PAYLOAD_TEXT_CHARS = 2000
+EMBED_INPUT_CHARS = 4000
+
+# HNSW graph tuned for high-recall incident retrieval on 100k+ points.
+# ef at search time is per call: lower for latency, higher for recall.
+HNSW_M = 24
+HNSW_EF_CONSTRUCT = 200
+SEARCH_HNSW_EF = 100
+# Segments above this many KB are memory-mapped instead of held in RAM
+MEMMAP_THRESHOLD_KB = 20000
+
+# Vectors are int8-quantized in RAM (~4x smaller) with float originals on
+# disk; searches oversample on the quantized vectors, then rescore the
+# candidates with the originals
+QUANTIZATION_QUANTILE = 0.99
+SEARCH_OVERSAMPLING = 2.0
+
+# Payload fields search results read, per collection; nothing else is sent back
+_SEARCH_PAYLOAD_FIELDS = {
+    NARRATIVES_COLLECTION: ["narrative_id", "incident_id", "text"],
+    SUMMARIES_COLLECTION: ["resource_ref", "text", "time_range"],
+}
+
+# Cached query embeddings (LRU, keyed by embedding model + text digest)
+EMBEDDING_CACHE_SIZE = 4096
+
+# Cached vectors are packed as float32, the precision Qdrant stores them at
+_VECTOR_TYPECODE = "f"
+
+# Single-point upserts queued while another upsert to the same collection is
+# in flight are sent together, up to this many points per request
+UPSERT_BATCH_SIZE = 64
+
+# Near-duplicate reuse: texts at least this long whose MinHash similarity
+# (character 5-gram shingles) to a recent text reaches the threshold reuse
+# its vector instead of being embedded again
+NEAR_DUP_MIN_CHARS = 200
+NEAR_DUP_THRESHOLD = 0.9
+NEAR_DUP_CACHE_SIZE = 512
+NEAR_DUP_MAX_CANDIDATES = 8
+_SHINGLE_SIZE = 5
+_MINHASH_BANDS = 8
+_MINHASH_ROWS = 4
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(0)
+_MINHASH_PARAMS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(_MINHASH_BANDS * _MINHASH_ROWS)
+]
+del _rng
+
 # Allow destructive operations (recreate collections)
 ALLOW_DESTRUCTIVE_ACTIONS = os.environ.get("ALLOW_DESTRUCTIVE_ACTIONS", "false").lower() == "true"
 
 
+def _narrative_payload(
+    narrative_id: str,
+    incident_id: str,
+    narrative_text: str,
+    indexed_at: str,
+    metadata: dict | None,
+) -> dict:
+    payload = {
+        "narrative_id": narrative_id,
+        "incident_id": incident_id,
+        "text": narrative_text[:PAYLOAD_TEXT_CHARS],  # Store truncated for retrieval
+        "indexed_at": indexed_at,
+    }
+    if metadata:
+        payload.update(metadata)
+    return payload
+
+
+def _summary_payload(
+    resource_ref: str,
+    summary_text: str,
+    time_range: dict,
+    indexed_at: str,
+    metadata: dict | None,
+) -> dict:
+    payload = {
+        "resource_ref": resource_ref,
+        "text": summary_text[:PAYLOAD_TEXT_CHARS],
+        "time_range": time_range,
+        "indexed_at": indexed_at,
+    }
+    if metadata:
+        payload.update(metadata)
+    return payload
+
+
+class EmbeddingCache:
+    """In-process LRU of embedding vectors keyed by (model, text digest).
+
+    Repeated search queries skip the embedding call entirely. The digest is
+    blake2b since there is no security requirement, only speed. Vectors are
+    held packed (see _VECTOR_TYPECODE), an eighth of the memory of a float list.
+    """
+
+    def __init__(self, maxsize: int = EMBEDDING_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._vectors: OrderedDict[tuple[str, bytes], array] = OrderedDict()
+
+    @staticmethod
+    def key(model: str, text: str) -> tuple[str, bytes]:
+        return model, hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+    def get(self, key: tuple[str, bytes]) -> list[float] | None:
+        vector = self._vectors.get(key)
+        if vector is None:
+            self.misses += 1
+            return None
+        self._vectors.move_to_end(key)
+        self.hits += 1
+        return vector.tolist()
+
+    def put(self, key: tuple[str, bytes], vector: list[float]) -> None:
+        self._vectors[key] = array(_VECTOR_TYPECODE, vector)
+        self._vectors.move_to_end(key)
+        if len(self._vectors) > self.maxsize:
+            self._vectors.popitem(last=False)
+
+    def clear(self) -> None:
+        self._vectors.clear()
+
+    def stats(self) -> dict:
+        return {"size": len(self._vectors), "hits": self.hits, "misses": self.misses}
+
+
+def minhash_signature(text: str) -> tuple[int, ...]:
+    """MinHash signature of the text's character 5-gram shingles."""
+    data = " ".join(text.lower().split()).encode()
+    shingles = {
+        zlib.crc32(data[i:i + _SHINGLE_SIZE])
+        for i in range(max(len(data) - _SHINGLE_SIZE + 1, 1))
+    }
+    return tuple(
+        min((a * h + b) % _MERSENNE_PRIME for h in shingles)
+        for a, b in _MINHASH_PARAMS
+    )
+
+
+class NearDuplicateIndex:
+    """Recent embedding vectors found by MinHash similarity of their text.
+
+    Signatures are split into LSH bands; texts sharing a band are candidates,
+    and at most NEAR_DUP_MAX_CANDIDATES of them are compared in full.
+    Oldest entries are evicted first.
+    """
+
+    def __init__(self, maxsize: int = NEAR_DUP_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self._entries: OrderedDict[int, tuple[str, tuple[int, ...], array]] = OrderedDict()
+        self._bands: dict[tuple, set[int]] = {}
+        self._next_id = 0
+
+    @staticmethod
+    def _band_keys(model: str, signature: tuple[int, ...]) -> list[tuple]:
+        return [
+            (model, band, signature[band * _MINHASH_ROWS:(band + 1) * _MINHASH_ROWS])
+            for band in range(_MINHASH_BANDS)
+        ]
+
+    def get(self, model: str, signature: tuple[int, ...]) -> list[float] | None:
+        collisions = Counter()
+        for band_key in self._band_keys(model, signature):
+            collisions.update(self._bands.get(band_key, ()))
+
+        best, best_similarity = None, NEAR_DUP_THRESHOLD
+        for entry_id, _ in collisions.most_common(NEAR_DUP_MAX_CANDIDATES):
+            _, cached_signature, vector = self._entries[entry_id]
+            similarity = sum(map(int.__eq__, signature, cached_signature)) / len(signature)
+            if similarity >= best_similarity:
+                best, best_similarity = vector, similarity
+
+        if best is None:
+            return None
+        self.hits += 1
+        return best.tolist()
+
+    def add(self, model: str, signature: tuple[int, ...], vector: list[float]) -> None:
+        entry_id = self._next_id
+        self._next_id += 1
+        self._entries[entry_id] = (model, signature, array(_VECTOR_TYPECODE, vector))
+        for band_key in self._band_keys(model, signature):
+            self._bands.setdefault(band_key, set()).add(entry_id)
+
+        if len(self._entries) > self.maxsize:
+            old_id, (old_model, old_signature, _) = self._entries.popitem(last=False)
+            for band_key in self._band_keys(old_model, old_signature):
+                members = self._bands.get(band_key)
+                if members is not None:
+                    members.discard(old_id)
+                    if not members:
+                        del self._bands[band_key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bands.clear()
+
+    def stats(self) -> dict:
+        return {"size": len(self._entries), "hits": self.hits}
+
+
 class RAGIndexer:
     """Indexes documents into Qdrant for RAG retrieval."""
 
     def __init__(self):
-        self.client = QdrantClient(url=settings.qdrant_url)
+        # Sync client for startup and collection admin; async client for the
+        # index/search hot path so RPCs don't block the event loop
+        self.client = QdrantClient(url=settings.qdrant_url, prefer_grpc=settings.qdrant_prefer_grpc)
+        self.async_client = AsyncQdrantClient(
+            url=settings.qdrant_url,
+            prefer_grpc=settings.qdrant_prefer_grpc,
+            pool_size=settings.qdrant_pool_size,
+        )
+        self.embedding_cache = EmbeddingCache()
+        self.near_duplicates = NearDuplicateIndex()
+        self._pending_upserts: defaultdict[str, list[tuple[PointStruct, asyncio.Future]]] = defaultdict(list)
+        self._flush_tasks: dict[str, asyncio.Task] = {}
+        self._collections_ready = asyncio.Event()
+        self._collections_lock = asyncio.Lock()
+
+    async def drain(self) -> None:
+        """Wait until every queued upsert has been sent."""
+        while self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks.values(), return_exceptions=True)
+
+    async def close(self) -> None:
+        """Send queued upserts, then close the async client's connections (called on shutdown)."""
+        await self.drain()
+        await self.async_client.close()
 
     def _get_target_dimension(self) -> int:
         """Get the target embedding dimension from LLM manager."""
         return llm_manager.get_embedding_dimension()
 
-    def ensure_collections(self):
-        """Ensure required collections exist."""
-        try:
-            dim = self._get_target_dimension()
-            collections = self.client.get_collections().collections
-            collection_names = [c.name for c in collections]
-
-            if NARRATIVES_COLLECTION not in collection_names:
-                self.client.create_collection(
-                    collection_name=NARRATIVES_COLLECTION,
-                    vectors_config=VectorParams(
-                        size=dim,
-                        distance=Distance.COSINE,
-                    ),
-                )
-                print(f"[RAGIndexer] Created collection: {NARRATIVES_COLLECTION} (dim={dim})")
-
-            if SUMMARIES_COLLECTION not in collection_names:
-                self.client.create_collection(
-                    collection_name=SUMMARIES_COLLECTION,
-                    vectors_config=VectorParams(
-                        size=dim,
-                        distance=Distance.COSINE,
-                    ),
-                )
-                print(f"[RAGIndexer] Created collection: {SUMMARIES_COLLECTION} (dim={dim})")
-
-        except Exception as e:
-            print(f"[RAGIndexer] Error ensuring collections: {e}")
+    def _collection_config(self, name: str, dim: int) -> dict:
+        """create_collection arguments: vector, HNSW and quantization settings."""
+        return dict(
+            collection_name=name,
+            vectors_config=VectorParams(
+                size=dim,
+                distance=Distance.COSINE,
+                on_disk=True,
+            ),
+            hnsw_config=HnswConfigDiff(m=HNSW_M, ef_construct=HNSW_EF_CONSTRUCT),
+            optimizers_config=OptimizersConfigDiff(memmap_threshold=MEMMAP_THRESHOLD_KB),
+            quantization_config=self._quantization_config(),
+        )
+
+    @staticmethod
+    def _quantization_config() -> ScalarQuantization:
+        """int8 scalar quantization, kept in RAM while originals stay on disk."""
+        return ScalarQuantization(
+            scalar=ScalarQuantizationConfig(
+                type=ScalarType.INT8,
+                quantile=QUANTIZATION_QUANTILE,
+                always_ram=True,
+            ),
+        )
+
+    @staticmethod
+    def _search_params(ef_search: int) -> SearchParams:
+        return SearchParams(
+            hnsw_ef=ef_search,
+            quantization=QuantizationSearchParams(rescore=True, oversampling=SEARCH_OVERSAMPLING),
+        )
+
+    async def ensure_collections(self):
+        """Ensure required collections exist.
+
+        Index and search paths call this before touching Qdrant; once it has
+        succeeded, later calls return without a round-trip. Existence checks
+        run concurrently, as do the creates for missing ones. Existing
+        collections created before quantization was enabled get it added.
+        """
+        if self._collections_ready.is_set():
+            return
+        async with self._collections_lock:
+            if self._collections_ready.is_set():
+                return
+            try:
+                dim = self._get_target_dimension()
+                names = [NARRATIVES_COLLECTION, SUMMARIES_COLLECTION]
+                exists = await asyncio.gather(*(self.async_client.collection_exists(n) for n in names))
+                missing = [name for name, ok in zip(names, exists) if not ok]
+                existing = [name for name, ok in zip(names, exists) if ok]
+
+                await asyncio.gather(*(
+                    self.async_client.create_collection(**self._collection_config(name, dim))
+                    for name in missing
+                ))
+                for name in missing:
+                    logger.info("[RAGIndexer] Created collection: %s (dim=%d)", name, dim)
+
+                infos = await asyncio.gather(*(self.async_client.get_collection(n) for n in existing))
+                unquantized = [
+                    name for name, info in zip(existing, infos)
+                    if info.config.quantization_config is None
+                ]
+                await asyncio.gather(*(
+                    self.async_client.update_collection(
+                        collection_name=name,
+                        quantization_config=self._quantization_config(),
+                    )
+                    for name in unquantized
+                ))
+                for name in unquantized:
+                    logger.info("[RAGIndexer] Enabled int8 quantization on collection: %s", name)
+                self._collections_ready.set()
 
-    def get_collection_info(self) -> dict:
+            except Exception as e:
+                logger.error("[RAGIndexer] Error ensuring collections: %s", e)
+
+    async def _get_collections(self) -> list:
+        """Fetch both managed collections concurrently; None where missing."""
+        infos = await asyncio.gather(
+            self.async_client.get_collection(NARRATIVES_COLLECTION),
+            self.async_client.get_collection(SUMMARIES_COLLECTION),
+            return_exceptions=True,
+        )
+        return [None if isinstance(info, Exception) else info for info in infos]
+
+    async def get_collection_info(self) -> dict:
         """Get info about all managed collections including vector sizes."""
         result = {
             "collections": [],
@@ -68,9 +374,9 @@ class RAGIndexer:
             "dimensions": set(),
         }
         try:
-            for name in [NARRATIVES_COLLECTION, SUMMARIES_COLLECTION]:
-                try:
-                    info = self.client.get_collection(name)
+            infos = await self._get_collections()
+            for name, info in zip([NARRATIVES_COLLECTION, SUMMARIES_COLLECTION], infos):
+                if info is not None:
                     vector_size = info.config.params.vectors.size
                     points_count = info.points_count
                     result["collections"].append({
@@ -80,7 +386,7 @@ class RAGIndexer:
                         "exists": True,
                     })
                     result["dimensions"].add(vector_size)
-                except Exception:
+                else:
                     result["collections"].append({
                         "name": name,
                         "vector_size": None,
@@ -98,7 +404,7 @@ class RAGIndexer:
 
         return result
 
-    def get_existing_dimension(self) -> tuple[int | None, bool]:
+    async def get_existing_dimension(self) -> tuple[int | None, bool]:
         """Get the vector dimension from existing collections, if any.
 
         Returns:
@@ -108,12 +414,9 @@ class RAGIndexer:
         """
         dimensions = []
         try:
-            for name in [NARRATIVES_COLLECTION, SUMMARIES_COLLECTION]:
-                try:
-                    info = self.client.get_collection(name)
+            for info in await self._get_collections():
+                if info is not None:  # Collection exists
                     dimensions.append(info.config.params.vectors.size)
-                except Exception:
-                    continue  # Collection doesn't exist
         except Exception:
             pass
 
@@ -134,26 +437,22 @@ class RAGIndexer:
             }
 
         results = {"success": True, "collections": [], "dimension": new_dimension}
+        self.embedding_cache.clear()
+        self.near_duplicates.clear()
 
         for name in [NARRATIVES_COLLECTION, SUMMARIES_COLLECTION]:
             try:
                 # Delete if exists
                 try:
                     self.client.delete_collection(name)
-                    print(f"[RAGIndexer] Deleted collection: {name}")
+                    logger.warning("[RAGIndexer] Deleted collection: %s", name)
                 except Exception:
                     pass  # Didn't exist
 
                 # Create with new dimension
-                self.client.create_collection(
-                    collection_name=name,
-                    vectors_config=VectorParams(
-                        size=new_dimension,
-                        distance=Distance.COSINE,
-                    ),
-                )
+                self.client.create_collection(**self._collection_config(name, new_dimension))
                 results["collections"].append({"name": name, "status": "recreated"})
-                print(f"[RAGIndexer] Recreated collection: {name} (dim={new_dimension})")
+                logger.info("[RAGIndexer] Recreated collection: %s (dim=%d)", name, new_dimension)
 
             except Exception as e:
                 results["collections"].append({"name": name, "status": "error", "error": str(e)})
@@ -179,32 +478,81 @@ class RAGIndexer:
                 return False
 
             point = PointStruct(
-                id=str(uuid.uuid4()),
+                id=uuid.uuid4().hex,  # Qdrant accepts the unhyphenated form
                 vector=embedding,
-                payload={
-                    "narrative_id": narrative_id,
-                    "incident_id": incident_id,
-                    "text": narrative_text[:2000],  # Store truncated for retrieval
-                    "indexed_at": datetime.now(timezone.utc).isoformat(),
-                    **(metadata or {}),
-                },
+                payload=_narrative_payload(
+                    narrative_id,
+                    incident_id,
+                    narrative_text,
+                    datetime.now(timezone.utc).isoformat(),
+                    metadata,
+                ),
             )
 
-            self.client.upsert(
-                collection_name=NARRATIVES_COLLECTION,
-                points=[point],
-            )
+            await self._upsert(NARRATIVES_COLLECTION, point)
 
-            print(f"[RAGIndexer] Indexed narrative {narrative_id}")
+            logger.debug("[RAGIndexer] Indexed narrative %s", narrative_id)
             return True
 
         except EmbeddingBlockedError:
             # Re-raise - callers must handle blocked state explicitly
             raise
         except Exception as e:
-            print(f"[RAGIndexer] Error indexing narrative: {e}")
+            logger.error("[RAGIndexer] Error indexing narrative: %s", e)
             return False
     
+    async def index_narratives_bulk(self, items: list[dict]) -> int:
+        """Index several incident narratives with one embedding call and one upsert.
+
+        Args:
+            items: Dicts with the index_narrative keyword arguments
+                (narrative_id, narrative_text, incident_id, optional metadata).
+
+        Returns:
+            Number of narratives indexed (0 on failure).
+
+        Raises:
+            EmbeddingBlockedError: When system is in blocked state.
+        """
+        if not items:
+            return 0
+        try:
+            embeddings = await self._get_embeddings([item["narrative_text"] for item in items])
+            if not embeddings:
+                return 0
+
+            indexed_at = datetime.now(timezone.utc).isoformat()
+            points = [
+                PointStruct(
+                    id=uuid.uuid4().hex,
+                    vector=embedding,
+                    payload=_narrative_payload(
+                        item["narrative_id"],
+                        item["incident_id"],
+                        item["narrative_text"],
+                        indexed_at,
+                        item.get("metadata"),
+                    ),
+                )
+                for item, embedding in zip(items, embeddings)
+            ]
+
+            await self.ensure_collections()
+            await self.async_client.upsert(
+                collection_name=NARRATIVES_COLLECTION,
+                points=points,
+                wait=False,
+            )
+
+            logger.info("[RAGIndexer] Indexed %d narratives", len(points))
+            return len(points)
+
+        except EmbeddingBlockedError:
+            raise
+        except Exception as e:
+            logger.error("[RAGIndexer] Error bulk indexing narratives: %s", e)
+            return 0
+
     async def index_log_summary(
         self,
         resource_ref: str,
@@ -223,21 +571,18 @@ class RAGIndexer:
                 return False
 
             point = PointStruct(
-                id=str(uuid.uuid4()),
+                id=uuid.uuid4().hex,
                 vector=embedding,
-                payload={
-                    "resource_ref": resource_ref,
-                    "text": summary_text[:2000],
-                    "time_range": time_range,
-                    "indexed_at": datetime.now(timezone.utc).isoformat(),
-                    **(metadata or {}),
-                },
+                payload=_summary_payload(
+                    resource_ref,
+                    summary_text,
+                    time_range,
+                    datetime.now(timezone.utc).isoformat(),
+                    metadata,
+                ),
             )
 
-            self.client.upsert(
-                collection_name=SUMMARIES_COLLECTION,
-                points=[point],
-            )
+            await self._upsert(SUMMARIES_COLLECTION, point)
 
             return True
 
@@ -245,16 +590,71 @@ class RAGIndexer:
             # Re-raise - callers must handle blocked state explicitly
             raise
         except Exception as e:
-            print(f"[RAGIndexer] Error indexing summary: {e}")
+            logger.error("[RAGIndexer] Error indexing summary: %s", e)
             return False
     
+    async def _upsert(self, collection_name: str, point: PointStruct) -> None:
+        """Upsert one point, sharing a request with concurrent upserts.
+
+        Points are queued per collection and sent by one background flush
+        task, so everything queued before it runs (or while its request is
+        in flight) goes out together. Each caller still waits for (and sees
+        errors from) its own point; a cancelled caller doesn't stop the flush.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending_upserts[collection_name].append((point, future))
+
+        if collection_name not in self._flush_tasks:
+            self._flush_tasks[collection_name] = asyncio.create_task(
+                self._flush_upserts(collection_name)
+            )
+
+        await future
+
+    async def _flush_upserts(self, collection_name: str) -> None:
+        """Send queued points in batches until the collection's queue is empty."""
+        pending = self._pending_upserts[collection_name]
+        batch: list[tuple[PointStruct, asyncio.Future]] = []
+        try:
+            await self.ensure_collections()
+            while pending:
+                batch = pending[:UPSERT_BATCH_SIZE]
+                del pending[:UPSERT_BATCH_SIZE]
+                try:
+                    # wait=False: Qdrant acknowledges once the write is accepted
+                    await self.async_client.upsert(
+                        collection_name=collection_name,
+                        points=[point for point, _ in batch],
+                        wait=False,
+                    )
+                except Exception as e:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                else:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_result(None)
+        finally:
+            # Flusher cancelled: don't leave in-flight or queued callers waiting
+            for _, future in batch + pending:
+                if not future.done():
+                    future.cancel()
+            pending.clear()
+            # No await since the queue was last seen empty, so no point can
+            # have been queued expecting this task to send it
+            del self._flush_tasks[collection_name]
+
     async def search_narratives(
         self,
         query: str,
         limit: int = 5,
+        ef_search: int = SEARCH_HNSW_EF,
     ) -> list[dict]:
         """Search for similar incident narratives.
 
+        `ef_search` trades latency (lower) against recall (higher).
+
         Raises:
             EmbeddingBlockedError: When system is in blocked state.
         """
@@ -262,36 +662,24 @@ class RAGIndexer:
             embedding = await self._get_embedding(query)
             if not embedding:
                 return []
-
-            results = self.client.search(
-                collection_name=NARRATIVES_COLLECTION,
-                query_vector=embedding,
-                limit=limit,
-            )
-
-            return [
-                {
-                    "score": r.score,
-                    "narrative_id": r.payload.get("narrative_id"),
-                    "incident_id": r.payload.get("incident_id"),
-                    "text": r.payload.get("text"),
-                }
-                for r in results
-            ]
-
         except EmbeddingBlockedError:
             raise
         except Exception as e:
-            print(f"[RAGIndexer] Search error: {e}")
+            logger.error("[RAGIndexer] Search error: %s", e)
             return []
 
+        return await self._search(NARRATIVES_COLLECTION, embedding, limit, ef_search)
+
     async def search_summaries(
         self,
         query: str,
         limit: int = 5,
+        ef_search: int = SEARCH_HNSW_EF,
     ) -> list[dict]:
         """Search for similar log summaries.
 
+        `ef_search` trades latency (lower) against recall (higher).
+
         Raises:
             EmbeddingBlockedError: When system is in blocked state.
         """
@@ -299,42 +687,217 @@ class RAGIndexer:
             embedding = await self._get_embedding(query)
             if not embedding:
                 return []
+        except EmbeddingBlockedError:
+            raise
+        except Exception as e:
+            logger.error("[RAGIndexer] Search error: %s", e)
+            return []
 
-            results = self.client.search(
-                collection_name=SUMMARIES_COLLECTION,
-                query_vector=embedding,
+        return await self._search(SUMMARIES_COLLECTION, embedding, limit, ef_search)
+
+    async def search_both(
+        self,
+        query: str,
+        limit: int = 5,
+        ef_search: int = SEARCH_HNSW_EF,
+    ) -> tuple[list[dict], list[dict]]:
+        """Search narratives and summaries with one embedding, concurrently.
+
+        Returns:
+            Tuple of (narrative hits, summary hits), as from search_narratives
+            and search_summaries.
+
+        Raises:
+            EmbeddingBlockedError: When system is in blocked state.
+        """
+        try:
+            embedding = await self._get_embedding(query)
+            if not embedding:
+                return [], []
+        except EmbeddingBlockedError:
+            raise
+        except Exception as e:
+            logger.error("[RAGIndexer] Search error: %s", e)
+            return [], []
+
+        narratives, summaries = await asyncio.gather(
+            self._search(NARRATIVES_COLLECTION, embedding, limit, ef_search),
+            self._search(SUMMARIES_COLLECTION, embedding, limit, ef_search),
+        )
+        return narratives, summaries
+
+    async def search_batch(
+        self,
+        collection_name: str,
+        queries: list[str],
+        limit: int = 5,
+        ef_search: int = SEARCH_HNSW_EF,
+    ) -> list[list[dict]]:
+        """Run several searches against one collection in a single request.
+
+        All queries are embedded in one call and sent to Qdrant together
+        with query_batch_points.
+
+        Returns:
+            One hit list per query, in query order, shaped as by
+            search_narratives / search_summaries.
+
+        Raises:
+            EmbeddingBlockedError: When system is in blocked state.
+        """
+        if not queries:
+            return []
+        try:
+            embeddings = await self._get_embeddings(queries)
+            if not embeddings:
+                return [[] for _ in queries]
+        except EmbeddingBlockedError:
+            raise
+        except Exception as e:
+            logger.error("[RAGIndexer] Search error: %s", e)
+            return [[] for _ in queries]
+
+        params = self._search_params(ef_search)
+        fields = _SEARCH_PAYLOAD_FIELDS[collection_name]
+        try:
+            await self.ensure_collections()
+            responses = await self.async_client.query_batch_points(
+                collection_name=collection_name,
+                requests=[
+                    QueryRequest(
+                        query=embedding,
+                        limit=limit,
+                        params=params,
+                        with_payload=fields,
+                        with_vector=False,
+                    )
+                    for embedding in embeddings
+                ],
+            )
+        except Exception as e:
+            logger.error("[RAGIndexer] Search error: %s", e)
+            return [[] for _ in queries]
+
+        return [self._shape_hits(collection_name, response.points) for response in responses]
+
+    async def _search(
+        self,
+        collection_name: str,
+        embedding: list[float],
+        limit: int,
+        ef_search: int,
+    ) -> list[dict]:
+        """Run a vector search and shape the hits."""
+        try:
+            await self.ensure_collections()
+            response = await self.async_client.query_points(
+                collection_name=collection_name,
+                query=embedding,
                 limit=limit,
+                search_params=self._search_params(ef_search),
+                with_payload=_SEARCH_PAYLOAD_FIELDS[collection_name],
+                with_vectors=False,
             )
+        except Exception as e:
+            logger.error("[RAGIndexer] Search error: %s", e)
+            return []
 
+        return self._shape_hits(collection_name, response.points)
+
+    @staticmethod
+    def _shape_hits(collection_name: str, results: list) -> list[dict]:
+        """Turn scored points into the result dicts search methods return."""
+        if collection_name == NARRATIVES_COLLECTION:
             return [
                 {
                     "score": r.score,
-                    "resource_ref": r.payload.get("resource_ref"),
+                    "narrative_id": r.payload.get("narrative_id"),
+                    "incident_id": r.payload.get("incident_id"),
                     "text": r.payload.get("text"),
-                    "time_range": r.payload.get("time_range"),
                 }
                 for r in results
             ]
-
-        except EmbeddingBlockedError:
-            raise
-        except Exception as e:
-            print(f"[RAGIndexer] Search error: {e}")
-            return []
+        return [
+            {
+                "score": r.score,
+                "resource_ref": r.payload.get("resource_ref"),
+                "text": r.payload.get("text"),
+                "time_range": r.payload.get("time_range"),
+            }
+            for r in results
+        ]
     
     async def _get_embedding(self, text: str) -> list[float] | None:
-        """Get embedding from configured LLM provider.
+        """Get a single embedding; see _get_embeddings.
 
         Raises:
             EmbeddingBlockedError: Re-raised to caller when system is blocked.
         """
+        embeddings = await self._get_embeddings([text])
+        return embeddings[0] if embeddings else None
+
+    async def _get_embeddings(self, texts: list[str]) -> list[list[float]] | None:
+        """Get embeddings for several texts, calling the provider only for cache misses.
+
+        Each text is looked up in the exact embedding cache, then (if long
+        enough) in the near-duplicate index; the rest are embedded in one
+        provider round-trip.
+
+        Returns one vector per text, in input order, or None on failure.
+
+        Raises:
+            EmbeddingBlockedError: Re-raised to caller when system is blocked.
+        """
+        texts = [t[:EMBED_INPUT_CHARS] for t in texts]  # Limit input size
+        # Blocked state must still fail loud, so the caches are bypassed
+        if llm_manager.is_embedding_blocked():
+            return await self._embed_uncached(texts)
+
+        model = llm_manager.get_embedding_model()
+        keys = [self.embedding_cache.key(model, text) for text in texts]
+        vectors: list[list[float] | None] = [self.embedding_cache.get(key) for key in keys]
+        signatures: list[tuple[int, ...] | None] = [None] * len(texts)
+
+        # Long, templated texts (e.g. daily summaries) often differ by a few
+        # characters from one already embedded; reuse that vector. MinHash
+        # is pure-Python work (tens of ms per long text), so the batch's
+        # signatures are computed in a worker thread, off the event loop.
+        long_misses = [
+            i for i, (text, vector) in enumerate(zip(texts, vectors))
+            if vector is None and len(text) >= NEAR_DUP_MIN_CHARS
+        ]
+        if long_misses:
+            computed = await asyncio.to_thread(
+                lambda: [minhash_signature(texts[i]) for i in long_misses]
+            )
+            for i, signature in zip(long_misses, computed):
+                signatures[i] = signature
+                vectors[i] = self.near_duplicates.get(model, signature)
+                if vectors[i] is not None:
+                    self.embedding_cache.put(keys[i], vectors[i])
+
+        misses = [i for i, vector in enumerate(vectors) if vector is None]
+        if misses:
+            embedded = await self._embed_uncached([texts[i] for i in misses])
+            if not embedded:
+                return None
+            for i, vector in zip(misses, embedded):
+                vectors[i] = vector
+                self.embedding_cache.put(keys[i], vector)
+                if signatures[i] is not None:
+                    self.near_duplicates.add(model, signatures[i], vector)
+
+        return vectors
+
+    async def _embed_uncached(self, texts: list[str]) -> list[list[float]] | None:
+        """Embed texts in one provider round-trip, or None on failure."""
         try:
-            return await llm_manager.embed(text[:4000])  # Limit input size
+            return await llm_manager.embed_batch(texts)
         except EmbeddingBlockedError:
             # Re-raise blocked state - callers must handle this explicitly
             raise
         except Exception as e:
-            print(f"[RAGIndexer] Embedding error: {e}")
+            logger.error("[RAGIndexer] Embedding error: %s", e)
             return None
 
 
@@ -1,12 +1,47 @@
 """Summary Generator - generates log summaries for long-term storage."""
 
+import asyncio
+import calendar
+import io
 from collections import Counter
 from datetime import datetime, timedelta
+from typing import Any, Iterable, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import case, func, select
 
+from homelab.config import get_settings
+from homelab.storage.database import async_session_maker
 from homelab.storage.models import LogEntry
 from homelab.rag.rag_indexer import rag_indexer
+from homelab.collectors.log_collector import ERROR_KEYWORDS, match_error_keyword
+
+# Sample lines shown in each summary, and characters kept per line
+SAMPLE_LINES = 5
+SAMPLE_CHARS = 200
+
+# Characters trimmed from both ends of a sample line
+_WHITESPACE = " \t\r\n"
+
+# Characters of daily highlights kept in a monthly rollup
+ROLLUP_CHARS = 6000
+
+
+def _join_bounded(parts: Iterable[str], separator: str, limit: int) -> tuple[str, bool]:
+    """Join parts, stopping once `limit` characters are written.
+    
+    Returns the (at most `limit` character) text and whether it was cut
+    short. Parts past the limit are never copied or joined.
+    """
+    buffer = io.StringIO()
+    remaining = limit
+    for i, part in enumerate(parts):
+        piece = part if i == 0 else separator + part
+        if len(piece) > remaining:
+            buffer.write(piece[:remaining])
+            return buffer.getvalue(), True
+        buffer.write(piece)
+        remaining -= len(piece)
+    return buffer.getvalue(), False
 
 
 class SummaryGenerator:
@@ -23,20 +58,46 @@ class SummaryGenerator:
         start = datetime(date.year, date.month, date.day)
         end = start + timedelta(days=1)
         
+        in_day = (
+            LogEntry.resource_ref == resource_ref,
+            LogEntry.timestamp >= start,
+            LogEntry.timestamp < end,
+        )
+        
+        # Source and keyword counts are aggregated by the database; a line
+        # mentioning several keywords counts toward the first one listed
+        keyword = case(
+            *((LogEntry.content.ilike(f"%{k}%"), k) for k in ERROR_KEYWORDS),
+            else_=None,
+        ).label("keyword")
+        matched = select(LogEntry.log_source, keyword).where(*in_day).subquery()
         result = await db.execute(
-            select(LogEntry)
-            .where(LogEntry.resource_ref == resource_ref)
-            .where(LogEntry.timestamp >= start)
-            .where(LogEntry.timestamp < end)
-            .order_by(LogEntry.timestamp)
-            .limit(500)
+            select(matched.c.log_source, matched.c.keyword, func.count())
+            .group_by(matched.c.log_source, matched.c.keyword)
         )
-        logs = list(result.scalars().all())
+        sources: Counter = Counter()
+        keyword_counts: Counter = Counter()
+        for log_source, found, count in result.all():
+            sources[log_source] += count
+            if found:
+                keyword_counts[found] += count
         
-        if not logs:
+        total_logs = sum(sources.values())
+        if not total_logs:
             return None
         
-        summary = self._summarize_logs_locally(resource_ref, logs)
+        # Only the sample lines are fetched as rows, trimmed and cut by the
+        # database so large payloads never leave it
+        trimmed = func.trim(LogEntry.content, _WHITESPACE)
+        result = await db.execute(
+            select(LogEntry.timestamp, func.substr(trimmed, 1, SAMPLE_CHARS))
+            .where(*in_day, trimmed != "")
+            .order_by(LogEntry.timestamp)
+            .limit(SAMPLE_LINES)
+        )
+        samples = [f"- [{ts.isoformat()}] {content}" for ts, content in result.all()]
+        
+        summary = self._format_summary(resource_ref, total_logs, sources, keyword_counts, samples)
         
         if summary:
             # Index into RAG
@@ -48,13 +109,44 @@ class SummaryGenerator:
                     "end": end.isoformat(),
                 },
                 metadata={
-                    "log_count": len(logs),
+                    "log_count": total_logs,
                     "date": date.strftime("%Y-%m-%d"),
                 },
             )
         
         return summary
     
+    async def backfill_month(
+        self,
+        resource_ref: str,
+        year: int,
+        month: int,
+    ) -> list[str | None | BaseException]:
+        """Generate the daily summaries for every day of a month concurrently.
+        
+        Each day runs in its own database session, since one AsyncSession
+        cannot run queries concurrently. At most `ollama_num_parallel` days
+        are in flight, matching what Ollama serves in parallel.
+        
+        Returns:
+            One result per day in date order: the summary, None for a day
+            without logs, or the exception that day raised.
+        """
+        days_in_month = calendar.monthrange(year, month)[1]
+        semaphore = asyncio.Semaphore(max(1, get_settings().ollama_num_parallel))
+        
+        async def summarize_day(day: int) -> str | None:
+            async with semaphore:
+                async with async_session_maker() as db:
+                    return await self.generate_daily_summary(
+                        db, resource_ref, datetime(year, month, day)
+                    )
+        
+        return await asyncio.gather(
+            *(summarize_day(day) for day in range(1, days_in_month + 1)),
+            return_exceptions=True,
+        )
+    
     async def generate_monthly_rollup(
         self,
         db: AsyncSession,
@@ -71,13 +163,16 @@ class SummaryGenerator:
             return None
         
         # Combine summaries
-        combined = "\n\n---\n\n".join([
-            f"**{s.get('time_range', {}).get('start', 'Unknown date')}**\n{s['text']}"
-            for s in summaries
-        ])
-        
-        if len(combined) > 6000:
-            combined = combined[:6000] + "\n... (truncated)"
+        combined, truncated = _join_bounded(
+            (
+                f"**{s.get('time_range', {}).get('start', 'Unknown date')}**\n{s['text']}"
+                for s in summaries
+            ),
+            "\n\n---\n\n",
+            ROLLUP_CHARS,
+        )
+        if truncated:
+            combined += "\n... (truncated)"
         
         return (
             f"## Monthly Log Summary for {resource_ref} ({year}-{month:02d})\n\n"
@@ -86,24 +181,35 @@ class SummaryGenerator:
             f"{combined}\n"
         )
 
-    def _summarize_logs_locally(self, resource_ref: str, logs: list[LogEntry]) -> str:
-        """Generate a deterministic summary without LLM calls."""
-        total_logs = len(logs)
+    def _summarize_logs_locally(self, resource_ref: str, logs: Sequence[Any]) -> str:
+        """Generate a deterministic summary without LLM calls.
+
+        `logs` may be LogEntry objects or rows with timestamp, log_source and
+        content columns.
+        """
         sources = Counter(log.log_source for log in logs)
-        keywords = ["error", "exception", "failed", "fatal", "panic", "crash"]
         keyword_counts = Counter()
         samples = []
 
         for log in logs:
             content = log.content.strip()
-            if len(samples) < 5 and content:
-                samples.append(f"- [{log.timestamp.isoformat()}] {content[:200]}")
-            lower = content.lower()
-            for keyword in keywords:
-                if keyword in lower:
-                    keyword_counts[keyword] += 1
-                    break
+            if len(samples) < SAMPLE_LINES and content:
+                samples.append(f"- [{log.timestamp.isoformat()}] {content[:SAMPLE_CHARS]}")
+            keyword = match_error_keyword(content)
+            if keyword:
+                keyword_counts[keyword] += 1
+
+        return self._format_summary(resource_ref, len(logs), sources, keyword_counts, samples)
 
+    def _format_summary(
+        self,
+        resource_ref: str,
+        total_logs: int,
+        sources: Counter,
+        keyword_counts: Counter,
+        samples: list[str],
+    ) -> str:
+        """Render the summary text from counts and sample lines."""
         source_summary = ", ".join(f"{name}: {count}" for name, count in sources.items())
         keyword_summary = (
             ", ".join(f"{key}: {count}" for key, count in keyword_counts.most_common())
@@ -121,6 +227,5 @@ class SummaryGenerator:
             f"{samples_text}\n"
         )
 
-
 # Singleton
 summary_generator = SummaryGenerator()
@@ -6,6 +6,7 @@ Only changes adapter implementations and safety constraints - never business log
 
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Protocol, runtime_checkable, Optional, Any
 
 from homelab.runtime.mode import ExecutionMode, get_execution_mode
@@ -150,25 +151,33 @@ class RuntimeDependencies:
 # ============================================================================
 # Adapter Factory Functions
 # ============================================================================
+# Each adapter is built once per process and shared, so every handler uses
+# the same client connections. Imports stay inside the factories: the real
+# adapters need optional libraries (docker, proxmoxer) that mock mode
+# never loads.
 
+@lru_cache(maxsize=1)
 def _get_mock_docker_adapter() -> DockerAdapterProtocol:
     """Get mock Docker adapter."""
     from homelab.adapters.mock_docker import MockDockerAdapter
     return MockDockerAdapter()
 
 
+@lru_cache(maxsize=1)
 def _get_real_docker_adapter() -> DockerAdapterProtocol:
     """Get real Docker adapter."""
     from homelab.adapters.docker_adapter import DockerAdapter
     return DockerAdapter()
 
 
+@lru_cache(maxsize=1)
 def _get_mock_proxmox_adapter() -> ProxmoxAdapterProtocol:
     """Get mock Proxmox adapter."""
     from homelab.adapters.mock_proxmox import MockProxmoxAdapter
     return MockProxmoxAdapter()
 
 
+@lru_cache(maxsize=1)
 def _get_real_proxmox_adapter() -> ProxmoxAdapterProtocol:
     """Get real Proxmox adapter."""
     from homelab.adapters.proxmox_adapter import ProxmoxAdapter
@@ -260,6 +269,13 @@ def get_cached_adapters() -> RuntimeDependencies:
 
 
 def reset_cached_adapters() -> None:
-    """Reset cached adapters. Useful for tests."""
+    """Reset cached adapters and adapter instances. Useful for tests."""
     global _cached_deps
     _cached_deps = None
+    for factory in (
+        _get_mock_docker_adapter,
+        _get_real_docker_adapter,
+        _get_mock_proxmox_adapter,
+        _get_real_proxmox_adapter,
+    ):
+        factory.cache_clear()
@@ -37,6 +37,21 @@ _mode_context: ContextVar[Optional[ExecutionMode]] = ContextVar("execution_mode"
 # Module-level default (can be set once at startup)
 _default_mode: ExecutionMode = ExecutionMode.mock
 
+# Mode checks for _default_mode, precomputed by _set_default_mode() so the
+# is_*_mode() helpers skip enum comparisons when no override is active
+_default_is_mock = True
+_default_is_integration = False
+_default_is_lab = False
+
+
+def _set_default_mode(mode: ExecutionMode) -> None:
+    """Set _default_mode and its precomputed checks."""
+    global _default_mode, _default_is_mock, _default_is_integration, _default_is_lab
+    _default_mode = mode
+    _default_is_mock = mode == ExecutionMode.mock
+    _default_is_integration = mode == ExecutionMode.integration
+    _default_is_lab = mode == ExecutionMode.lab
+
 
 def _detect_mode_from_env() -> ExecutionMode:
     """Detect execution mode from environment variables."""
@@ -82,15 +97,13 @@ def set_execution_mode(mode: ExecutionMode) -> None:
     This should be called once at startup. For per-test overrides,
     use execution_mode_context() instead.
     """
-    global _default_mode
-    _default_mode = mode
+    _set_default_mode(mode)
     logger.info(f"[Runtime] Execution mode set to: {mode.value}")
 
 
 def reset_execution_mode() -> None:
     """Reset to auto-detected mode. Useful for tests."""
-    global _default_mode
-    _default_mode = _detect_mode_from_env()
+    _set_default_mode(_detect_mode_from_env())
     _mode_context.set(None)
 
 
@@ -139,22 +152,34 @@ class async_execution_mode_context:
 # Convenience functions
 def is_mock_mode() -> bool:
     """Check if currently in mock mode."""
-    return get_execution_mode() == ExecutionMode.mock
+    ctx_mode = _mode_context.get()
+    if ctx_mode is None:
+        return _default_is_mock
+    return ctx_mode == ExecutionMode.mock
 
 
 def is_integration_mode() -> bool:
     """Check if currently in integration mode."""
-    return get_execution_mode() == ExecutionMode.integration
+    ctx_mode = _mode_context.get()
+    if ctx_mode is None:
+        return _default_is_integration
+    return ctx_mode == ExecutionMode.integration
 
 
 def is_lab_mode() -> bool:
     """Check if currently in lab mode."""
-    return get_execution_mode() == ExecutionMode.lab
+    ctx_mode = _mode_context.get()
+    if ctx_mode is None:
+        return _default_is_lab
+    return ctx_mode == ExecutionMode.lab
 
 
 def should_execute_real() -> bool:
     """Check if real execution should occur (not mock)."""
-    return get_execution_mode() in (ExecutionMode.integration, ExecutionMode.lab)
+    ctx_mode = _mode_context.get()
+    if ctx_mode is None:
+        return _default_is_integration or _default_is_lab
+    return ctx_mode in (ExecutionMode.integration, ExecutionMode.lab)
 
 
 def get_mode_description() -> str:
@@ -169,5 +194,5 @@ def get_mode_description() -> str:
 
 
 # Initialize default mode from environment
-_default_mode = _detect_mode_from_env()
+_set_default_mode(_detect_mode_from_env())
 logger.info(f"[Runtime] Initial execution mode: {_default_mode.value}")
@@ -4,12 +4,33 @@ Provides a structured way to represent policy decisions, warnings,
 and blocks that can be displayed in the UI and audited.
 """
 
+import sys
+import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 from datetime import datetime, timezone
 
 
+# Most recent timestamp string, keyed by monotonic millisecond: findings
+# created within the same millisecond share one datetime.now().isoformat()
+_ts_cache: list = [0, ""]
+
+
+def _now_iso() -> str:
+    """Current UTC time as ISO-8601, reused within a millisecond.
+    
+    A race between threads can hand out a string up to ~1ms stale, which
+    is harmless for audit timestamps.
+    """
+    now_ms = time.monotonic_ns() // 1_000_000
+    if now_ms != _ts_cache[0]:
+        _ts_cache[0] = now_ms
+        _ts_cache[1] = datetime.now(timezone.utc).isoformat()
+    return _ts_cache[1]
+
+
 class PolicyFindingLevel(str, Enum):
     """Severity level of a policy finding."""
     info = "info"       # Informational, no action needed
@@ -50,10 +71,13 @@ class PolicyFindingCode(str, Enum):
     PARAMETER_INVALID = "PARAMETER_INVALID"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PolicyFinding:
     """A single policy finding from a safety check.
     
+    Findings are immutable, so constant findings can be shared (see the
+    module-level singletons below).
+    
     Attributes:
         level: Severity (info/warn/block)
         code: Machine-readable code for the finding
@@ -65,21 +89,34 @@ class PolicyFinding:
     level: PolicyFindingLevel
     code: PolicyFindingCode
     message: str
-    details: dict = field(default_factory=dict)
+    details: Mapping = field(default_factory=dict)
     rule: Optional[str] = None
-    timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    timestamp: str = field(default_factory=_now_iso)
     
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
+        """Convert to dictionary for JSON serialization.
+        
+        level and code are emitted as their str-Enum members, which JSON
+        encoders write as the plain values.
+        """
+        # A dict literal measured faster than dict(zip(keys, attrgetter(...))),
+        # and callers need dicts (execution records, pydantic responses), not
+        # JSON bytes, so there is no byte serializer to specialize here.
         return {
-            "level": self.level.value,
-            "code": self.code.value,
+            "level": self.level,
+            "code": self.code,
             "message": self.message,
-            "details": self.details,
+            "details": dict(self.details),
             "rule": self.rule,
             "timestamp": self.timestamp,
         }
     
+    def with_timestamp(self) -> "PolicyFinding":
+        """Copy of this finding stamped with the current time."""
+        # Built positionally: dataclasses.replace() re-reads every field by
+        # name and costs more than constructing the finding from scratch
+        return PolicyFinding(self.level, self.code, self.message, self.details, self.rule, _now_iso())
+    
     @classmethod
     def from_dict(cls, data: dict) -> "PolicyFinding":
         """Create from dictionary."""
@@ -89,7 +126,7 @@ class PolicyFinding:
             message=data["message"],
             details=data.get("details", {}),
             rule=data.get("rule"),
-            timestamp=data.get("timestamp", datetime.now(timezone.utc).isoformat()),
+            timestamp=data.get("timestamp", _now_iso()),
         )
     
     @classmethod
@@ -108,49 +145,66 @@ class PolicyFinding:
         return cls(level=PolicyFindingLevel.block, code=code, message=message, **kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyDecision:
     """Complete policy decision for an execution.
     
-    Contains all findings and the final allow/deny decision.
+    Contains all findings and the final allow/deny decision. Findings are
+    bucketed by level once, at construction; add findings afterwards with
+    add_finding() so the buckets stay in step.
     """
     allowed: bool
     findings: list[PolicyFinding] = field(default_factory=list)
     mode: str = "mock"
-    checked_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    checked_at: str = field(default_factory=_now_iso)
+    _by_level: dict[PolicyFindingLevel, list[PolicyFinding]] = field(
+        init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        self._by_level = {level: [] for level in PolicyFindingLevel}
+        for finding in self.findings:
+            self._by_level[finding.level].append(finding)
+    
+    def add_finding(self, finding: PolicyFinding) -> None:
+        """Append a finding to the decision."""
+        self.findings.append(finding)
+        self._by_level[finding.level].append(finding)
     
     @property
     def has_warnings(self) -> bool:
         """Check if there are any warnings."""
-        return any(f.level == PolicyFindingLevel.warn for f in self.findings)
+        return bool(self._by_level[PolicyFindingLevel.warn])
     
     @property
     def has_blocks(self) -> bool:
         """Check if there are any blocks."""
-        return any(f.level == PolicyFindingLevel.block for f in self.findings)
+        return bool(self._by_level[PolicyFindingLevel.block])
     
     @property
     def blocking_findings(self) -> list[PolicyFinding]:
         """Get all blocking findings."""
-        return [f for f in self.findings if f.level == PolicyFindingLevel.block]
+        return list(self._by_level[PolicyFindingLevel.block])
     
     @property
     def warning_findings(self) -> list[PolicyFinding]:
         """Get all warning findings."""
-        return [f for f in self.findings if f.level == PolicyFindingLevel.warn]
+        return list(self._by_level[PolicyFindingLevel.warn])
     
     @property
     def info_findings(self) -> list[PolicyFinding]:
         """Get all info findings."""
-        return [f for f in self.findings if f.level == PolicyFindingLevel.info]
+        return list(self._by_level[PolicyFindingLevel.info])
     
     @property
     def primary_reason(self) -> str:
         """Get the primary reason for the decision."""
-        if self.blocking_findings:
-            return self.blocking_findings[0].message
-        if self.warning_findings:
-            return f"Allowed with {len(self.warning_findings)} warning(s)"
+        blocks = self._by_level[PolicyFindingLevel.block]
+        if blocks:
+            return blocks[0].message
+        warnings = self._by_level[PolicyFindingLevel.warn]
+        if warnings:
+            return f"Allowed with {len(warnings)} warning(s)"
         return "Allowed by policy"
     
     def to_dict(self) -> dict:
@@ -172,7 +226,7 @@ class PolicyDecision:
             allowed=data["allowed"],
             findings=[PolicyFinding.from_dict(f) for f in data.get("findings", [])],
             mode=data.get("mode", "mock"),
-            checked_at=data.get("checked_at", datetime.now(timezone.utc).isoformat()),
+            checked_at=data.get("checked_at", _now_iso()),
         )
     
     @classmethod
@@ -186,15 +240,49 @@ class PolicyDecision:
         return cls(allowed=False, mode=mode, findings=findings)
 
 
+# Constant findings, built once and shared by the zero-argument helpers.
+# Their timestamp is module load time: anything recorded or shown must use
+# with_timestamp() for a copy stamped when the check ran.
+
+_MOCK_MODE_FINDING = PolicyFinding.info(
+    code=PolicyFindingCode.MOCK_MODE_ACTIVE,
+    message="Mock mode: All operations are simulated",
+    details=MappingProxyType({}),
+    rule="EXECUTION_MODE=mock",
+)
+
+_INTEGRATION_PROXMOX_BLOCKED = PolicyFinding.block(
+    code=PolicyFindingCode.INTEGRATION_PROXMOX_BLOCKED,
+    message="Proxmox operations are blocked in integration mode",
+    details=MappingProxyType({}),
+    rule="Integration mode: Proxmox access disabled",
+)
+
+_INTEGRATION_PRUNE_BLOCKED = PolicyFinding.block(
+    code=PolicyFindingCode.INTEGRATION_PRUNE_BLOCKED,
+    message="Prune operations are blocked by default in integration mode",
+    details=MappingProxyType({"env_var": "INTEGRATION_ALLOW_PRUNE"}),
+    rule="Set INTEGRATION_ALLOW_PRUNE=true to enable",
+)
+
+
+# Rule text shared by every finding a helper builds. Per-target messages and
+# rules are left as ordinary strings: interning them would keep one immortal
+# string per container, skill or target ever checked.
+_RULE_INTEGRATION_LABEL_REQUIRED = sys.intern("Integration mode: Only containers with wingman.test=true label can be modified")
+_RULE_INTEGRATION_LABEL_VERIFIED = sys.intern("Integration mode: Container label verified")
+_RULE_PRUNE_ENABLED = sys.intern("Prune operations enabled by environment variable")
+_RULE_LAB_DANGEROUS_DISABLED = sys.intern("Set LAB_DANGEROUS_OK=true to enable dangerous operations")
+_RULE_LAB_DANGEROUS_ENABLED = sys.intern("Dangerous operations enabled by environment variable")
+_RULE_LAB_READ_ONLY = sys.intern("Lab is in read-only mode; only diagnostic skills allowed")
+_RULE_SKILL_READ_ONLY = sys.intern("Read-only skills are always allowed")
+
+
 # Helper functions for common findings
 
 def mock_mode_finding() -> PolicyFinding:
     """Finding for mock mode (all ops simulated)."""
-    return PolicyFinding.info(
-        code=PolicyFindingCode.MOCK_MODE_ACTIVE,
-        message="Mock mode: All operations are simulated",
-        rule="EXECUTION_MODE=mock",
-    )
+    return _MOCK_MODE_FINDING
 
 
 def integration_label_missing(container_id: str) -> PolicyFinding:
@@ -203,7 +291,7 @@ def integration_label_missing(container_id: str) -> PolicyFinding:
         code=PolicyFindingCode.INTEGRATION_LABEL_MISSING,
         message=f"Container '{container_id}' missing wingman.test=true label",
         details={"container_id": container_id, "required_label": "wingman.test=true"},
-        rule="Integration mode: Only containers with wingman.test=true label can be modified",
+        rule=_RULE_INTEGRATION_LABEL_REQUIRED,
     )
 
 
@@ -213,27 +301,18 @@ def integration_label_present(container_id: str) -> PolicyFinding:
         code=PolicyFindingCode.INTEGRATION_LABEL_PRESENT,
         message=f"Container '{container_id}' has wingman.test=true label",
         details={"container_id": container_id},
-        rule="Integration mode: Container label verified",
+        rule=_RULE_INTEGRATION_LABEL_VERIFIED,
     )
 
 
 def integration_proxmox_blocked() -> PolicyFinding:
     """Finding for blocked Proxmox access in integration mode."""
-    return PolicyFinding.block(
-        code=PolicyFindingCode.INTEGRATION_PROXMOX_BLOCKED,
-        message="Proxmox operations are blocked in integration mode",
-        rule="Integration mode: Proxmox access disabled",
-    )
+    return _INTEGRATION_PROXMOX_BLOCKED
 
 
 def integration_prune_blocked() -> PolicyFinding:
     """Finding for blocked prune operation."""
-    return PolicyFinding.block(
-        code=PolicyFindingCode.INTEGRATION_PRUNE_BLOCKED,
-        message="Prune operations are blocked by default in integration mode",
-        details={"env_var": "INTEGRATION_ALLOW_PRUNE"},
-        rule="Set INTEGRATION_ALLOW_PRUNE=true to enable",
-    )
+    return _INTEGRATION_PRUNE_BLOCKED
 
 
 def integration_prune_allowed() -> PolicyFinding:
@@ -242,7 +321,7 @@ def integration_prune_allowed() -> PolicyFinding:
         code=PolicyFindingCode.INTEGRATION_PRUNE_ALLOWED,
         message="Prune operation allowed via INTEGRATION_ALLOW_PRUNE=true",
         details={"env_var": "INTEGRATION_ALLOW_PRUNE", "value": "true"},
-        rule="Prune operations enabled by environment variable",
+        rule=_RULE_PRUNE_ENABLED,
     )
 
 
@@ -272,7 +351,7 @@ def lab_dangerous_blocked(skill_id: str) -> PolicyFinding:
         code=PolicyFindingCode.LAB_DANGEROUS_BLOCKED,
         message=f"Dangerous skill '{skill_id}' blocked in lab mode",
         details={"skill_id": skill_id, "env_var": "LAB_DANGEROUS_OK"},
-        rule="Set LAB_DANGEROUS_OK=true to enable dangerous operations",
+        rule=_RULE_LAB_DANGEROUS_DISABLED,
     )
 
 
@@ -282,7 +361,7 @@ def lab_dangerous_allowed(skill_id: str) -> PolicyFinding:
         code=PolicyFindingCode.LAB_DANGEROUS_ALLOWED,
         message=f"Dangerous skill '{skill_id}' allowed via LAB_DANGEROUS_OK=true",
         details={"skill_id": skill_id},
-        rule="Dangerous operations enabled by environment variable",
+        rule=_RULE_LAB_DANGEROUS_ENABLED,
     )
 
 
@@ -292,7 +371,7 @@ def lab_read_only_blocked(skill_id: str) -> PolicyFinding:
         code=PolicyFindingCode.LAB_READ_ONLY_MODE,
         message=f"Non-diagnostic skill '{skill_id}' blocked (LAB_READ_ONLY=true)",
         details={"skill_id": skill_id},
-        rule="Lab is in read-only mode; only diagnostic skills allowed",
+        rule=_RULE_LAB_READ_ONLY,
     )
 
 
@@ -302,5 +381,5 @@ def skill_read_only(skill_id: str) -> PolicyFinding:
         code=PolicyFindingCode.SKILL_READ_ONLY,
         message=f"Skill '{skill_id}' is read-only (diagnostic)",
         details={"skill_id": skill_id},
-        rule="Read-only skills are always allowed",
+        rule=_RULE_SKILL_READ_ONLY,
     )
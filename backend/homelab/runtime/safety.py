@@ -195,7 +195,7 @@ class MockSafetyPolicy(SafetyPolicy):
         """Mock mode returns allow with info finding."""
         return PolicyDecision.allow(
             mode="mock",
-            findings=[mock_mode_finding()],
+            findings=[mock_mode_finding().with_timestamp()],
         )
 
 
@@ -367,7 +367,7 @@ class IntegrationSafetyPolicy(SafetyPolicy):
         
         # Proxmox operations always denied
         if target_type == "proxmox":
-            findings.append(integration_proxmox_blocked())
+            findings.append(integration_proxmox_blocked().with_timestamp())
             return PolicyDecision.deny(mode="integration", findings=findings)
         
         # Read-only skills always allowed
@@ -378,7 +378,7 @@ class IntegrationSafetyPolicy(SafetyPolicy):
         # Prune skills require explicit opt-in
         if skill_id in self.PRUNE_SKILLS:
             if not self._allow_prune:
-                findings.append(integration_prune_blocked())
+                findings.append(integration_prune_blocked().with_timestamp())
                 return PolicyDecision.deny(mode="integration", findings=findings)
             findings.append(integration_prune_allowed())
             return PolicyDecision.allow(mode="integration", findings=findings)
@@ -1,5 +1,7 @@
 """Background scheduler for periodic tasks."""
 
+import logging
+
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
@@ -11,6 +13,8 @@ from homelab.control_plane import incident_detector
 
 from homelab.control_plane.control_plane import control_plane
 
+logger = logging.getLogger(__name__)
+
 scheduler = AsyncIOScheduler()
 
 async def run_control_plane_loop():
@@ -28,9 +32,9 @@ def start_scheduler():
     )
     
     scheduler.start()
-    print("[Scheduler] Background scheduler started (Control Plane Loop: 60s)")
+    logger.info("[Scheduler] Background scheduler started (Control Plane Loop: 60s)")
 
 def stop_scheduler():
     """Stop the background scheduler."""
     scheduler.shutdown()
-    print("[Scheduler] Background scheduler stopped")
+    logger.info("[Scheduler] Background scheduler stopped")
@@ -28,6 +28,7 @@ from jinja2 import sandbox
 
 from homelab.adapters import docker_adapter, proxmox_adapter
 from homelab.policy.policy_engine import policy_engine
+from homelab.policy.rate_limiter import action_rate_limiter
 from homelab.storage.database import async_session_maker
 from homelab.storage.models import ActionHistory, ActionStatus, ActionTemplate
 from homelab.storage.audit_chain import prepare_chained_entry
@@ -361,6 +362,9 @@ class SkillRunner:
                 db.add(action)
                 await db.commit()
                 
+                if action.executed_at is not None:
+                    await action_rate_limiter.record(action.target_resource, action_template)
+                
                 execution.action_history_id = action.id
                 self._add_log(execution, f"Rejection recorded to ActionHistory: {action.id} (chain seq: {action.sequence_num})")
                 
@@ -770,6 +774,9 @@ class SkillRunner:
                 db.add(action)
                 await db.commit()
                 
+                if action.executed_at is not None:
+                    await action_rate_limiter.record(action.target_resource, action_template)
+                
                 execution.action_history_id = action.id
                 self._add_log(execution, f"Recorded to ActionHistory: {action.id} (chain seq={action.sequence_num})")
                 
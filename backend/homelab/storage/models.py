@@ -76,13 +76,15 @@ class LogEntry(Base):
     __tablename__ = "log_entries"
     
     id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid4()))
-    resource_ref: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    resource_ref: Mapped[str] = mapped_column(String(255), nullable=False)  # Leads ix_log_entries_resource_time
     log_source: Mapped[str] = mapped_column(String(50), nullable=False)  # "stdout", "stderr", "file"
     content: Mapped[str] = mapped_column(Text, nullable=False)
     timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
-    retention_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)  # 90 days from creation
+    retention_date: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)  # 90 days from creation
     
     __table_args__ = (
+        # Per-resource time windows (daily summaries, narrative context)
+        # are one range scan, already in timestamp order
         Index("ix_log_entries_resource_time", "resource_ref", "timestamp"),
     )
 
@@ -210,6 +212,11 @@ class ActionHistory(Base):
     
     # Relationships
     incident: Mapped["Incident | None"] = relationship(back_populates="actions")
+    
+    __table_args__ = (
+        # Rate-limit lookups: equality columns first, time range last
+        Index("ix_action_history_target_action_time", "target_resource", "action_template", "executed_at"),
+    )
 
 
 class TodoStep(Base):
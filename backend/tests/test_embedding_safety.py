@@ -8,11 +8,22 @@ These tests verify the critical safety mechanisms that prevent:
 """
 
 import asyncio
+import sys
+import threading
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import os
 
 
+def mock_qdrant():
+    """Patch the sync (admin) and async (hot path) Qdrant clients."""
+    return patch.multiple(
+        "homelab.rag.rag_indexer",
+        QdrantClient=MagicMock(),
+        AsyncQdrantClient=MagicMock(return_value=AsyncMock()),
+    )
+
+
 class TestEmbeddingDimensionPrelock:
     """Test pre-locking dimension from Qdrant on startup."""
 
@@ -90,6 +101,408 @@ class TestEmbeddingRaceSafety:
             assert manager._embedding_dimension == 768
 
 
+class TestBatchEmbedding:
+    """Test batch embedding through the manager and indexer."""
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_locks_dimension(self):
+        """A batch embed locks the dimension like a single embed."""
+        with patch.dict(os.environ, {"ALLOW_CLOUD_LLM": "false"}):
+            from homelab.llm.providers import LLMManager, LLMProvider
+
+            manager = LLMManager()
+
+            mock_provider = MagicMock()
+            mock_provider.embed_batch = AsyncMock(return_value=[[0.1] * 1024, [0.2] * 1024])
+            mock_provider.get_default_model = MagicMock(return_value="mxbai-embed-large")
+            manager._providers[LLMProvider.OLLAMA] = mock_provider
+
+            results = await manager.embed_batch(["text 1", "text 2"])
+
+            assert len(results) == 2
+            mock_provider.embed_batch.assert_awaited_once()
+            assert manager._embedding_dimension_locked is True
+            assert manager._embedding_dimension == 1024
+
+    @pytest.mark.asyncio
+    async def test_ollama_without_batch_endpoint_falls_back(self):
+        """A bare 404 from /api/embed switches Ollama to per-text embeddings."""
+        from homelab.llm.providers import OllamaProvider
+
+        provider = OllamaProvider()
+        client = MagicMock()
+        client.post = AsyncMock(return_value=MagicMock(status_code=404, text="404 page not found"))
+
+        with patch("homelab.llm.providers.get_http_client", return_value=client), \
+                patch.object(provider, "embed", AsyncMock(side_effect=[[0.1], [0.2]])) as embed:
+            results = await provider.embed_batch(["a", "b"])
+
+        assert results == [[0.1], [0.2]]
+        assert embed.await_count == 2
+        assert provider._batch_embed_supported is False
+        client.post.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_index_narratives_bulk_single_upsert(self):
+        """Bulk indexing embeds once and upserts every point in one call."""
+        with mock_qdrant():
+            from homelab.rag.rag_indexer import RAGIndexer
+
+            indexer = RAGIndexer()
+            items = [
+                {"narrative_id": f"n{i}", "narrative_text": f"text {i}", "incident_id": f"i{i}"}
+                for i in range(3)
+            ]
+            with patch(
+                "homelab.rag.rag_indexer.llm_manager.embed_batch",
+                AsyncMock(return_value=[[0.1] * 768] * 3),
+            ) as embed_batch:
+                count = await indexer.index_narratives_bulk(items)
+
+            assert count == 3
+            embed_batch.assert_awaited_once()
+            indexer.async_client.upsert.assert_awaited_once()
+            assert len(indexer.async_client.upsert.call_args.kwargs["points"]) == 3
+
+
+class TestUpsertBatching:
+    """Test that concurrent single-point upserts share requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_index_calls_coalesce(self):
+        """Points queued before the flush task runs go out in one request."""
+        with mock_qdrant():
+            from homelab.rag.rag_indexer import RAGIndexer
+
+            indexer = RAGIndexer()
+
+            async def in_flight(**kwargs):
+                await asyncio.sleep(0)
+
+            indexer.async_client.upsert.side_effect = in_flight
+            with patch(
+                "homelab.rag.rag_indexer.llm_manager.embed_batch",
+                AsyncMock(return_value=[[0.1] * 768]),
+            ):
+                results = await asyncio.gather(*(
+                    indexer.index_narrative(f"n{i}", f"narrative {i}", f"i{i}")
+                    for i in range(5)
+                ))
+
+            assert all(results)
+            batches = [len(c.kwargs["points"]) for c in indexer.async_client.upsert.call_args_list]
+            assert batches == [5]
+
+    @pytest.mark.asyncio
+    async def test_close_drains_queued_upserts(self):
+        """Points queued by a cancelled caller are still sent before close."""
+        with mock_qdrant():
+            from homelab.rag.rag_indexer import RAGIndexer
+            from qdrant_client.models import PointStruct
+
+            indexer = RAGIndexer()
+            caller = asyncio.create_task(
+                indexer._upsert("incident_narratives", PointStruct(id=1, vector=[0.1], payload={}))
+            )
+            await asyncio.sleep(0)
+            caller.cancel()
+
+            await indexer.close()
+
+            indexer.async_client.upsert.assert_awaited_once()
+            indexer.async_client.close.assert_awaited_once()
+            assert indexer._flush_tasks == {}
+
+    @pytest.mark.asyncio
+    async def test_upsert_error_reaches_each_caller(self):
+        """A failed batch fails every index call that was in it."""
+        with mock_qdrant():
+            from homelab.rag.rag_indexer import RAGIndexer
+
+            indexer = RAGIndexer()
+            indexer.async_client.upsert.side_effect = RuntimeError("qdrant down")
+            with patch(
+                "homelab.rag.rag_indexer.llm_manager.embed_batch",
+                AsyncMock(return_value=[[0.1] * 768]),
+            ):
+                results = await asyncio.gather(*(
+                    indexer.index_log_summary(f"docker://svc{i}", f"summary {i}", {})
+                    for i in range(3)
+                ))
+
+            assert results == [False, False, False]
+
+
+class TestCollectionIndexSettings:
+    """Test HNSW and quantization settings on collection creation and search."""
+
+    @pytest.mark.asyncio
+    async def test_collections_created_with_tuned_hnsw(self):
+        """Missing collections are created with the indexer's HNSW graph parameters."""
+        with mock_qdrant():
+            from homelab.rag.rag_indexer import RAGIndexer, HNSW_M, HNSW_EF_CONSTRUCT
+
+            indexer = RAGIndexer()
+            indexer.async_client.collection_exists.side_effect = [True, False]
+            await indexer.ensure_collections()
+
+            create = indexer.async_client.create_collection
+            assert create.await_count == 1
+            assert create.call_args.kwargs["collection_name"] == "log_summaries"
+            hnsw = create.call_args.kwargs["hnsw_config"]
+            assert (hnsw.m, hnsw.ef_construct) == (HNSW_M, HNSW_EF_CONSTRUCT)
+            quantization = create.call_args.kwargs["quantization_config"]
+            assert quantization.scalar.always_ram is True
+
+    @pytest.mark.asyncio
+    async def test_existing_unquantized_collection_upgraded(self):
+        """Collections created without quantization get it; quantized ones are left alone."""
+        with mock_qdrant():
+            from homelab.rag.rag_indexer import RAGIndexer
+
+            indexer = RAGIndexer()
+            plain = MagicMock()
+            plain.config.quantization_config = None
+            indexer.async_client.collection_exists.return_value = True
+            indexer.async_client.get_collection.side_effect = [plain, MagicMock()]
+
+            await indexer.ensure_collections()
+
+            update = indexer.async_client.update_collection
+            update.assert_awaited_once()
+            assert update.call_args.kwargs["collection_name"] == "incident_narratives"
+            indexer.async_client.create_collection.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_collections_checked_until_first_success(self):
+        """A failed check is retried; after a success Qdrant isn't asked again."""
+        with mock_qdrant():
+            from homelab.rag.rag_indexer import RAGIndexer
+
+            indexer = RAGIndexer()
+            exists = indexer.async_client.collection_exists
+            exists.side_effect = [Exception("qdrant starting"), True, True, True]
+
+            for _ in range(3):
+                await indexer.ensure_collections()
+
+            assert exists.await_count == 4  # two per check, two checks
+
+    @pytest.mark.asyncio
+    async def test_existing_dimension_ignores_missing_collection(self):
+        """A missing collection doesn't count as a dimension conflict."""
+        with mock_qdrant():
+            from homelab.rag.rag_indexer import RAGIndexer
+
+            indexer = RAGIndexer()
+            narratives = MagicMock()
+            narratives.config.params.vectors.size = 768
+            indexer.async_client.get_collection.side_effect = [narratives, Exception("not found")]
+
+            assert await indexer.get_existing_dimension() == (768, True)
+
+    @pytest.mark.asyncio
+    async def test_search_passes_ef(self):
+        """Callers choose the search-time ef."""
+        with mock_qdrant():
+            from homelab.rag.rag_indexer import RAGIndexer
+
+            indexer = RAGIndexer()
+            indexer.async_client.query_points.return_value = MagicMock(points=[])
+            with patch(
+                "homelab.rag.rag_indexer.llm_manager.embed_batch",
+                AsyncMock(return_value=[[0.1] * 768]),
+            ):
+                await indexer.search_summaries("disk errors", ef_search=40)
+
+            search_params = indexer.async_client.query_points.call_args.kwargs["search_params"]
+            assert search_params.hnsw_ef == 40
+            assert search_params.quantization.rescore is True
+
+
+class TestSearchBoth:
+    """Test combined narrative + summary search."""
+
+    @pytest.mark.asyncio
+    async def test_one_embedding_two_searches(self):
+        """Both collections are searched with a single embedding call."""
+        with mock_qdrant():
+            from homelab.rag.rag_indexer import (
+                RAGIndexer,
+                NARRATIVES_COLLECTION,
+                SUMMARIES_COLLECTION,
+            )
+
+            indexer = RAGIndexer()
+            indexer.async_client.query_points.return_value = MagicMock(points=[])
+            with patch(
+                "homelab.rag.rag_indexer.llm_manager.embed_batch",
+                AsyncMock(return_value=[[0.1] * 768]),
+            ) as embed_batch:
+                narratives, summaries = await indexer.search_both("nginx 502", limit=2)
+
+            assert (narratives, summaries) == ([], [])
+            embed_batch.assert_awaited_once()
+            searched = {
+                c.kwargs["collection_name"]: c.kwargs["with_payload"]
+                for c in indexer.async_client.query_points.call_args_list
+            }
+            assert searched == {
+                NARRATIVES_COLLECTION: ["narrative_id", "incident_id", "text"],
+                SUMMARIES_COLLECTION: ["resource_ref", "text", "time_range"],
+            }
+
+    @pytest.mark.asyncio
+    async def test_search_batch_single_request(self):
+        """Several queries share one embedding call and one Qdrant request."""
+        with mock_qdrant():
+            from homelab.rag.rag_indexer import RAGIndexer, SUMMARIES_COLLECTION
+
+            indexer = RAGIndexer()
+            hit = MagicMock(score=0.9, payload={"resource_ref": "docker://web", "text": "t"})
+            indexer.async_client.query_batch_points.return_value = [
+                MagicMock(points=[hit]),
+                MagicMock(points=[]),
+            ]
+            with patch(
+                "homelab.rag.rag_indexer.llm_manager.embed_batch",
+                AsyncMock(return_value=[[0.1] * 768, [0.2] * 768]),
+            ) as embed_batch:
+                results = await indexer.search_batch(SUMMARIES_COLLECTION, ["day 1", "day 2"])
+
+            embed_batch.assert_awaited_once()
+            indexer.async_client.query_batch_points.assert_awaited_once()
+            assert len(indexer.async_client.query_batch_points.call_args.kwargs["requests"]) == 2
+            assert results[0][0]["resource_ref"] == "docker://web"
+            assert results[1] == []
+
+
+class TestEmbeddingCache:
+    """Test the in-process query embedding cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_query_served_from_cache(self):
+        """The same text is embedded once; later calls hit the cache."""
+        with mock_qdrant():
+            from homelab.rag.rag_indexer import RAGIndexer
+
+            indexer = RAGIndexer()
+            with patch(
+                "homelab.rag.rag_indexer.llm_manager.embed_batch",
+                AsyncMock(return_value=[[0.25] * 768]),
+            ) as embed_batch:
+                first = await indexer._get_embedding("disk full on nas")
+                second = await indexer._get_embedding("disk full on nas")
+
+            assert first == second
+            embed_batch.assert_awaited_once()
+            assert indexer.embedding_cache.stats()["hits"] == 1
+
+    def test_cache_evicts_least_recently_used(self):
+        """Past maxsize, the least recently used vector is dropped."""
+        from homelab.rag.rag_indexer import EmbeddingCache
+
+        cache = EmbeddingCache(maxsize=2)
+        a, b, c = (cache.key("m", t) for t in "abc")
+        cache.put(a, [1.0])
+        cache.put(b, [2.0])
+        cache.get(a)
+        cache.put(c, [3.0])
+
+        assert cache.get(b) is None
+        assert cache.get(a) == [1.0]
+
+    def test_cache_stores_float32(self):
+        """Cached vectors come back at float32 precision, as Qdrant stores them."""
+        from homelab.rag.rag_indexer import EmbeddingCache
+
+        cache = EmbeddingCache()
+        key = cache.key("m", "a")
+        cache.put(key, [0.1, 0.5])
+
+        assert cache.get(key) == [pytest.approx(0.1, rel=1e-7), 0.5]
+        assert cache.get(key)[0] != 0.1
+
+
+class TestNearDuplicateEmbedding:
+    """Test vector reuse for near-identical long texts."""
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_summary_reuses_vector(self):
+        """A long text differing in a few characters is not embedded again."""
+        with mock_qdrant():
+            from homelab.rag.rag_indexer import RAGIndexer
+
+            indexer = RAGIndexer()
+            day1 = " ".join(f"line {i}: nginx upstream timeout on docker://web" for i in range(40))
+            day2 = day1.replace("line 7:", "line 7b:")
+            unrelated = " ".join(f"backup job {i} for proxmox://pve/qemu/{i} finished" for i in range(40))
+
+            with patch(
+                "homelab.rag.rag_indexer.llm_manager.embed_batch",
+                AsyncMock(return_value=[[0.1] * 768]),
+            ) as embed_batch:
+                await indexer._get_embedding(day1)
+                await indexer._get_embedding(day2)
+                assert embed_batch.await_count == 1
+
+                await indexer._get_embedding(unrelated)
+                assert embed_batch.await_count == 2
+
+
+    @pytest.mark.asyncio
+    async def test_signatures_computed_off_event_loop(self):
+        """MinHash for a batch runs once, in a worker thread."""
+        with mock_qdrant():
+            from homelab.rag.rag_indexer import RAGIndexer
+
+            rag_indexer_module = sys.modules["homelab.rag.rag_indexer"]
+            indexer = RAGIndexer()
+            texts = [" ".join(f"entry {i}-{j} for docker://web" for j in range(30)) for i in range(3)]
+            threads = []
+            real_signature = rag_indexer_module.minhash_signature
+
+            def recording_signature(text):
+                threads.append(threading.current_thread())
+                return real_signature(text)
+
+            with patch.object(rag_indexer_module, "minhash_signature", side_effect=recording_signature), \
+                    patch(
+                        "homelab.rag.rag_indexer.llm_manager.embed_batch",
+                        AsyncMock(return_value=[[0.25] * 768] * 3),
+                    ):
+                await indexer._get_embeddings(texts)
+
+            assert len(threads) == 3
+            assert len(set(threads)) == 1
+            assert threads[0] is not threading.main_thread()
+
+
+class TestBulkEmbeddingCaches:
+    """Test that batch embedding only sends cache misses to the provider."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_embeds_only_new_texts(self):
+        """Texts already embedded (or near-duplicates of them) are not re-sent."""
+        with mock_qdrant():
+            from homelab.rag.rag_indexer import RAGIndexer
+
+            indexer = RAGIndexer()
+            seen = " ".join(f"step {i}: restarted docker://web after OOM kill" for i in range(20))
+            near = seen.replace("step 3:", "step 3b:")
+            new = " ".join(f"snapshot {i} of proxmox://pve/qemu/{i} completed" for i in range(20))
+
+            with patch(
+                "homelab.rag.rag_indexer.llm_manager.embed_batch",
+                AsyncMock(side_effect=[[[0.25] * 768], [[0.5] * 768]]),
+            ) as embed_batch:
+                await indexer._get_embedding(seen)
+                vectors = await indexer._get_embeddings([seen, near, new])
+
+            assert vectors == [[0.25] * 768, [0.25] * 768, [0.5] * 768]
+            assert embed_batch.call_args.args[0] == [new]
+
+
 class TestEmbeddingDimensionMismatchRejection:
     """Test that dimension changes are properly rejected."""
 
@@ -185,6 +598,33 @@ class TestCloudProviderGuard:
                 manager._get_provider(LLMProvider.OPENROUTER)
 
 
+class TestGenerateMany:
+    """Test length-binned concurrent generation."""
+
+    @pytest.mark.asyncio
+    async def test_short_prompts_first_results_in_order(self):
+        """Shorter bins run first; results and errors keep input order."""
+        from homelab.llm.providers import LLMManager, LLM_LENGTH_BIN_CHARS
+
+        manager = LLMManager()
+        long_prompt = "x" * (LLM_LENGTH_BIN_CHARS + 1)
+        started = []
+
+        async def fake_generate(prompt, function):
+            started.append(len(prompt))
+            if prompt == "bad":
+                raise RuntimeError("model unloaded")
+            return f"out {len(prompt)}"
+
+        with patch.object(manager, "generate", side_effect=fake_generate):
+            results = await manager.generate_many([long_prompt, "short", "bad"])
+
+        assert started == [5, 3, len(long_prompt)]
+        assert results[0] == f"out {len(long_prompt)}"
+        assert results[1] == "out 5"
+        assert isinstance(results[2], RuntimeError)
+
+
 class TestDestructiveOperationGuards:
     """Test guards on destructive operations."""
 
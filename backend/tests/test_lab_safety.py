@@ -0,0 +1,105 @@
+"""
+Tests for LAB mode safety enforcement.
+
+Verifies:
+- Allowlist parsing and target checks
+- Read-only and dangerous skill classification
+- Status caching and env-change invalidation
+"""
+
+import os
+from unittest.mock import patch
+
+from homelab.policy.lab_safety import LabModeStatus, LabSafetyEnforcer
+
+
+class TestTargetAllowlist:
+    """Test allowlist membership checks."""
+
+    def test_container_exact_and_prefix_match(self):
+        """Containers match an allowlist entry exactly or by prefix."""
+        with patch.dict(os.environ, {"WINGMAN_CONTAINER_ALLOWLIST": "web-, db"}):
+            enforcer = LabSafetyEnforcer()
+            assert enforcer.check_target_allowed("db")[0]
+            assert enforcer.check_target_allowed("web-frontend")[0]
+            assert not enforcer.check_target_allowed("cache")[0]
+
+    def test_vm_and_node_exact_match(self):
+        """VMs and nodes only match exactly."""
+        env = {"WINGMAN_VM_ALLOWLIST": "100,101", "WINGMAN_NODE_ALLOWLIST": "pve1"}
+        with patch.dict(os.environ, env):
+            enforcer = LabSafetyEnforcer()
+            assert enforcer.check_target_allowed("100", "vm")[0]
+            assert not enforcer.check_target_allowed("10", "vm")[0]
+            assert enforcer.check_target_allowed("pve1", "node")[0]
+            assert not enforcer.check_target_allowed("pve2", "node")[0]
+
+    def test_config_follows_environment(self):
+        """Config reflects env changes without an explicit refresh."""
+        enforcer = LabSafetyEnforcer()
+        with patch.dict(os.environ, {"WINGMAN_CONTAINER_ALLOWLIST": "alpha"}):
+            assert enforcer.check_target_allowed("alpha")[0]
+        with patch.dict(os.environ, {"WINGMAN_CONTAINER_ALLOWLIST": "beta"}):
+            assert not enforcer.check_target_allowed("alpha")[0]
+
+
+class TestSkillClassification:
+    """Test read-only and dangerous skill classifiers."""
+
+    def test_read_only_prefixes_match_at_start(self):
+        """Category prefixes only count at the start of the skill ID."""
+        enforcer = LabSafetyEnforcer()
+        assert enforcer._is_read_only_skill("diag-docker-ps")
+        assert enforcer._is_read_only_skill("inv-hosts")
+        assert not enforcer._is_read_only_skill("restart-diag-helper")
+
+    def test_read_only_verbs_match_anywhere(self):
+        """Read-only verbs match anywhere in the skill ID."""
+        enforcer = LabSafetyEnforcer()
+        assert enforcer._is_read_only_skill("docker-list-containers")
+        assert enforcer._is_read_only_skill("vm-status")
+        assert not enforcer._is_read_only_skill("restart-container")
+
+    def test_dangerous_is_case_insensitive(self):
+        """Dangerous verbs match regardless of case."""
+        enforcer = LabSafetyEnforcer()
+        assert enforcer._is_dangerous_skill("docker-prune")
+        assert enforcer._is_dangerous_skill("VM-Snapshot-Create")
+        assert not enforcer._is_dangerous_skill("restart-container")
+
+
+class TestStatusCaching:
+    """Test status reuse and invalidation."""
+
+    def test_status_reused_while_env_unchanged(self):
+        """Repeated validation returns the same status object."""
+        env = {"WINGMAN_EXECUTION_MODE": "lab", "WINGMAN_CONTAINER_ALLOWLIST": "web"}
+        with patch.dict(os.environ, env):
+            enforcer = LabSafetyEnforcer()
+            first = enforcer.validate_lab_mode()
+            assert enforcer.validate_lab_mode() is first
+            assert enforcer.get_status() is first
+
+    def test_status_rebuilt_when_env_changes(self):
+        """Changing the mode or allowlists produces a new status."""
+        enforcer = LabSafetyEnforcer()
+        with patch.dict(os.environ, {"WINGMAN_EXECUTION_MODE": "lab"}):
+            for name in ("WINGMAN_CONTAINER_ALLOWLIST", "WINGMAN_VM_ALLOWLIST", "WINGMAN_NODE_ALLOWLIST"):
+                os.environ.pop(name, None)
+            assert enforcer.validate_lab_mode().status == LabModeStatus.BLOCKED
+            os.environ["WINGMAN_CONTAINER_ALLOWLIST"] = "web"
+            assert enforcer.validate_lab_mode().status == LabModeStatus.ARMED
+            os.environ["WINGMAN_EXECUTION_MODE"] = "mock"
+            assert enforcer.validate_lab_mode().status == LabModeStatus.DISABLED
+
+    def test_operation_check_uses_status_snapshot(self):
+        """Target allowlists come from the same config as the cached status."""
+        env = {"WINGMAN_EXECUTION_MODE": "lab", "WINGMAN_CONTAINER_ALLOWLIST": "web"}
+        with patch.dict(os.environ, env):
+            enforcer = LabSafetyEnforcer()
+            enforcer.get_status()
+            os.environ["WINGMAN_CONTAINER_ALLOWLIST"] = "db"
+
+            allowed, reason = enforcer.check_operation_allowed("docker.logs", "web")
+            assert allowed, reason
+            assert not enforcer.check_target_allowed("web")[0]
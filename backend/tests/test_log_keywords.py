@@ -0,0 +1,34 @@
+"""
+Tests for error keyword matching on log lines.
+
+Verifies:
+- Matching is case-insensitive
+- A line with several keywords reports the highest-priority one
+- Non-ASCII look-alike letters never match (nor raise)
+"""
+from homelab.collectors.log_collector import match_error_keyword
+
+
+class TestMatchErrorKeyword:
+    """Test the shared error keyword matcher."""
+
+    def test_no_keyword(self):
+        """Lines without keywords return None."""
+        assert match_error_keyword("GET /health 200") is None
+
+    def test_case_insensitive(self):
+        """Keywords match regardless of case and are reported lowercase."""
+        assert match_error_keyword("FATAL: out of memory") == "fatal"
+
+    def test_priority_over_position(self):
+        """The first keyword in priority order wins, not the first in the line."""
+        assert match_error_keyword("job failed with Error 5") == "error"
+        assert match_error_keyword("panic: worker crash") == "panic"
+        assert match_error_keyword("crash after Exception") == "exception"
+
+    def test_non_ascii_case_variants_ignored(self):
+        """Letters that case-fold to ASCII under Unicode rules do not match."""
+        assert match_error_keyword("fatal craſh") == "fatal"
+        assert match_error_keyword("Kernel panıc") is None
+        assert match_error_keyword("PANIC: EXCEPTİON") == "panic"
+        assert match_error_keyword("craſh") is None
@@ -0,0 +1,145 @@
+"""
+Tests for LogSummarizer stream consolidation.
+
+Verifies:
+- A resource's summary is indexed while the next resource's rows stream in
+- Every indexed summary is committed
+- A blocked embedding commits what was already indexed and propagates
+- Any other failure, including cancellation, does the same
+"""
+import asyncio
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homelab.llm.providers import EmbeddingBlockedError
+from homelab.rag.log_summarizer import LogSummarizer
+
+
+class FakeStream:
+    """Async log row stream that records when each row is read."""
+
+    def __init__(self, rows, events):
+        self.rows = rows
+        self.events = events
+        self.close = AsyncMock()
+
+    async def __aiter__(self):
+        for row in self.rows:
+            await asyncio.sleep(0)
+            self.events.append(f"read {row.resource_ref}")
+            yield row
+
+
+def rows_for(*resource_refs):
+    """Two log rows per resource, grouped as the windowed query returns them."""
+    return [
+        SimpleNamespace(
+            resource_ref=ref,
+            timestamp=datetime(2024, 1, 1, 0, 0, i),
+            content=f"line {i}",
+            log_source="stdout",
+            total=2,
+        )
+        for ref in resource_refs
+        for i in range(2)
+    ]
+
+
+def fake_db() -> MagicMock:
+    """Session stand-in; summaries passed to add_all are kept in db.added."""
+    db = MagicMock()
+    db.added = []
+    db.add_all.side_effect = db.added.extend
+    db.commit = AsyncMock()
+    return db
+
+
+class TestSummarizeStream:
+    """Test pipelined indexing of per-resource summaries."""
+
+    @pytest.mark.asyncio
+    async def test_indexing_overlaps_next_resource_read(self):
+        """Indexing of one resource is in flight while the next is read."""
+        events = []
+
+        async def fake_index(resource_ref, **kwargs):
+            events.append(f"index {resource_ref}")
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            events.append(f"indexed {resource_ref}")
+            return True
+
+        db = fake_db()
+        stream = FakeStream(rows_for("docker://a", "docker://b"), events)
+        with patch("homelab.rag.log_summarizer.rag_indexer.index_log_summary", side_effect=fake_index), \
+                patch("homelab.rag.log_summarizer.notification_router.notify_event", AsyncMock()):
+            count = await LogSummarizer()._summarize_stream(db, stream)
+
+        assert count == 4
+        last_read_b = len(events) - 1 - events[::-1].index("read docker://b")
+        assert events.index("index docker://a") < last_read_b < events.index("indexed docker://a")
+        assert [summary.resource_ref for summary in db.added] == ["docker://a", "docker://b"]
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_blocked_commits_indexed_summaries(self):
+        """When indexing blocks, earlier summaries are committed and the error raised."""
+        async def fake_index(resource_ref, **kwargs):
+            if resource_ref == "docker://b":
+                raise EmbeddingBlockedError("blocked")
+            return True
+
+        db = fake_db()
+        stream = FakeStream(rows_for("docker://a", "docker://b", "docker://c"), [])
+        with patch("homelab.rag.log_summarizer.rag_indexer.index_log_summary", side_effect=fake_index), \
+                patch("homelab.rag.log_summarizer.notification_router.notify_event", AsyncMock()):
+            with pytest.raises(EmbeddingBlockedError):
+                await LogSummarizer()._summarize_stream(db, stream)
+
+        stream.close.assert_awaited()
+        assert [summary.resource_ref for summary in db.added] == ["docker://a"]
+
+    @pytest.mark.asyncio
+    async def test_index_error_commits_indexed_summaries(self):
+        """An unexpected indexing error still commits earlier summaries."""
+        async def fake_index(resource_ref, **kwargs):
+            if resource_ref == "docker://b":
+                raise RuntimeError("qdrant unavailable")
+            return True
+
+        db = fake_db()
+        stream = FakeStream(rows_for("docker://a", "docker://b", "docker://c"), [])
+        with patch("homelab.rag.log_summarizer.rag_indexer.index_log_summary", side_effect=fake_index), \
+                patch("homelab.rag.log_summarizer.notification_router.notify_event", AsyncMock()):
+            with pytest.raises(RuntimeError):
+                await LogSummarizer()._summarize_stream(db, stream)
+
+        stream.close.assert_awaited()
+        assert [summary.resource_ref for summary in db.added] == ["docker://a"]
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_commits_indexed_summaries(self):
+        """Cancelling mid-stream commits indexed summaries and drops the in-flight one."""
+        b_started = asyncio.Event()
+
+        async def fake_index(resource_ref, **kwargs):
+            if resource_ref == "docker://b":
+                b_started.set()
+                await asyncio.Event().wait()
+            return True
+
+        db = fake_db()
+        stream = FakeStream(rows_for("docker://a", "docker://b"), [])
+        with patch("homelab.rag.log_summarizer.rag_indexer.index_log_summary", side_effect=fake_index), \
+                patch("homelab.rag.log_summarizer.notification_router.notify_event", AsyncMock()):
+            run = asyncio.create_task(LogSummarizer()._summarize_stream(db, stream))
+            await b_started.wait()
+            run.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await run
+
+        assert [summary.resource_ref for summary in db.added] == ["docker://a"]
+        db.commit.assert_awaited_once()
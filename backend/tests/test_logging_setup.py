@@ -0,0 +1,36 @@
+"""
+Tests for queued logging setup.
+
+Verifies:
+- stop_logging() detaches the queue handler from the root logger
+- configure_logging() can run again after a stop without stacking handlers
+"""
+import logging
+from logging.handlers import QueueHandler
+
+from homelab.observability.logging import configure_logging, stop_logging
+
+
+def root_queue_handlers() -> list[QueueHandler]:
+    return [h for h in logging.getLogger().handlers if isinstance(h, QueueHandler)]
+
+
+class TestLoggingLifecycle:
+    """Test configure/stop cycles such as repeated app lifespans."""
+
+    def test_stop_detaches_and_reconfigure_restores(self):
+        """After a stop nothing queues; reconfiguring installs one handler."""
+        configure_logging()
+        stop_logging()
+        assert root_queue_handlers() == []
+
+        configure_logging()
+        configure_logging()
+        assert len(root_queue_handlers()) == 1
+
+    def test_stop_twice_is_harmless(self):
+        """A second stop is a no-op."""
+        stop_logging()
+        stop_logging()
+        assert root_queue_handlers() == []
+        configure_logging()
@@ -105,6 +105,15 @@ class TestModeHelpers:
         set_execution_mode(ExecutionMode.lab)
         assert should_execute_real() is True
 
+    def test_helpers_follow_context_override(self):
+        """A context override wins over the precomputed default checks."""
+        set_execution_mode(ExecutionMode.lab)
+        with execution_mode_context(ExecutionMode.mock):
+            assert is_mock_mode() is True
+            assert is_lab_mode() is False
+            assert should_execute_real() is False
+        assert is_lab_mode() is True
+
 
 class TestModeContextManagers:
     """Test context managers for temporary mode switching."""
@@ -179,6 +188,17 @@ class TestDependencyWiring:
         assert deps.proxmox_adapter is not None
         assert isinstance(deps.safety_policy, LabSafetyPolicy)
     
+    def test_adapters_shared_until_reset(self):
+        """Adapter instances are built once and rebuilt after a reset."""
+        from homelab.runtime.deps import reset_cached_adapters
+
+        first = get_adapters(ExecutionMode.mock)
+        second = get_adapters(ExecutionMode.mock)
+        assert second.docker_adapter is first.docker_adapter
+
+        reset_cached_adapters()
+        assert get_adapters(ExecutionMode.mock).docker_adapter is not first.docker_adapter
+
     def test_get_safety_policy_mock(self):
         """get_safety_policy should return correct policy for mock."""
         policy = get_safety_policy(ExecutionMode.mock)
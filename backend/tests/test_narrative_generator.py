@@ -0,0 +1,204 @@
+"""
+Tests for NarrativeGenerator context fetching and prompt building.
+
+Verifies:
+- The prompt is built off the loop from plain values, not ORM objects
+- Context rows are the newest per resource, capped, in resource order
+- Low-signal incidents skip the RAG search
+- Batched generation stores one narrative per incident
+"""
+import asyncio
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from homelab.rag.narrative_generator import NarrativeGenerator
+from homelab.storage.models import Fact, Incident, IncidentNarrative, IncidentSeverity, LogEntry
+
+
+DETECTED_AT = datetime(2024, 1, 1, 12, 0)
+
+
+@asynccontextmanager
+async def sqlite_session():
+    """Session on a throwaway in-memory SQLite database with incident tables."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    tables = [Incident.__table__, IncidentNarrative.__table__, Fact.__table__, LogEntry.__table__]
+    async with engine.begin() as conn:
+        await conn.run_sync(Incident.metadata.create_all, tables=tables)
+    try:
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            yield session
+    finally:
+        await engine.dispose()
+
+
+def incident(resources, symptoms, severity=IncidentSeverity.high):
+    return Incident(
+        id=str(uuid4()),
+        severity=severity,
+        affected_resources=resources,
+        symptoms=symptoms,
+        detected_at=DETECTED_AT,
+    )
+
+
+def fact(resource_ref, minutes_ago, fact_type="cpu"):
+    return Fact(
+        id=str(uuid4()),
+        resource_ref=resource_ref,
+        fact_type=fact_type,
+        value={"pct": minutes_ago},
+        timestamp=DETECTED_AT - timedelta(minutes=minutes_ago),
+        source="docker",
+    )
+
+
+def log(resource_ref, minutes_ago):
+    return LogEntry(
+        id=str(uuid4()),
+        resource_ref=resource_ref,
+        log_source="stdout",
+        content=f"line {minutes_ago}",
+        timestamp=DETECTED_AT - timedelta(minutes=minutes_ago),
+        retention_date=DETECTED_AT + timedelta(days=90),
+    )
+
+
+def no_rag():
+    """Patch the RAG searches and indexing the generator calls."""
+    return patch.multiple(
+        "homelab.rag.rag_indexer.rag_indexer",
+        search_both=AsyncMock(return_value=([], [])),
+        index_narrative=AsyncMock(),
+    )
+
+
+class TestPromptConstruction:
+    """Test the threaded prompt build."""
+
+    @pytest.mark.asyncio
+    async def test_prompt_thread_gets_plain_values(self):
+        """Only plain incident fields are handed to the worker thread."""
+        handed_over = []
+        real_to_thread = asyncio.to_thread
+
+        async def recording_to_thread(func, *args, **kwargs):
+            handed_over.extend(args)
+            handed_over.extend(kwargs.values())
+            return await real_to_thread(func, *args, **kwargs)
+
+        async with sqlite_session() as db:
+            web = incident(["docker://web"], ["OOM kill", "restart loop"])
+            db.add(web)
+            await db.commit()
+
+            with no_rag(), \
+                    patch("homelab.rag.narrative_generator.asyncio.to_thread", side_effect=recording_to_thread):
+                _, _, _, prompt = await NarrativeGenerator()._prepare(db, web.id)
+
+        assert not any(isinstance(value, Incident) for value in handed_over)
+        assert "- Severity: high\n" in prompt
+        assert "- Affected Resources: docker://web\n" in prompt
+        assert "- OOM kill\n- restart loop\n" in prompt
+
+
+class TestContextFetch:
+    """Test the per-resource ROW_NUMBER window queries on SQLite."""
+
+    @pytest.mark.asyncio
+    async def test_newest_rows_per_resource(self):
+        """Each resource contributes its newest rows up to the limit, in the order asked."""
+        async with sqlite_session() as db:
+            db.add_all(
+                [fact("docker://web", m) for m in range(7)]
+                + [fact("docker://db", m) for m in (30, 10, 20)]
+                + [fact("docker://other", 0)]
+                + [log("docker://web", m) for m in range(25)]
+                + [log("docker://db", m) for m in (5, 1)]
+            )
+            await db.commit()
+
+            facts, logs = await NarrativeGenerator()._fetch_context(db, ["docker://db", "docker://web"])
+
+        assert [(f.resource_ref, f.value["pct"]) for f in facts] == (
+            [("docker://db", m) for m in (10, 20, 30)]
+            + [("docker://web", m) for m in range(5)]
+        )
+        assert [(l.resource_ref, l.content) for l in logs] == (
+            [("docker://db", "line 1"), ("docker://db", "line 5")]
+            + [("docker://web", f"line {m}") for m in range(20)]
+        )
+
+    @pytest.mark.asyncio
+    async def test_prompt_lists_fetched_rows(self):
+        """Fetched fact and log rows are unpacked into the prompt."""
+        async with sqlite_session() as db:
+            web = incident(["docker://web"], ["OOM kill"])
+            db.add_all([web, fact("docker://web", 3, fact_type="memory"), log("docker://web", 2)])
+            await db.commit()
+
+            with no_rag():
+                _, facts, logs, prompt = await NarrativeGenerator()._prepare(db, web.id)
+
+        assert "- [2024-01-01 11:57:00] memory: {'pct': 3}\n" in prompt
+        assert "- [2024-01-01 11:58:00] stdout: line 2\n" in prompt
+        assert len(facts) == len(logs) == 1
+
+
+class TestRagGating:
+    """Test that RAG search is skipped below RAG_MIN_SIGNALS."""
+
+    @pytest.mark.asyncio
+    async def test_low_signal_incident_skips_search(self):
+        """One resource and no symptoms is below the threshold; two signals search."""
+        async with sqlite_session() as db:
+            quiet = incident(["docker://web"], [])
+            noisy = incident(["docker://web"], ["OOM kill"])
+            db.add_all([quiet, noisy])
+            await db.commit()
+
+            with no_rag():
+                from homelab.rag.rag_indexer import rag_indexer
+
+                await NarrativeGenerator()._prepare(db, quiet.id)
+                rag_indexer.search_both.assert_not_awaited()
+
+                await NarrativeGenerator()._prepare(db, noisy.id)
+                rag_indexer.search_both.assert_awaited_once()
+
+
+class TestBatchedGeneration:
+    """Test generate_narratives with one batched LLM call."""
+
+    @pytest.mark.asyncio
+    async def test_one_narrative_per_incident(self):
+        """Known incidents each get one stored narrative; a failed call records its error."""
+        async with sqlite_session() as db:
+            web = incident(["docker://web"], ["OOM kill"])
+            dbi = incident(["docker://db"], ["slow queries", "replica lag"])
+            db.add_all([web, dbi, fact("docker://web", 1), log("docker://db", 1)])
+            await db.commit()
+
+            generate_many = AsyncMock(return_value=["Web ran out of memory.", RuntimeError("ollama down")])
+            with no_rag(), \
+                    patch("homelab.rag.narrative_generator.llm_manager.generate_many", generate_many):
+                narratives = await NarrativeGenerator().generate_narratives(
+                    db, [web.id, str(uuid4()), dbi.id],
+                )
+
+            stored = (await db.execute(select(IncidentNarrative))).scalars().all()
+
+        generate_many.assert_awaited_once()
+        assert len(generate_many.await_args.args[0]) == 2
+        assert sorted(n.incident_id for n in stored) == sorted([web.id, dbi.id])
+        by_incident = {n.incident_id: n for n in narratives}
+        assert by_incident[web.id].narrative_text == "Web ran out of memory."
+        assert by_incident[web.id].evidence_refs[0].startswith("fact:")
+        assert "ollama down" in by_incident[dbi.id].narrative_text
+        assert by_incident[dbi.id].evidence_refs[0].startswith("log:")
@@ -8,6 +8,7 @@ from pathlib import Path
 from homelab.plugins.manifest_schema import TrustLevel
 from homelab.plugins.loader import (
     load_manifest,
+    load_plugin_class,
     discover_plugins,
     infer_trust_level,
     PluginLoadError,
@@ -69,6 +70,41 @@ blast_radius:
         assert manifest.blast_radius.mutates_state is True
 
 
+class TestLoadPluginClass:
+    """Test entry point loading."""
+    
+    MANIFEST = """
+id: test-plugin
+name: Test Plugin
+version: 1.0.0
+description: A test plugin
+author: Test Author
+entry_point: test_plugin:TestPlugin
+blast_radius:
+  scope: container
+  mutates_state: false
+  reversible: true
+"""
+    
+    def test_missing_entry_point_file(self, tmp_path):
+        """A missing entry point file is reported as such."""
+        (tmp_path / "manifest.yaml").write_text(self.MANIFEST)
+        
+        with pytest.raises(PluginLoadError, match="Entry point file not found"):
+            load_plugin_class(tmp_path, load_manifest(tmp_path))
+    
+    def test_import_time_file_error_is_not_misreported(self, tmp_path):
+        """A FileNotFoundError raised by plugin code keeps its own message."""
+        (tmp_path / "manifest.yaml").write_text(self.MANIFEST)
+        (tmp_path / "test_plugin.py").write_text("open('missing-data.json')\n")
+        
+        with pytest.raises(PluginLoadError, match="Failed to load module") as excinfo:
+            load_plugin_class(tmp_path, load_manifest(tmp_path))
+        
+        assert "missing-data.json" in str(excinfo.value)
+        assert "Entry point file not found" not in str(excinfo.value)
+
+
 class TestDiscoverPlugins:
     """Test plugin discovery."""
     
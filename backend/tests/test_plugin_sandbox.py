@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import platform
+import subprocess
+import sys
+import threading
+
 import pytest
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock, AsyncMock, patch
 
 from homelab.plugins.manifest_schema import TrustLevel
 from homelab.plugins import run_sandboxed
@@ -47,3 +53,288 @@ class TestTrustLevelBehavior:
         # Just verify the enum values exist
         levels = [TrustLevel.SANDBOXED, TrustLevel.VERIFIED, TrustLevel.TRUSTED]
         assert len(levels) == 3
+
+
+@pytest.mark.skipif(platform.system() != "Linux", reason="Linux sandbox only")
+class TestWorkerPool:
+    """Test the warm Linux sandbox worker pool."""
+    
+    @pytest.mark.asyncio
+    async def test_pooled_run_reuses_worker(self, tmp_path):
+        """Pooled runs return script output and reuse the same worker."""
+        from homelab.plugins import sandbox_linux
+        
+        script = tmp_path / "echo.py"
+        script.write_text(
+            "import os, sys\n"
+            "print(sys.argv[1:], os.environ.get('PLUGIN_DATA'))\n"
+            "print('oops', file=sys.stderr)\n"
+            "sys.exit(3)\n"
+        )
+        
+        await sandbox_linux.start_worker_pool(1)
+        try:
+            worker = sandbox_linux._worker_pool._idle[0]
+            result = await sandbox_linux.run_sandboxed_linux(
+                script, ["a", "b"], env={"PLUGIN_DATA": "/data", "SECRET": "x"},
+            )
+            assert result["stdout"] == "['a', 'b'] /data\n"
+            assert result["stderr"] == "oops\n"
+            assert result["returncode"] == 3
+            assert sandbox_linux._worker_pool._idle == [worker]
+        finally:
+            sandbox_linux.stop_worker_pool()
+    
+    @pytest.mark.asyncio
+    async def test_timeout_replaces_worker(self, tmp_path):
+        """A timed-out run kills its worker and a fresh one takes its place."""
+        from homelab.plugins import sandbox_linux
+        
+        script = tmp_path / "hang.py"
+        script.write_text("import time\ntime.sleep(30)\n")
+        
+        await sandbox_linux.start_worker_pool(1)
+        try:
+            worker = sandbox_linux._worker_pool._idle[0]
+            with pytest.raises(TimeoutError):
+                await sandbox_linux.run_sandboxed_linux(script, timeout=1)
+            
+            for _ in range(50):
+                if sandbox_linux._worker_pool._idle:
+                    break
+                await asyncio.sleep(0.1)
+            assert sandbox_linux._worker_pool._idle
+            assert sandbox_linux._worker_pool._idle[0] is not worker
+            assert worker.poll() is not None
+        finally:
+            sandbox_linux.stop_worker_pool()
+
+
+@pytest.mark.skipif(platform.system() != "Linux", reason="Linux sandbox only")
+class TestSpawnCancellation:
+    """Test that cancelled sandbox runs leave no orphaned children."""
+    
+    @pytest.mark.asyncio
+    async def test_running_script_does_not_hold_spawn_thread(self, tmp_path):
+        """With one spawn thread, a waiting script does not block the next spawn."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        from homelab.plugins import sandbox_linux
+        
+        flag = tmp_path / "flag"
+        waiter = tmp_path / "waiter.py"
+        waiter.write_text(
+            "import os, time\n"
+            f"while not os.path.exists({str(flag)!r}):\n"
+            "    time.sleep(0.05)\n"
+        )
+        setter = tmp_path / "setter.py"
+        setter.write_text(f"open({str(flag)!r}, 'w').close()\n")
+        
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            with patch.object(sandbox_linux, "_spawn_executor", executor):
+                waiting = asyncio.create_task(sandbox_linux.run_sandboxed_linux(waiter, timeout=10))
+                await asyncio.sleep(0.2)
+                setting = await sandbox_linux.run_sandboxed_linux(setter, timeout=10)
+                waited = await waiting
+        finally:
+            executor.shutdown()
+        
+        assert setting["returncode"] == 0
+        assert waited["returncode"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_cancel_during_spawn_discards_child(self):
+        """A child whose Popen finishes after cancellation is discarded."""
+        from homelab.plugins import sandbox_linux
+        
+        release = threading.Event()
+        discarded = asyncio.Event()
+        proc = MagicMock()
+        
+        def slow_spawn():
+            release.wait(5)
+            return proc
+        
+        loop = asyncio.get_running_loop()
+        spawn = asyncio.create_task(
+            sandbox_linux._spawn_in_executor(slow_spawn, lambda p: loop.call_soon_threadsafe(discarded.set))
+        )
+        await asyncio.sleep(0.05)
+        spawn.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await spawn
+        
+        release.set()
+        await asyncio.wait_for(discarded.wait(), 5)
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_run_kills_and_reaps_child(self, tmp_path):
+        """Cancelling a one-shot run kills the script and waits for it."""
+        from homelab.plugins import sandbox_linux
+        
+        script = tmp_path / "hang.py"
+        script.write_text("import time\ntime.sleep(30)\n")
+        spawned = []
+        real_popen = subprocess.Popen
+        
+        def recording_popen(*args, **kwargs):
+            spawned.append(real_popen(*args, **kwargs))
+            return spawned[-1]
+        
+        with patch.object(sandbox_linux.subprocess, "Popen", side_effect=recording_popen):
+            run = asyncio.create_task(sandbox_linux.run_sandboxed_linux(script, timeout=30))
+            for _ in range(50):
+                if spawned:
+                    break
+                await asyncio.sleep(0.1)
+            await asyncio.sleep(0.1)
+            run.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await run
+        
+        assert spawned[0].returncode is not None
+
+
+class TestStreaming:
+    """Test stream_callback delivery and timeouts on both backends."""
+    
+    STREAM_SCRIPT = "print('first', flush=True)\nprint('second', flush=True)\n"
+    HANG_SCRIPT = "import time\nprint('started', flush=True)\ntime.sleep(30)\n"
+    
+    @staticmethod
+    def _exec_recorder(script, spawned):
+        """create_subprocess_exec that runs script directly and records the process.
+        
+        Only the fallback's pipe handling is under test here, so the restricted
+        import wrapper (and the "python" lookup without PATH) is bypassed.
+        """
+        real_exec = asyncio.create_subprocess_exec
+        
+        async def recording_exec(*args, **kwargs):
+            spawned.append(await real_exec(sys.executable, str(script), **kwargs))
+            return spawned[-1]
+        
+        return recording_exec
+    
+    @pytest.mark.skipif(platform.system() != "Linux", reason="Linux sandbox only")
+    @pytest.mark.asyncio
+    async def test_linux_streams_chunks(self, tmp_path):
+        """Chunks reach the callback and the result buffers nothing."""
+        from homelab.plugins import sandbox_linux
+        
+        script = tmp_path / "stream.py"
+        script.write_text(self.STREAM_SCRIPT)
+        chunks = []
+        
+        result = await sandbox_linux.run_sandboxed_linux(script, stream_callback=chunks.append)
+        await asyncio.sleep(0)
+        
+        assert b"".join(chunks) == b"first\nsecond\n"
+        assert result["stdout"] == "" and result["returncode"] == 0
+    
+    @pytest.mark.skipif(platform.system() != "Linux", reason="Linux sandbox only")
+    @pytest.mark.asyncio
+    async def test_linux_stream_timeout_kills_child(self, tmp_path):
+        """A streaming run past its timeout kills the script."""
+        from homelab.plugins import sandbox_linux
+        
+        script = tmp_path / "hang.py"
+        script.write_text(self.HANG_SCRIPT)
+        chunks = []
+        spawned = []
+        real_popen = subprocess.Popen
+        
+        def recording_popen(*args, **kwargs):
+            spawned.append(real_popen(*args, **kwargs))
+            return spawned[-1]
+        
+        with patch.object(sandbox_linux.subprocess, "Popen", side_effect=recording_popen):
+            with pytest.raises(TimeoutError):
+                await sandbox_linux.run_sandboxed_linux(script, timeout=1, stream_callback=chunks.append)
+        await asyncio.sleep(0)
+        
+        assert b"".join(chunks) == b"started\n"
+        assert spawned[0].returncode is not None
+    
+    @pytest.mark.asyncio
+    async def test_fallback_streams_chunks(self, tmp_path):
+        """The fallback backend forwards chunks the same way."""
+        from homelab.plugins import sandbox_fallback
+        
+        script = tmp_path / "stream.py"
+        script.write_text(self.STREAM_SCRIPT)
+        chunks = []
+        
+        with patch.object(sandbox_fallback.asyncio, "create_subprocess_exec", side_effect=self._exec_recorder(script, [])):
+            result = await sandbox_fallback.run_sandboxed_fallback(script, stream_callback=chunks.append)
+        
+        assert b"".join(chunks) == b"first\nsecond\n"
+        assert result["stdout"] == "" and result["returncode"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_fallback_stream_timeout_kills_child(self, tmp_path):
+        """A streaming fallback run past its timeout kills the script."""
+        from homelab.plugins import sandbox_fallback
+        
+        script = tmp_path / "hang.py"
+        script.write_text(self.HANG_SCRIPT)
+        chunks = []
+        spawned = []
+        
+        with patch.object(sandbox_fallback.asyncio, "create_subprocess_exec", side_effect=self._exec_recorder(script, spawned)):
+            with pytest.raises(TimeoutError):
+                await sandbox_fallback.run_sandboxed_fallback(script, timeout=1, stream_callback=chunks.append)
+        
+        assert b"".join(chunks) == b"started\n"
+        assert spawned[0].returncode is not None
+
+
+class TestPolicyFd:
+    """Test the one-time seccomp policy memfd setup."""
+    
+    def test_created_once_across_event_loops(self):
+        """Concurrent first calls on separate loops share one policy memfd."""
+        from homelab.plugins import sandbox_linux
+        
+        async def fetch_many():
+            return await asyncio.gather(*(sandbox_linux._get_policy_fd() for _ in range(3)))
+        
+        with patch.object(sandbox_linux, "_policy_fd", None), \
+                patch.object(sandbox_linux, "_policy_format", "bpf"), \
+                patch.object(sandbox_linux, "_create_policy_memfd", return_value=(99, "json")) as create:
+            first = asyncio.run(fetch_many())
+            sandbox_linux._policy_fd = None
+            second = asyncio.run(fetch_many())
+        
+        assert first == second == [(99, "json")] * 3
+        assert create.call_count == 2
+
+
+class TestSeccompProbe:
+    """Test the in-process libseccomp availability probe."""
+    
+    def test_probe_does_not_spawn(self):
+        """The probe never starts a helper process."""
+        from homelab.plugins import sandbox_linux
+        
+        sandbox_linux.is_seccomp_available.cache_clear()
+        try:
+            with patch("subprocess.Popen", side_effect=AssertionError("spawned")):
+                assert isinstance(sandbox_linux.is_seccomp_available(), bool)
+        finally:
+            sandbox_linux.is_seccomp_available.cache_clear()
+    
+    def test_probe_false_off_linux(self):
+        """Non-Linux platforms report unavailable without touching ctypes."""
+        from homelab.plugins import sandbox_linux
+        
+        sandbox_linux.is_seccomp_available.cache_clear()
+        try:
+            with patch.object(sandbox_linux.sys, "platform", "darwin"), \
+                    patch.object(sandbox_linux.ctypes, "CDLL") as cdll:
+                assert sandbox_linux.is_seccomp_available() is False
+                cdll.assert_not_called()
+        finally:
+            sandbox_linux.is_seccomp_available.cache_clear()
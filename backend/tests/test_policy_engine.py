@@ -0,0 +1,250 @@
+"""
+Tests for PolicyEngine plan validation.
+
+Verifies:
+- Rate-limit counts for a whole plan come from a single query
+- Duplicate targets and rate-limited pairs are reported
+- The capped count query runs on a real (SQLite) database
+"""
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from homelab.control_plane.plan_proposal import PlanProposal, PlanStep
+from homelab.policy.policy_engine import PolicyEngine, ResourceDenylist, MAX_ACTIONS_PER_HOUR
+from homelab.policy.rate_limiter import action_rate_limiter
+from homelab.storage.models import ActionHistory, ActionTemplate
+
+
+def make_plan(*steps: tuple[ActionTemplate, str]) -> PlanProposal:
+    return PlanProposal(
+        id="plan-1",
+        incident_id=None,
+        title="Test plan",
+        description="",
+        steps=[
+            PlanStep(order=i, action=action, target=target)
+            for i, (action, target) in enumerate(steps, start=1)
+        ],
+        created_at=datetime.now(),
+    )
+
+
+def make_db(rows: list[tuple]) -> AsyncMock:
+    result = MagicMock()
+    result.all.return_value = rows
+    db = AsyncMock()
+    db.execute.return_value = result
+    return db
+
+
+@asynccontextmanager
+async def sqlite_session():
+    """Session on a throwaway in-memory SQLite database with action_history."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(ActionHistory.metadata.create_all, tables=[ActionHistory.__table__])
+    try:
+        async with async_sessionmaker(engine)() as session:
+            yield session
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def no_redis():
+    """Force the SQL fallback path, with an empty in-process count cache."""
+    with patch(
+        "homelab.policy.policy_engine.action_rate_limiter.count_recent",
+        AsyncMock(return_value=None),
+    ), patch.object(action_rate_limiter, "_local_counts", {}):
+        yield
+
+
+class TestRateLimitBatching:
+    """Test that plan validation counts recent actions in one round-trip."""
+
+    @pytest.mark.asyncio
+    async def test_single_query_for_all_steps(self):
+        """Validation issues one grouped query regardless of step count."""
+        db = make_db([])
+        plan = make_plan(
+            (ActionTemplate.restart_resource, "docker://web"),
+            (ActionTemplate.restart_resource, "docker://db"),
+            (ActionTemplate.collect_diagnostics, "docker://cache"),
+        )
+
+        is_valid, violations = await PolicyEngine().validate(db, plan)
+
+        assert is_valid, violations
+        assert db.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_pair_reported(self):
+        """Only pairs at the hourly limit are flagged."""
+        db = make_db([
+            ("docker://web", ActionTemplate.restart_resource, MAX_ACTIONS_PER_HOUR),
+            ("docker://db", ActionTemplate.restart_resource, 1),
+        ])
+        plan = make_plan(
+            (ActionTemplate.restart_resource, "docker://web"),
+            (ActionTemplate.restart_resource, "docker://db"),
+        )
+
+        is_valid, violations = await PolicyEngine().validate(db, plan)
+
+        assert not is_valid
+        assert violations == [
+            f"Rate limit exceeded for docker://web ({MAX_ACTIONS_PER_HOUR}+ actions in last hour)"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_invalid_steps_skip_rate_limit_query(self):
+        """Steps failing the synchronous checks never reach the database."""
+        db = make_db([])
+        plan = make_plan(
+            (ActionTemplate.restart_resource, "ssh://web"),
+            (ActionTemplate.restart_resource, "docker://storage-controller"),
+        )
+
+        is_valid, violations = await PolicyEngine().validate(db, plan)
+
+        assert not is_valid
+        assert len(violations) == 2
+        db.execute.assert_not_awaited()
+
+
+class TestCountRecentActionsSQL:
+    """Test the capped union_all count query against SQLite."""
+
+    @pytest.mark.asyncio
+    async def test_counts_capped_per_pair(self):
+        """Each pair counts rows since the cutoff, capped at the hourly limit."""
+        now = datetime(2024, 1, 1, 12, 0)
+        since = now - timedelta(hours=1)
+        restart, diagnose = ActionTemplate.restart_resource, ActionTemplate.collect_diagnostics
+
+        def history(action, target, minutes_ago):
+            return ActionHistory(
+                action_template=action,
+                target_resource=target,
+                executed_at=now - timedelta(minutes=minutes_ago),
+            )
+
+        async with sqlite_session() as db:
+            db.add_all(
+                [history(restart, "docker://web", m) for m in range(MAX_ACTIONS_PER_HOUR + 3)]
+                + [history(diagnose, "docker://web", 5)]
+                + [history(restart, "docker://db", m) for m in (10, 20, 90, 120)]
+            )
+            await db.commit()
+
+            counts = await PolicyEngine()._count_recent_actions(
+                db,
+                [
+                    ("docker://web", restart),
+                    ("docker://web", diagnose),
+                    ("docker://db", restart),
+                    ("docker://cache", restart),
+                ],
+                since,
+            )
+
+        assert counts == {
+            ("docker://web", restart): MAX_ACTIONS_PER_HOUR,
+            ("docker://web", diagnose): 1,
+            ("docker://db", restart): 2,
+        }
+
+
+class TestRateLimitCache:
+    """Test the short-lived in-process rate-limit count cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_check_served_from_cache(self):
+        """A second check for the same pair within the TTL skips the query."""
+        engine = PolicyEngine()
+        db = make_db([("docker://web", ActionTemplate.restart_resource, 1)])
+
+        await engine._check_rate_limit(db, "docker://web", ActionTemplate.restart_resource)
+        await engine._check_rate_limit(db, "docker://web", ActionTemplate.restart_resource)
+
+        assert db.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_record_invalidates_cached_count(self):
+        """Recording an action forces the next check to query again."""
+        engine = PolicyEngine()
+        db = make_db([])
+
+        await engine._check_rate_limit(db, "docker://web", ActionTemplate.restart_resource)
+        with patch.object(action_rate_limiter, "_get_client", return_value=None):
+            await action_rate_limiter.record("docker://web", ActionTemplate.restart_resource)
+        await engine._check_rate_limit(db, "docker://web", ActionTemplate.restart_resource)
+
+        assert db.execute.await_count == 2
+
+
+class TestDuplicateTargets:
+    """Test duplicate-target detection."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_target_named(self):
+        """The violation names the target that appears more than once."""
+        db = make_db([])
+        plan = make_plan(
+            (ActionTemplate.collect_diagnostics, "docker://web"),
+            (ActionTemplate.restart_resource, "docker://web"),
+            (ActionTemplate.restart_resource, "docker://db"),
+        )
+
+        is_valid, violations = await PolicyEngine().validate(db, plan)
+
+        assert not is_valid
+        assert violations == ["Duplicate target 'docker://web' (potential conflict)"]
+
+
+class TestPolicyReload:
+    """Test settings-derived policy lists."""
+
+    @pytest.mark.asyncio
+    async def test_reload_picks_up_denied_resources(self):
+        """Extra denylist entries from settings apply after reload()."""
+        engine = PolicyEngine()
+        db = make_db([])
+
+        with patch(
+            "homelab.policy.policy_engine.get_settings",
+            return_value=MagicMock(policy_denied_resources="docker://vault, docker://ldap"),
+        ):
+            engine.reload()
+            is_valid, violations = await engine.validate_skill_execution(
+                db, "rem-restart-container", "docker://vault"
+            )
+        engine.reload()
+
+        assert not is_valid
+        assert "Target 'docker://vault' is in the DENYLIST - skill execution blocked" in violations
+
+
+class TestResourceDenylist:
+    """Test exact and wildcard-prefix denylist matching."""
+
+    def test_exact_and_prefix_entries(self):
+        """Exact entries match only themselves; 'prefix*' matches by prefix."""
+        denylist = ResourceDenylist(["docker://vault", "proxmox://pve/lxc/*", "docker://storage-*"])
+
+        assert "docker://vault" in denylist
+        assert "docker://vault-2" not in denylist
+        assert "proxmox://pve/lxc/100" in denylist
+        assert "proxmox://pve/lxc/" in denylist
+        assert "proxmox://pve/qemu/100" not in denylist
+        assert "docker://storage-controller" in denylist
+        assert "docker://web" not in denylist
+
+    def test_bare_wildcard_denies_everything(self):
+        """A lone '*' entry denies every target."""
+        assert "docker://web" in ResourceDenylist(["*"])
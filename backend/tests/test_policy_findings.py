@@ -0,0 +1,142 @@
+"""
+Tests for the policy findings schema.
+
+Verifies:
+- Constant findings are shared, immutable singletons
+- Findings and decisions are slotted
+- Decisions classify findings by level, including ones added later
+- Timestamps are formatted at most once per millisecond
+- Helpers share constant rule text across findings
+- Serialized findings are plain, JSON-ready dicts
+"""
+import json
+import pytest
+from dataclasses import FrozenInstanceError
+from unittest.mock import patch
+
+from homelab.runtime import policy_findings
+from homelab.runtime.safety import IntegrationSafetyPolicy, MockSafetyPolicy
+from homelab.runtime.policy_findings import (
+    PolicyDecision,
+    PolicyFinding,
+    PolicyFindingCode,
+    integration_label_missing,
+    integration_prune_blocked,
+    integration_proxmox_blocked,
+    lab_allowlist_miss,
+    mock_mode_finding,
+)
+
+
+class TestConstantFindings:
+    """Test the zero-argument finding helpers."""
+
+    def test_helpers_return_shared_instance(self):
+        """Each call returns the same finding object."""
+        assert mock_mode_finding() is mock_mode_finding()
+        assert integration_proxmox_blocked() is integration_proxmox_blocked()
+        assert integration_prune_blocked() is integration_prune_blocked()
+
+    def test_shared_finding_cannot_be_mutated(self):
+        """Neither the finding nor its details can be changed in place."""
+        finding = integration_prune_blocked()
+
+        with pytest.raises(FrozenInstanceError):
+            finding.message = "changed"
+        with pytest.raises(TypeError):
+            finding.details["env_var"] = "changed"
+
+    def test_with_timestamp_copies(self):
+        """with_timestamp returns a new finding with the same content."""
+        finding = mock_mode_finding()
+        stamped = finding.with_timestamp()
+
+        assert stamped is not finding
+        assert (stamped.code, stamped.message, stamped.rule) == (finding.code, finding.message, finding.rule)
+
+    def test_safety_decisions_stamp_shared_findings(self):
+        """Decisions record shared findings with the time of the check."""
+        with patch.object(policy_findings, "_now_iso", return_value="checked-now"):
+            mock = MockSafetyPolicy().get_policy_decision("docker.restart", "docker", "web", {})
+            proxmox = IntegrationSafetyPolicy().get_policy_decision("proxmox.start", "proxmox", "101", {})
+
+        assert mock.findings[0].code == mock_mode_finding().code
+        assert mock.to_dict()["findings"][0]["timestamp"] == "checked-now"
+        assert proxmox.findings[0].code == integration_proxmox_blocked().code
+        assert proxmox.findings[0].timestamp == "checked-now"
+
+    def test_instances_use_slots(self):
+        """Findings and decisions carry no per-instance __dict__."""
+        decision = PolicyDecision.allow(mode="mock", findings=[mock_mode_finding()])
+
+        assert not hasattr(mock_mode_finding(), "__dict__")
+        assert not hasattr(decision, "__dict__")
+
+    def test_decision_serializes_to_json(self):
+        """Decisions holding shared findings serialize with plain dict details."""
+        decision = PolicyDecision.deny(mode="integration", findings=[integration_prune_blocked()])
+        data = decision.to_dict()
+
+        assert data["findings"][0]["details"] == {"env_var": "INTEGRATION_ALLOW_PRUNE"}
+        assert '"level": "block", "code": "INTEGRATION_PRUNE_BLOCKED"' in json.dumps(data)
+        assert json.loads(json.dumps(data))["primary_reason"] == integration_prune_blocked().message
+        assert PolicyFinding.from_dict(data["findings"][0]).code == integration_prune_blocked().code
+
+
+class TestDecisionClassification:
+    """Test level buckets on PolicyDecision."""
+
+    def test_findings_bucketed_by_level(self):
+        """Level queries and primary_reason follow the findings given."""
+        warn = PolicyFinding.warn(code=PolicyFindingCode.SKILL_REQUIRES_APPROVAL, message="needs approval")
+        decision = PolicyDecision.allow(mode="lab", findings=[mock_mode_finding(), warn])
+
+        assert decision.has_warnings and not decision.has_blocks
+        assert decision.warning_findings == [warn]
+        assert decision.info_findings == [mock_mode_finding()]
+        assert decision.primary_reason == "Allowed with 1 warning(s)"
+
+    def test_add_finding_updates_buckets(self):
+        """Findings added after construction are classified too."""
+        decision = PolicyDecision.allow(mode="integration")
+        decision.add_finding(integration_proxmox_blocked())
+
+        assert decision.findings == [integration_proxmox_blocked()]
+        assert decision.has_blocks
+        assert decision.to_dict()["primary_reason"] == integration_proxmox_blocked().message
+
+
+class TestTimestamps:
+    """Test the per-millisecond timestamp cache."""
+
+    def test_same_millisecond_shares_timestamp(self):
+        """Findings made within one millisecond reuse the formatted time."""
+        with patch.object(policy_findings.time, "monotonic_ns", return_value=5_000_000_000):
+            first = PolicyFinding.warn(code=PolicyFindingCode.PARAMETER_INVALID, message="a")
+            second = PolicyFinding.warn(code=PolicyFindingCode.PARAMETER_INVALID, message="b")
+            decision = PolicyDecision.deny(mode="lab", findings=[first, second])
+
+        assert first.timestamp is second.timestamp is decision.checked_at
+
+    def test_next_millisecond_refreshes_timestamp(self):
+        """A later millisecond formats the current time again."""
+        with patch.object(policy_findings.time, "monotonic_ns", side_effect=[7_000_000_000, 7_001_000_000]), \
+                patch.object(policy_findings, "datetime") as fake_datetime:
+            fake_datetime.now.return_value.isoformat.side_effect = ["t1", "t2"]
+            stamps = [mock_mode_finding().with_timestamp().timestamp for _ in range(2)]
+
+        assert stamps == ["t1", "t2"]
+
+
+class TestSharedRules:
+    """Test rule text sharing across helper findings."""
+
+    def test_constant_rule_shared_across_targets(self):
+        """Findings for different targets reuse one constant rule string."""
+        first = integration_label_missing("web")
+        second = integration_label_missing("db")
+        assert first.rule is second.rule
+        assert first.message == "Container 'web' missing wingman.test=true label"
+
+        miss = lab_allowlist_miss("vm", "101", "LAB_VM_ALLOWLIST")
+        assert miss.rule == "Add '101' to LAB_VM_ALLOWLIST to allow access"
@@ -0,0 +1,172 @@
+"""Tests for the Redis-backed action rate limiter."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from homelab.policy.policy_engine import PolicyEngine
+from homelab.policy.rate_limiter import ActionRateLimiter
+from homelab.storage.models import ActionTemplate
+
+
+class _FakePipeline:
+    """Minimal stand-in for a redis.asyncio pipeline."""
+
+    def __init__(self, store: dict[str, dict[str, int]], strings: dict[str, int]):
+        self.store = store
+        self.strings = strings
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def zremrangebyscore(self, key, low, high):
+        self.ops.append(("zrem", key, low, high))
+
+    def zcard(self, key):
+        self.ops.append(("zcard", key))
+
+    def zadd(self, key, mapping):
+        self.ops.append(("zadd", key, mapping))
+
+    def expire(self, key, seconds):
+        self.ops.append(("expire", key))
+
+    def get(self, key):
+        self.ops.append(("get", key))
+
+    def set(self, key, value, nx=False, ex=None):
+        self.ops.append(("set", key, value, nx))
+
+    async def execute(self):
+        results = []
+        for op in self.ops:
+            if op[0] == "get":
+                results.append(self.strings.get(op[1]))
+                continue
+            if op[0] == "set":
+                if not (op[3] and op[1] in self.strings):
+                    self.strings[op[1]] = op[2]
+                results.append(True)
+                continue
+            zset = self.store.setdefault(op[1], {})
+            if op[0] == "zrem":
+                stale = [m for m, score in zset.items() if op[2] <= score <= op[3]]
+                for member in stale:
+                    del zset[member]
+                results.append(len(stale))
+            elif op[0] == "zcard":
+                results.append(len(zset))
+            elif op[0] == "zadd":
+                zset.update(op[2])
+                results.append(len(op[2]))
+            else:
+                results.append(True)
+        return results
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store: dict[str, dict[str, int]] = {}
+        self.strings: dict[str, int] = {}
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self.store, self.strings)
+
+    def track_since(self, *keys: str, ms: int = 0) -> None:
+        """Mark pairs as tracked since `ms` (default: long before the window)."""
+        for key in keys:
+            self.strings[f"rl:since:{key}"] = ms
+
+
+@pytest.mark.asyncio
+async def test_count_recent_without_redis_returns_none():
+    """Without a Redis URL the limiter defers to the SQL path."""
+    limiter = ActionRateLimiter()
+    limiter._unavailable = True
+
+    assert await limiter.count_recent([("docker://web", ActionTemplate.restart_resource)]) is None
+
+
+@pytest.mark.asyncio
+async def test_record_and_count_sliding_window():
+    """Recorded actions are counted per (target, action) pair."""
+    limiter = ActionRateLimiter()
+    fake = _FakeRedis()
+    fake.track_since("docker://web:restart_resource", "docker://web:stop_resource", "docker://db:stop_resource")
+    limiter._client = fake
+
+    await limiter.record("docker://web", ActionTemplate.restart_resource)
+    await limiter.record("docker://web", ActionTemplate.restart_resource)
+    await limiter.record("docker://db", ActionTemplate.stop_resource)
+
+    counts = await limiter.count_recent([
+        ("docker://web", ActionTemplate.restart_resource),
+        ("docker://web", ActionTemplate.stop_resource),
+        ("docker://db", ActionTemplate.stop_resource),
+    ])
+
+    assert counts == {
+        ("docker://web", ActionTemplate.restart_resource): 2,
+        ("docker://web", ActionTemplate.stop_resource): 0,
+        ("docker://db", ActionTemplate.stop_resource): 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_count_recent_drops_expired_entries():
+    """Entries older than the window are trimmed before counting."""
+    limiter = ActionRateLimiter()
+    fake = _FakeRedis()
+    fake.store["rl:docker://web:restart_resource"] = {"old": 0}
+    fake.track_since("docker://web:restart_resource")
+    limiter._client = fake
+
+    counts = await limiter.count_recent([("docker://web", ActionTemplate.restart_resource)])
+
+    assert counts == {("docker://web", ActionTemplate.restart_resource): 0}
+
+
+@pytest.mark.asyncio
+async def test_pairs_without_full_window_left_to_sql():
+    """Absent or recently started sets are not reported as counts."""
+    limiter = ActionRateLimiter()
+    fake = _FakeRedis()
+    limiter._client = fake
+
+    # First record after Redis came up: tracking starts now
+    await limiter.record("docker://web", ActionTemplate.restart_resource)
+
+    counts = await limiter.count_recent([
+        ("docker://web", ActionTemplate.restart_resource),
+        ("docker://db", ActionTemplate.stop_resource),
+    ])
+
+    assert counts == {}
+    assert "rl:since:docker://web:restart_resource" in fake.strings
+
+
+@pytest.mark.asyncio
+async def test_recent_counts_fall_back_to_sql_for_cold_pairs():
+    """The policy engine counts cold pairs from ActionHistory."""
+    limiter = ActionRateLimiter()
+    fake = _FakeRedis()
+    fake.track_since("docker://web:restart_resource")
+    limiter._client = fake
+    await limiter.record("docker://web", ActionTemplate.restart_resource)
+
+    warm = ("docker://web", ActionTemplate.restart_resource)
+    cold = ("docker://db", ActionTemplate.stop_resource)
+    engine = PolicyEngine()
+    sql_counts = AsyncMock(return_value={cold: 4})
+    with patch("homelab.policy.policy_engine.action_rate_limiter", limiter), \
+            patch.object(engine, "_count_recent_actions", sql_counts):
+        counts = await engine._recent_counts(None, [warm, cold])
+
+    assert counts == {warm: 1, cold: 4}
+    assert sql_counts.await_args.args[1] == [cold]
@@ -0,0 +1,27 @@
+"""
+Tests for Situation report formatting.
+
+Verifies:
+- Fact and log lines keep their report format
+- Log content is cut at 200 characters
+"""
+from datetime import datetime
+from types import SimpleNamespace
+
+from homelab.control_plane.situation_builder import Situation
+
+
+class TestSituationSummary:
+    """Test the text handed to the planner."""
+
+    def test_lines_formatted_and_content_truncated(self):
+        """Each fact and log gets one line; long log content is truncated."""
+        ts = datetime(2024, 1, 2, 3, 4, 5)
+        fact = SimpleNamespace(timestamp=ts, fact_type="cpu_usage", value={"percent": 97})
+        log = SimpleNamespace(timestamp=ts, log_source="stderr", content="x" * 300)
+
+        summary = Situation("docker://web", [fact], [log]).to_summary()
+
+        assert summary.startswith("Situation Report for docker://web\n" + "=" * 40 + "\n")
+        assert "- [2024-01-02T03:04:05] cpu_usage: {'percent': 97}\n" in summary
+        assert summary.endswith(f"- [2024-01-02T03:04:05] stderr: {'x' * 200}\n")
@@ -0,0 +1,144 @@
+"""
+Tests for SummaryGenerator month backfills and rollups.
+
+Verifies:
+- Every day of the month is summarized, in date order
+- Concurrency is bounded by ollama_num_parallel
+- A failing day does not abort the rest of the month
+- Rollup highlights are cut at ROLLUP_CHARS
+- Daily source/keyword aggregation and sample trimming run on SQLite
+"""
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from homelab.rag.summary_generator import ROLLUP_CHARS, SAMPLE_CHARS, SummaryGenerator
+from homelab.storage.models import LogEntry
+
+
+def session_maker() -> MagicMock:
+    """async_session_maker stand-in yielding a fresh mock session per call."""
+    maker = MagicMock()
+    maker.return_value.__aenter__.return_value = MagicMock()
+    return maker
+
+
+class TestBackfillMonth:
+    """Test concurrent daily summary generation for a month."""
+
+    @pytest.mark.asyncio
+    async def test_all_days_bounded_concurrency(self):
+        """All days run, results keep date order, and in-flight days stay capped."""
+        generator = SummaryGenerator()
+        in_flight = 0
+        peak = 0
+
+        async def fake_daily(db, resource_ref, date):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return date.strftime("%Y-%m-%d")
+
+        with patch("homelab.rag.summary_generator.async_session_maker", session_maker()), \
+                patch("homelab.rag.summary_generator.get_settings",
+                      return_value=MagicMock(ollama_num_parallel=3)), \
+                patch.object(generator, "generate_daily_summary", side_effect=fake_daily):
+            results = await generator.backfill_month("docker://web", 2024, 2)
+
+        assert results == [f"2024-02-{day:02d}" for day in range(1, 30)]
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_day_returned_not_raised(self):
+        """An exception for one day is returned in its slot."""
+        generator = SummaryGenerator()
+        error = RuntimeError("ollama down")
+
+        async def fake_daily(db, resource_ref, date):
+            if date.day == 2:
+                raise error
+            return None
+
+        with patch("homelab.rag.summary_generator.async_session_maker", session_maker()), \
+                patch.object(generator, "generate_daily_summary", side_effect=fake_daily):
+            results = await generator.backfill_month("docker://web", 2024, 4)
+
+        assert len(results) == 30
+        assert results[1] is error
+        assert results[0] is None
+
+
+class TestMonthlyRollup:
+    """Test the bounded join of daily highlights."""
+
+    @pytest.mark.asyncio
+    async def test_highlights_truncated_at_limit(self):
+        """Highlights stop at ROLLUP_CHARS, matching a full join then slice."""
+        summaries = [
+            {"time_range": {"start": f"2024-01-{day:02d}"}, "text": "x" * 500}
+            for day in range(1, 32)
+        ]
+        full = "\n\n---\n\n".join(
+            f"**{s['time_range']['start']}**\n{s['text']}" for s in summaries
+        )
+
+        with patch(
+            "homelab.rag.summary_generator.rag_indexer.search_summaries",
+            AsyncMock(return_value=summaries),
+        ):
+            rollup = await SummaryGenerator().generate_monthly_rollup(None, "docker://web", 2024, 1)
+
+        assert full[:ROLLUP_CHARS] + "\n... (truncated)\n" in rollup
+
+
+class TestDailySummarySQL:
+    """Test the daily summary queries against an in-memory SQLite database."""
+
+    @pytest.mark.asyncio
+    async def test_counts_and_samples_from_database(self):
+        """Sources and keywords are counted per day; samples are trimmed and cut."""
+        day = datetime(2024, 1, 1)
+
+        def entry(content, source="stdout", resource_ref="docker://web", minutes=0):
+            return LogEntry(
+                resource_ref=resource_ref,
+                log_source=source,
+                content=content,
+                timestamp=day + timedelta(minutes=minutes),
+                retention_date=day + timedelta(days=90),
+            )
+
+        engine = create_async_engine("sqlite+aiosqlite://")
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(LogEntry.metadata.create_all, tables=[LogEntry.__table__])
+            async with async_sessionmaker(engine)() as db:
+                db.add_all([
+                    entry("  Request ERROR in handler\t\n", minutes=1),
+                    entry("Exception: retry Failed", minutes=2),
+                    entry(" \r\n", source="stderr", minutes=3),
+                    entry("x" * (SAMPLE_CHARS + 50), source="stderr", minutes=4),
+                    entry("fatal error elsewhere", resource_ref="docker://db", minutes=5),
+                    entry("panic tomorrow", minutes=24 * 60 + 1),
+                ])
+                await db.commit()
+
+                with patch(
+                    "homelab.rag.summary_generator.rag_indexer.index_log_summary", AsyncMock(),
+                ) as index:
+                    summary = await SummaryGenerator().generate_daily_summary(db, "docker://web", day)
+        finally:
+            await engine.dispose()
+
+        assert "- Total entries: 4\n" in summary
+        assert "stdout: 2" in summary and "stderr: 2" in summary
+        assert "- Error keywords: error: 1, exception: 1\n" in summary
+        assert "- [2024-01-01T00:01:00] Request ERROR in handler\n" in summary
+        assert f"- [2024-01-01T00:04:00] {'x' * SAMPLE_CHARS}\n" in summary
+        assert "[2024-01-01T00:03:00]" not in summary
+        assert index.await_args.kwargs["metadata"]["log_count"] == 4
@@ -26,7 +26,7 @@ def _assert_embedding_blocked_exception(exc: HTTPException) -> None:
 async def test_search_rag_returns_503_when_blocked(monkeypatch):
     monkeypatch.setattr(
         rag_api.rag_indexer,
-        "search_narratives",
+        "search_both",
         AsyncMock(side_effect=EmbeddingBlockedError("Inconsistent state")),
     )
     monkeypatch.setattr(